@@ -17,8 +17,9 @@ We can later wrap this with a "brains" module that calls fizban-dev.
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Literal, Optional
+from typing import Dict, FrozenSet, List, Literal, Optional
 
 
 LawAxis = Literal["lawful", "neutral", "chaotic"]
@@ -38,7 +39,7 @@ TrustStrategy = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Alignment:
     law_axis: LawAxis = "neutral"
     moral_axis: MoralAxis = "neutral"
@@ -48,13 +49,13 @@ class Alignment:
         return f"{self.law_axis}_{self.moral_axis}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Complacence:
     mode: Literal["neutral", "awe", "boredom"] = "neutral"
     level: float = 0.0  # 0..1
 
 
-@dataclass
+@dataclass(slots=True)
 class EmotionState:
     valence: float = 0.0    # -1..1 (sad/angry -> happy/joyful)
     arousal: float = 0.0    # 0..1  (calm -> excited)
@@ -64,13 +65,13 @@ class EmotionState:
     weird_mode: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Boon:
     name: str
     rank: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TitaniasGrace:
     class_name: str = "commoner"  # 'class' is reserved word in Python
     job: str = "villager"
@@ -84,7 +85,7 @@ class TitaniasGrace:
         self.boons.append(Boon(name=name, rank=rank))
 
 
-@dataclass
+@dataclass(slots=True)
 class BounceBack:
     resilience: float = 0.5    # 0..1: higher = recovers faster
     resentment: float = 0.0    # 0..1: higher = holds grudges
@@ -102,14 +103,14 @@ RelationshipTier = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipState:
     tier: RelationshipTier = "stranger"
     affinity: float = 0.0   # -1..1 (hate -> like/love)
     romantic: bool = False  # romantic flag; lover vs just ally
 
 
-@dataclass
+@dataclass(slots=True)
 class Inventory:
     gold: int = 0
     items: List[str] = field(default_factory=list)
@@ -139,15 +140,33 @@ class AgentState:
     # per-other relationships: other_id -> RelationshipState
     relationships: Dict[str, RelationshipState] = field(default_factory=dict)
 
+    # Lazy frozenset(tags) behind tag_set; cleared by set_tags().
+    _tag_set_cache: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # ----- tags -----
+
+    @property
+    def tag_set(self) -> FrozenSet[str]:
+        """frozenset(self.tags), built on first use and cached."""
+        cache = self._tag_set_cache
+        if cache is None:
+            cache = self._tag_set_cache = frozenset(self.tags)
+        return cache
+
+    def set_tags(self, tags: List[str]) -> None:
+        """Replace tags; change them through here so tag_set stays in sync."""
+        self.tags = list(tags)
+        self._tag_set_cache = None
+
     # ----- serialization -----
 
     def to_dict(self) -> dict:
-        def _conv(obj):
-            if hasattr(obj, "__dict__") or isinstance(obj, (list, dict)):
-                return asdict(obj)
-            return obj
-
-        return _conv(self)
+        # self is always a dataclass instance, so no per-call converter closure
+        data = asdict(self)
+        del data["_tag_set_cache"]
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "AgentState":
@@ -215,7 +234,8 @@ class AgentState:
             kind=data.get("kind", "human"),
             tags=list(data.get("tags", [])),
             alignment=alignment,
-            trust_strategy=data.get("trust_strategy", "copycat"),
+            # Interned so strategy-table lookups hit on identity.
+            trust_strategy=sys.intern(data.get("trust_strategy", "copycat")),
             trust_matrix={k: float(v) for k, v in data.get("trust_matrix", {}).items()},
             gossip_bias={k: float(v) for k, v in data.get("gossip_bias", {}).items()},
             emotion=emotion,
@@ -20,9 +20,12 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, asdict, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Literal
 
+from fizban_json import loads_json
+
 # --- Basic type aliases ---
 
 LawChaos = Literal["LAWFUL", "NEUTRAL", "CHAOTIC"]
@@ -172,6 +175,48 @@ def load_agent_config(path: Path) -> AgentConfig:
     return AgentConfig.from_dict(data)
 
 
+@lru_cache(maxsize=None)
+def _read_agent_bytes(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+def load_agent_dict_from_v2(path: Path) -> Dict[str, Any]:
+    """
+    Load a v2 agent config as the plain world-agent dict used by the
+    gods / level-tree / traits demos (alignment, class, tags, fate, favor,
+    unlocks, level).
+
+    The file is read once per path; each call parses it again so callers
+    get their own dict and can mutate it freely.
+    """
+    data = loads_json(_read_agent_bytes(path))
+    name = data.get("name", path.stem)
+    alignment = data.get("alignment", {})
+    cls = data.get("class", {})
+    tags = data.get("tags", [])
+    fate_baseline = data.get(
+        "fate_baseline",
+        {"grace": 0.5, "bounce_back": 0.5, "mental_strain": 0.1, "weird_mode": False},
+    )
+    level = cls.get("level", data.get("level", 1))
+
+    return {
+        "name": name,
+        "alignment": alignment,
+        "class": cls,
+        "tags": tags,
+        "fate": {
+            "grace": float(fate_baseline.get("grace", 0.5)),
+            "bounce_back": float(fate_baseline.get("bounce_back", 0.5)),
+            "mental_strain": float(fate_baseline.get("mental_strain", 0.1)),
+            "weird_mode": bool(fate_baseline.get("weird_mode", False)),
+        },
+        "favor": {},
+        "unlocks": {"level_nodes": []},
+        "level": int(level),
+    }
+
+
 def save_agent_config(cfg: AgentConfig, path: Path, overwrite: bool = False) -> None:
     if path.exists() and not overwrite:
         raise FileExistsError(f"{path} already exists (use overwrite=True)")
@@ -20,6 +20,7 @@ Numeric backbone for D&D-style alignment in the Fizban world.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from math import sqrt
 from typing import Dict, Tuple
 
@@ -74,6 +75,11 @@ class AlignmentPoint:
         return (self.law_chaos, self.good_evil)
 
 
+# Labels come from a small, enum-like set, so the label helpers below are
+# memoized; each returns an immutable value (str / float / frozen point).
+
+
+@lru_cache(maxsize=256)
 def normalize_label(label: str) -> str:
     """Normalize alignment strings to canonical form."""
     s = " ".join(label.strip().split())
@@ -84,6 +90,7 @@ def normalize_label(label: str) -> str:
     return s
 
 
+@lru_cache(maxsize=256)
 def alignment_to_axes(label: str) -> AlignmentPoint:
     """
     Map a human-readable alignment label to an AlignmentPoint.
@@ -128,6 +135,7 @@ def alignment_distance(a: str, b: str) -> float:
     return sqrt(dx * dx + dy * dy)
 
 
+@lru_cache(maxsize=1024)
 def alignment_compatibility(a: str, b: str) -> float:
     """
     Convert distance into a compatibility score in [0, 1].
@@ -143,6 +151,7 @@ def alignment_compatibility(a: str, b: str) -> float:
     return 1.0 - frac
 
 
+@lru_cache(maxsize=256)
 def suggest_default_strategy(label: str) -> str:
     """
     Suggest a Nicky Case-style iterated game strategy tag
@@ -12,7 +12,7 @@ from __future__ import annotations
 from pathlib import Path
 import json
 
-from fizban_level_menu import _load_agent_from_v2
+from fizban_agent_config import load_agent_dict_from_v2
 from fizban_gods import compute_favor_for_agent
 from fizban_betrayal_offers import get_betrayal_offers
 
@@ -22,7 +22,7 @@ def _demo() -> int:
     examples_dir = base_dir / "examples"
 
     paladin_path = examples_dir / "agent_paladin_v2.json"
-    paladin = _load_agent_from_v2(paladin_path)
+    paladin = load_agent_dict_from_v2(paladin_path)
 
     # Pretend they are level 120 for demo purposes
     paladin["class"]["level"] = 120
@@ -11,7 +11,7 @@ Bloodlines (angelic, demonic, druidic, psionic) that:
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 
 @dataclass
@@ -252,7 +252,7 @@ def evaluate_bloodline_progress(
     level: int,
     weird_level: float,
     favor: Dict[str, float],
-    traits: List[str],
+    traits: Iterable[str],
 ) -> Dict:
     """
     Given an agent's level, weird_level, favor and traits,
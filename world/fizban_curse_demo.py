@@ -16,8 +16,8 @@ from __future__ import annotations
 from pathlib import Path
 import json
 
+from fizban_agent_config import load_agent_dict_from_v2
 from fizban_level_menu import (
-    _load_agent_from_v2,
     load_all_trees,
     build_tarot_spread,
 )
@@ -30,7 +30,7 @@ def _demo() -> int:
 
     paladin_path = examples_dir / "agent_paladin_v2.json"
 
-    paladin = _load_agent_from_v2(paladin_path)
+    paladin = load_agent_dict_from_v2(paladin_path)
     trees = load_all_trees(base_dir)
 
     # Spread BEFORE curse
@@ -18,6 +18,7 @@ from typing import List, Dict
 
 from fizban_alignment_math import alignment_to_axes
 from fizban_trust_math import (
+    MIRRORED_OUTCOME,
     TrustState,
     init_trust_state,
     update_trust_state,
@@ -59,16 +60,7 @@ def run_demo() -> Dict[str, object]:
 
     # Same script as before: CC, CC, CC, CD, CC (from Paladin POV)
     rounds_paladin = ["CC", "CC", "CC", "CD", "CC"]
-    rounds_puck: List[str] = []
-    for out in rounds_paladin:
-        if out == "CC":
-            rounds_puck.append("CC")
-        elif out == "CD":
-            rounds_puck.append("DC")
-        elif out == "DC":
-            rounds_puck.append("CD")
-        elif out == "DD":
-            rounds_puck.append("DD")
+    rounds_puck = [MIRRORED_OUTCOME[out] for out in rounds_paladin]
 
     history: List[Dict[str, object]] = []
 
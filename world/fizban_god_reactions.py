@@ -6,6 +6,7 @@ Tiny narrative engine:
 - Inspect agents in a world (favor, bloodlines, items, traits)
 - Summarize each god's mood and focus
 - Produce short reaction blurbs and structured hooks
+- compute_favor_and_reactions: refresh favor + reactions in one agent pass
 
 Input world shape (as from fizban_world_enrich.enrich_world):
 {
@@ -21,14 +22,33 @@ Input world shape (as from fizban_world_enrich.enrich_world):
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Tuple
+import heapq
+import sys
+from typing import Dict, Any, FrozenSet, List, Tuple
+
+from fizban_gods import compute_favor_for_agent
 
 
 World = Dict[str, Any]
 Agent = Dict[str, Any]
 
 
-PATRONS = ["Titania", "Oberon", "Bottom", "King", "Queen", "Lovers"]
+# Patron and band names are used as dict keys and compared on every
+# patron x agent pass; intern them so equality short-circuits on identity
+# even when the names arrive from JSON or other modules.
+PATRONS = [sys.intern(p) for p in ("Titania", "Oberon", "Bottom", "King", "Queen", "Lovers")]
+
+_BAND_PHRASES: Dict[str, str] = {
+    sys.intern(band): phrase
+    for band, phrase in (
+        ("adoring", "is delighted by"),
+        ("pleased", "is pleased with"),
+        ("curious", "watches with interest"),
+        ("uneasy", "is uneasy about"),
+        ("displeased", "is quietly displeased with"),
+        ("indifferent", "barely notices"),
+    )
+}
 
 
 # --- helpers --------------------------------------------------------------
@@ -73,24 +93,22 @@ def _favor_band(score: float) -> str:
 
 
 def _short_band_phrase(band: str) -> str:
-    mapping = {
-        "adoring": "is delighted by",
-        "pleased": "is pleased with",
-        "curious": "watches with interest",
-        "uneasy": "is uneasy about",
-        "displeased": "is quietly displeased with",
-        "indifferent": "barely notices",
-    }
-    return mapping.get(band, "watches with interest")
+    return _BAND_PHRASES.get(band, "watches with interest")
 
 
 # --- reaction computation -------------------------------------------------
 
 
-def _summarize_patron_for_agent(patron: str, name: str, agent: Agent) -> Dict[str, Any]:
+def _summarize_patron_for_agent(
+    patron: str,
+    name: str,
+    agent: Agent,
+    traits: FrozenSet[str] | None = None,
+) -> Dict[str, Any]:
     favor = _favor_for(agent, patron)
     band = _favor_band(favor)
-    traits = set(_traits(agent))
+    if traits is None:
+        traits = frozenset(_traits(agent))
     bloodlines = _bloodlines(agent)
     items = _sentient_items(agent)
 
@@ -141,14 +159,89 @@ def _summarize_patron_for_agent(patron: str, name: str, agent: Agent) -> Dict[st
         "agent": name,
         "favor": favor,
         "band": band,
-        "hooks": sorted(set(hooks)),
+        # Each rule above appends at most once, so hooks are already unique
+        # and come out in the (deterministic) rule order.
+        "hooks": hooks,
         "line": base_line,
     }
 
 
+def _favor_key(entry: Dict[str, Any]) -> float:
+    return entry["favor"]
+
+
+_HEADLINE_BY_BAND: Dict[str, str] = {
+    "adoring": "{patron} smiles on {agent} tonight.",
+    "pleased": "{patron} smiles on {agent} tonight.",
+    "uneasy": "{patron} is troubled by {agent}'s path.",
+    "displeased": "{patron} is troubled by {agent}'s path.",
+}
+_DEFAULT_HEADLINE = "{patron} watches the mortals with mild curiosity."
+
+
+def _finish_patron_reaction(
+    patron: str,
+    per_agents: List[Dict[str, Any]],
+    events: List[Dict[str, Any]],
+    include_by_agent: bool,
+) -> Dict[str, Any]:
+    # Only the three most emotionally-loaded entries feed the headline
+    # and top_lines, so select them without sorting every agent.
+    top = heapq.nlargest(3, per_agents, key=_favor_key)
+    top_lines = [entry["line"] for entry in top]
+
+    # Simple "headline" for the patron
+    if not top:
+        headline = f"{patron} sleeps; the world is quiet."
+    else:
+        top_agent = top[0]
+        template = _HEADLINE_BY_BAND.get(top_agent["band"], _DEFAULT_HEADLINE)
+        headline = template.format(patron=patron, agent=top_agent["agent"])
+
+    reaction: Dict[str, Any] = {"headline": headline}
+    if include_by_agent:
+        # Full ordering is only needed for the by_agent listing.
+        reaction["by_agent"] = sorted(per_agents, key=_favor_key, reverse=True)
+    reaction["top_lines"] = top_lines
+    reaction["events_seen"] = events
+    return reaction
+
+
+def _compute_reactions(
+    world: World,
+    events: List[Dict[str, Any]] | None,
+    include_by_agent: bool,
+    refresh_favor: bool,
+) -> Dict[str, Any]:
+    # One walk over the agents: optionally refresh favor, then summarize
+    # every patron for that agent while its dict is hot.
+    events_seen = events or []
+    per_patron: Dict[str, List[Dict[str, Any]]] = {patron: [] for patron in PATRONS}
+
+    for name, agent in _agents(world).items():
+        if refresh_favor:
+            agent["favor"] = compute_favor_for_agent(agent)
+        # Trait sets are patron-independent: build each agent's once, not per
+        # patron. Kept local rather than on the agent so dumped worlds stay
+        # JSON-clean.
+        traits = frozenset(_traits(agent))
+        for patron in PATRONS:
+            per_patron[patron].append(
+                _summarize_patron_for_agent(patron, name, agent, traits)
+            )
+
+    return {
+        patron: _finish_patron_reaction(
+            patron, per_patron[patron], events_seen, include_by_agent
+        )
+        for patron in PATRONS
+    }
+
+
 def compute_god_reactions(
     world: World,
     events: List[Dict[str, Any]] | None = None,
+    include_by_agent: bool = False,
 ) -> Dict[str, Any]:
     """
     Compute reactions per patron.
@@ -156,43 +249,26 @@ def compute_god_reactions(
     events: optional list of recent events, e.g.
       { "type": "LEVEL_UP", "agent": "Paladin", "node_id": "TITANIA_GRACE_SPARK" }
 
+    include_by_agent: also return every agent's summary (sorted by favor)
+    under "by_agent". Off by default since callers only read headline and
+    top_lines, and the full list grows with patrons x agents.
+
     Right now we only attach events as extra context, but later they can steer specific lines.
     """
-    agents = _agents(world)
-    reactions: Dict[str, Any] = {}
-
-    for patron in PATRONS:
-        per_agents: List[Dict[str, Any]] = []
-        for name, agent in agents.items():
-            per_agents.append(_summarize_patron_for_agent(patron, name, agent))
-
-        # Sort so most emotionally-loaded stuff floats up
-        per_agents_sorted = sorted(
-            per_agents,
-            key=lambda x: x["favor"],
-            reverse=True,
-        )
+    return _compute_reactions(world, events, include_by_agent, refresh_favor=False)
 
-        top_lines = [entry["line"] for entry in per_agents_sorted[:3]]
-
-        # Simple "headline" for the patron
-        if not per_agents_sorted:
-            headline = f"{patron} sleeps; the world is quiet."
-        else:
-            top_agent = per_agents_sorted[0]
-            if top_agent["band"] in ("adoring", "pleased"):
-                headline = f"{patron} smiles on {top_agent['agent']} tonight."
-            elif top_agent["band"] in ("uneasy", "displeased"):
-                headline = f"{patron} is troubled by {top_agent['agent']}'s path."
-            else:
-                headline = f"{patron} watches the mortals with mild curiosity."
-
-        reactions[patron] = {
-            "headline": headline,
-            "by_agent": per_agents_sorted,
-            "top_lines": top_lines,
-            "events_seen": events or [],
-        }
-
-    return reactions
 
+def compute_favor_and_reactions(
+    world: World,
+    events: List[Dict[str, Any]] | None = None,
+    include_by_agent: bool = False,
+) -> Dict[str, Any]:
+    """
+    Fused version of fizban_gods.compute_favor_for_world + compute_god_reactions.
+
+    Refreshes agent["favor"] in the same agent pass that builds the
+    reactions, instead of one favor pass followed by the reaction pass.
+    Mutates agents' favor in place and returns the same shape as
+    compute_god_reactions.
+    """
+    return _compute_reactions(world, events, include_by_agent, refresh_favor=True)
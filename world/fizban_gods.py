@@ -18,20 +18,28 @@ This is intentionally lightweight and heuristic. It uses:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from typing import Dict, FrozenSet, List, Any
 from pathlib import Path
 import json
 import math
 
+from fizban_agent_config import load_agent_dict_from_v2 as _load_agent_from_v2
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class GodConfig:
     name: str
     alignment_tilt: Dict[str, str]  # {"law_chaos": "...", "good_evil": "..."}
-    loves_tags: List[str] = field(default_factory=list)
-    hates_tags: List[str] = field(default_factory=list)
+    loves_tags: FrozenSet[str] = field(default_factory=frozenset)
+    hates_tags: FrozenSet[str] = field(default_factory=frozenset)
     boon_trees: List[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Accept any iterable of tags, but store frozensets so favor
+        # scoring can use set intersection instead of per-tag scans.
+        object.__setattr__(self, "loves_tags", frozenset(self.loves_tags))
+        object.__setattr__(self, "hates_tags", frozenset(self.hates_tags))
+
 
 GODS: Dict[str, GodConfig] = {
     "Titania": GodConfig(
@@ -79,10 +87,23 @@ GODS: Dict[str, GodConfig] = {
 }
 
 
+_LC_MAP: Dict[str, float] = {"LAWFUL": 1.0, "NEUTRAL": 0.0, "CHAOTIC": -1.0, "ANY": 0.0}
+_GE_MAP: Dict[str, float] = {"GOOD": 1.0, "NEUTRAL": 0.0, "EVIL": -1.0, "ANY": 0.0}
+
+# Only 4x4 possible label pairs, so precompute them all once.
+_COORD_CACHE: Dict[tuple[str, str], tuple[float, float]] = {
+    (lc, ge): (lc_val, ge_val)
+    for lc, lc_val in _LC_MAP.items()
+    for ge, ge_val in _GE_MAP.items()
+}
+
+
 def _alignment_coords(law_chaos: str, good_evil: str) -> tuple[float, float]:
-    lc_map = {"LAWFUL": 1.0, "NEUTRAL": 0.0, "CHAOTIC": -1.0, "ANY": 0.0}
-    ge_map = {"GOOD": 1.0, "NEUTRAL": 0.0, "EVIL": -1.0, "ANY": 0.0}
-    return lc_map.get(law_chaos, 0.0), ge_map.get(good_evil, 0.0)
+    coords = _COORD_CACHE.get((law_chaos, good_evil))
+    if coords is None:
+        # Unknown label on at least one axis: fall back per-axis.
+        return _LC_MAP.get(law_chaos, 0.0), _GE_MAP.get(good_evil, 0.0)
+    return coords
 
 
 def _alignment_score(agent_align: Dict[str, str], god_align: Dict[str, str]) -> float:
@@ -137,11 +158,8 @@ def compute_favor_for_agent(agent: Dict[str, Any]) -> Dict[str, float]:
             score += (a_score - 0.5) * 0.3
 
         # Tag influence
-        for t in tags:
-            if t in god.loves_tags:
-                score += 0.03
-            if t in god.hates_tags:
-                score -= 0.03
+        score += 0.03 * len(tags & god.loves_tags)
+        score -= 0.03 * len(tags & god.hates_tags)
 
         # Special god-specific seasoning
         a_lc = alignment.get("law_chaos", "NEUTRAL")
@@ -202,35 +220,6 @@ def compute_favor_for_world(world_state: Dict[str, Any]) -> Dict[str, Any]:
 # --- Demo: load Paladin/Puck v2 configs and print favor snapshots ---
 
 
-def _load_agent_from_v2(path: Path) -> Dict[str, Any]:
-    data = json.loads(path.read_text(encoding="utf-8"))
-    name = data.get("name", path.stem)
-    alignment = data.get("alignment", {})
-    cls = data.get("class", {})
-    tags = data.get("tags", [])
-    fate_baseline = data.get(
-        "fate_baseline",
-        {"grace": 0.5, "bounce_back": 0.5, "mental_strain": 0.1, "weird_mode": False},
-    )
-    level = cls.get("level", data.get("level", 1))
-
-    return {
-        "name": name,
-        "alignment": alignment,
-        "class": cls,
-        "tags": tags,
-        "fate": {
-            "grace": float(fate_baseline.get("grace", 0.5)),
-            "bounce_back": float(fate_baseline.get("bounce_back", 0.5)),
-            "mental_strain": float(fate_baseline.get("mental_strain", 0.1)),
-            "weird_mode": bool(fate_baseline.get("weird_mode", False)),
-        },
-        "favor": {},
-        "unlocks": {"level_nodes": []},
-        "level": int(level),
-    }
-
-
 def _demo():
     base_dir = Path(__file__).resolve().parent
     examples_dir = base_dir / "examples"
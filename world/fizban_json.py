@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fizban_json.py
+
+Tiny JSON shim for the world modules:
+
+- load_json_path(path) -> parsed JSON
+- loads_json(data)     -> parsed JSON from str or bytes
+- print_json(obj)      -> pretty-print (indent=2) to stdout, for demos
+- dumps_json(obj)      -> compact one-line JSON text (e.g. NDJSON logs)
+- clone_json(obj)      -> independent copy of JSON-shaped data
+
+Uses orjson when it is installed (noticeably faster on the tree /
+bestiary / agent files) and falls back to the stdlib json module
+otherwise, so nothing here is a hard dependency.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_path(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def dumps_json(obj: Any) -> str:
+    """Compact single-line JSON text; non-ASCII is kept as UTF-8 either way."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def clone_json(obj: Any) -> Any:
+    """
+    Deep copy of JSON-shaped data (dicts/lists/str/numbers/bool/None) via a
+    serialize + parse round-trip, which is much cheaper than copy.deepcopy.
+    Tuples come back as lists.
+    """
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+    return json.loads(json.dumps(obj))
+
+
+def print_json(obj: Any) -> None:
+    """
+    Pretty-print obj with indent=2, like print(json.dumps(obj, indent=2)).
+
+    With orjson the indented bytes go straight to stdout's binary buffer.
+    The structure matches the stdlib output but the text is not
+    byte-identical: non-ASCII is written as UTF-8 rather than \\u escapes
+    and some floats are spelled differently (0.00001 vs 1e-05). Non-str dict
+    keys are stringified in both paths.
+    """
+    if orjson is None:
+        print(json.dumps(obj, indent=2))
+        return
+    # Flush pending text output first so ordering with print() is kept.
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    out.write(b"\n")
+    out.flush()
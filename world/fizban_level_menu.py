@@ -14,11 +14,12 @@ instead of assuming a specific name.
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional
+import heapq
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from fizban_json import print_json
 
-from fizban_world_state import build_world_state
-world = build_world_state()
 # These are stable across your repo
 from fizban_level_tree import eligible_nodes_for_agent
 from fizban_god_reactions import compute_god_reactions
@@ -38,6 +39,7 @@ PATRON_BY_TREE: Dict[str, str] = {
 # ---------- World builder discovery ----------
 
 
+@lru_cache(maxsize=1)
 def _discover_world_builder() -> callable:
     """
     Try very hard to find a world-building function.
@@ -48,7 +50,8 @@ def _discover_world_builder() -> callable:
     2. fizban_world_state: build_world_state / build_world / build_world_final
 
     Returns a zero-arg callable that builds a world dict, or raises a
-    descriptive RuntimeError if nothing is found.
+    descriptive RuntimeError if nothing is found. Resolved on first use and
+    cached, so importing this module does not load the world modules.
     """
     # Try enriched module first (if present)
     try:
@@ -104,10 +107,6 @@ def _discover_world_builder() -> callable:
     )
 
 
-# Bind once at import time
-_BUILD_WORLD = _discover_world_builder()
-
-
 def build_world_with_favor() -> World:
     """
     Build the world using the discovered builder.
@@ -115,7 +114,7 @@ def build_world_with_favor() -> World:
     If agents already have .favor attached, we use it.
     If not, level menu will still work but all favor will be treated as 0.0.
     """
-    world = _BUILD_WORLD()
+    world = _discover_world_builder()()
     return world
 
 
@@ -128,21 +127,18 @@ def _get_agent(world: World, agent_name: str) -> Dict[str, Any]:
     return agents.get(agent_name, {})
 
 
-def _get_favor(world: World, agent_name: str) -> Dict[str, float]:
-    """
-    Extract favor map for an agent, if present.
-
-    Returns a {patron -> float} dict, defaulting to 0.0 if nothing is found.
-    """
-    agent = _get_agent(world, agent_name)
-    raw = agent.get("favor") or {}
-    return {str(k): float(v) for k, v in raw.items()}
+# ---------- Core: cards / spreads ----------
 
 
-# ---------- Core: cards / spreads ----------
+def _sort_key_of(entry: Tuple[Tuple[float, str, str], Card]) -> Tuple[float, str, str]:
+    return entry[0]
 
 
-def build_level_menu_for_agent(world: World, agent_name: str) -> List[Card]:
+def build_level_menu_for_agent(
+    world: World,
+    agent_name: str,
+    num_cards: Optional[int] = None,
+) -> List[Card]:
     """
     Build a tarot-like spread of candidate level-up nodes for an agent.
 
@@ -150,17 +146,26 @@ def build_level_menu_for_agent(world: World, agent_name: str) -> List[Card]:
     - eligible_nodes_for_agent(world, agent_name)
     - PATRON_BY_TREE mapping
     - current favor (if available) to sort & annotate
+
+    num_cards: if given, only the best `num_cards` cards are returned
+    (selected with a heap instead of sorting every candidate).
     """
-    favor = _get_favor(world, agent_name)
+    # Read the agent's favor map in place; values are coerced per patron
+    # below instead of rebuilding a {str: float} copy on every call.
+    favor_get = (_get_agent(world, agent_name).get("favor") or {}).get
+    patron_get = PATRON_BY_TREE.get
 
     # Ask level-tree engine which nodes are eligible in general
     nodes = eligible_nodes_for_agent(world, agent_name)
 
-    cards: List[Card] = []
+    # (sort_key, card) pairs: the key is built once from values already in
+    # hand instead of being re-read out of each card dict by the sort.
+    keyed: List[Tuple[Tuple[float, str, str], Card]] = []
 
     for node in nodes:
         tree_id = node.get("tree_id")
-        if tree_id not in PATRON_BY_TREE:
+        patron = patron_get(tree_id)
+        if patron is None:
             # only our four patron trees for this spread
             continue
 
@@ -169,74 +174,89 @@ def build_level_menu_for_agent(world: World, agent_name: str) -> List[Card]:
         if tier != 1:
             continue
 
-        patron = PATRON_BY_TREE[tree_id]
-        patron_favor = float(favor.get(patron, 0.0))
+        patron_favor = float(favor_get(patron, 0.0))
 
         tags = list(node.get("tags") or [])
         if tags:
             short_hint = (
                 f"{patron} is watching you with interest; taking this boon nudges your story "
-                f"toward " + ", ".join(tags) + "."
+                f"toward {', '.join(tags)}."
             )
         else:
             short_hint = f"{patron} is watching you with interest."
 
+        name = node.get("name")
         card: Card = {
             "tree_id": tree_id,
             "node_id": node.get("node_id"),
-            "name": node.get("name"),
+            "name": name,
             "patron": patron,
             "cost_points": 1,
             "favor_for_patron": patron_favor,
             "tags": tags,
             "short_hint": short_hint,
         }
-        cards.append(card)
+        keyed.append(((-patron_favor, patron, name or ""), card))
 
     # Highest favor cards first, then stable by patron/name
-    cards.sort(
-        key=lambda c: (
-            -float(c.get("favor_for_patron", 0.0)),
-            c.get("patron", ""),
-            c.get("name", ""),
-        )
-    )
-    return cards
-
-
-def attach_god_whispers(world: World, agent_name: str, cards: List[Card]) -> List[Card]:
+    if num_cards is not None:
+        return [card for _, card in heapq.nsmallest(num_cards, keyed, key=_sort_key_of)]
+    keyed.sort(key=_sort_key_of)
+    return [card for _, card in keyed]
+
+
+def attach_god_whispers(
+    world: World,
+    agent_name: str,
+    cards: List[Card],
+    reactions: Optional[Dict[str, Any]] = None,
+) -> List[Card]:
     """
     Look at god reactions and add 0–2 'god_whispers' lines to each card.
 
     We:
-    - compute_god_reactions(world, events=[])
+    - compute_god_reactions(world, events=[]) unless `reactions` is given
     - pick top_lines that mention the agent_name
     - fall back to patron headline if nothing specific
+
+    Pass precomputed `reactions` when building spreads for several agents
+    of the same world so the full patron x agent scan runs only once.
     """
-    reactions = compute_god_reactions(world, events=[])
+    if reactions is None:
+        reactions = compute_god_reactions(world, events=[])
+
+    # Whispers depend only on (patron, agent), so scan each patron's
+    # lines once and reuse the result for every card of that patron.
+    whispers_by_patron: Dict[Any, List[str]] = {}
 
     enriched: List[Card] = []
 
     for card in cards:
         patron = card.get("patron")
-        reaction = reactions.get(patron) or {}
-        lines = reaction.get("top_lines") or []
-        headline = reaction.get("headline") or ""
+        whispers = whispers_by_patron.get(patron)
+        if whispers is None:
+            reaction = reactions.get(patron) or {}
+            lines = reaction.get("top_lines") or []
+            headline = reaction.get("headline") or ""
 
-        whispers: List[str] = []
+            whispers = []
 
-        # Prefer lines that explicitly mention the agent
-        for line in lines:
-            if agent_name in line:
-                whispers.append(line)
+            # Prefer lines that explicitly mention the agent (max two)
+            for line in lines:
+                if agent_name in line:
+                    whispers.append(line)
+                    if len(whispers) == 2:
+                        break
 
-        # Fallback: generic headline if nothing agent-specific
-        if not whispers and headline:
-            whispers.append(headline)
+            # Fallback: generic headline if nothing agent-specific
+            if not whispers and headline:
+                whispers.append(headline)
+
+            whispers_by_patron[patron] = whispers
 
         card_with_whispers = dict(card)
         if whispers:
-            card_with_whispers["god_whispers"] = whispers[:2]
+            card_with_whispers["god_whispers"] = list(whispers)
         enriched.append(card_with_whispers)
 
     return enriched
@@ -255,14 +275,15 @@ def main() -> None:
     paladin_raw = build_level_menu_for_agent(world, "Paladin")
     puck_raw = build_level_menu_for_agent(world, "Puck")
 
-    paladin_spread = attach_god_whispers(world, "Paladin", paladin_raw)
-    puck_spread = attach_god_whispers(world, "Puck", puck_raw)
+    reactions = compute_god_reactions(world, events=[])
+    paladin_spread = attach_god_whispers(world, "Paladin", paladin_raw, reactions)
+    puck_spread = attach_god_whispers(world, "Puck", puck_raw, reactions)
 
     payload = {
         "paladin_spread": paladin_spread,
         "puck_spread": puck_spread,
     }
-    print(json.dumps(payload, indent=2))
+    print_json(payload)
 
 
 if __name__ == "__main__":
@@ -8,7 +8,9 @@ Lightweight level-tree engine:
 - LevelUpNode / LevelUpTree dataclasses
 - load_level_tree(path) -> LevelUpTree
 - eligible_nodes_for_agent(agent, tree) -> list[LevelUpNode]
+- eligible_nodes_memo(agent, tree) -> same, memoized on agent-relevant fields
 - apply_levelup_node(world_state, agent_name, node) -> world_state
+- apply_nodes_to_agent(agent, nodes): batch apply, clamping once at the end
 
 Effects supported (so far):
 - "fate.grace_delta": float
@@ -23,12 +25,22 @@ Effects supported (so far):
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import AbstractSet, Dict, FrozenSet, List, Any, Optional, Tuple
 from pathlib import Path
-import json
 
+from fizban_json import load_json_path
 
-@dataclass
+
+# effect key -> (fate field, default when missing)
+_FATE_DELTAS: Dict[str, Tuple[str, float]] = {
+    "fate.grace_delta": ("grace", 0.5),
+    "fate.bounce_back_delta": ("bounce_back", 0.5),
+    "fate.mental_strain_delta": ("mental_strain", 0.1),
+}
+
+
+@dataclass(slots=True)
 class LevelUpNode:
     id: str
     name: str
@@ -40,8 +52,88 @@ class LevelUpNode:
     requires: Dict[str, Any] = field(default_factory=dict)
     effects: Dict[str, Any] = field(default_factory=dict)
 
+    # Pre-parsed form of `requires`, filled in by __post_init__ so
+    # node_is_eligible doesn't re-parse the dict on every check.
+    # A None alignment requirement means "ANY" / no band.
+    _min_level: int = field(init=False, repr=False, compare=False, default=1)
+    _max_level: int = field(init=False, repr=False, compare=False, default=999)
+    _req_lc: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+    _req_ge: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+    _favor_req: Tuple[Tuple[str, float], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _quest_flags: FrozenSet[str] = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+    _prereq_nodes: FrozenSet[str] = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+
+    # Pre-parsed form of `effects`, so applying a node is plain iteration
+    # instead of string-prefix scans over the effect keys.
+    # _fate_deltas: (fate field, default, delta) in _FATE_DELTAS order.
+    # _traits_add is None when the node has no "traits.add" effect.
+    _fate_deltas: Tuple[Tuple[str, float, float], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _weird_bias: Optional[float] = field(init=False, repr=False, compare=False, default=None)
+    _favor_deltas: Tuple[Tuple[str, float], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _traits_add: Optional[Tuple[str, ...]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _class_deltas: Tuple[Tuple[str, int], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+
+    def __post_init__(self) -> None:
+        requires = self.requires or {}
+        self._min_level = int(requires.get("min_level", 1))
+        self._max_level = int(requires.get("max_level", 999))
+
+        band = requires.get("alignment_band")
+        if band:
+            req_lc = band.get("law_chaos", "ANY")
+            req_ge = band.get("good_evil", "ANY")
+            self._req_lc = None if req_lc == "ANY" else req_lc
+            self._req_ge = None if req_ge == "ANY" else req_ge
+
+        self._favor_req = tuple(
+            (god, float(threshold)) for god, threshold in (requires.get("favor") or {}).items()
+        )
+        self._quest_flags = frozenset(requires.get("quest_flags", []))
+        self._prereq_nodes = frozenset(requires.get("nodes", []))
+
+        # One pass over effects, dispatching on key shape.
+        fate_found: Dict[str, float] = {}
+        favor_deltas: List[Tuple[str, float]] = []
+        class_deltas: List[Tuple[str, int]] = []
+        for key, val in (self.effects or {}).items():
+            if key in _FATE_DELTAS:
+                fate_found[key] = float(val)
+            elif key == "fate.weird_mode_bias":
+                self._weird_bias = float(val)
+            elif key == "traits.add":
+                self._traits_add = tuple(val or [])
+            elif key.endswith("_delta"):
+                # "favor.Titania_delta": 0.1 / "class_levels.paladin_delta": 1
+                if key.startswith("favor."):
+                    favor_deltas.append((key[len("favor.") : -len("_delta")], float(val)))
+                elif key.startswith("class_levels."):
+                    class_deltas.append((key[len("class_levels.") : -len("_delta")], int(val)))
+
+        # Keep fate fields in _FATE_DELTAS order regardless of effect order
+        self._fate_deltas = tuple(
+            (field_name, default, fate_found[key])
+            for key, (field_name, default) in _FATE_DELTAS.items()
+            if key in fate_found
+        )
+        self._favor_deltas = tuple(favor_deltas)
+        self._class_deltas = tuple(class_deltas)
+
 
-@dataclass
+@dataclass(slots=True)
 class LevelUpTree:
     id: str
     name: str
@@ -51,8 +143,13 @@ class LevelUpTree:
     root_nodes: List[str] = field(default_factory=list)
 
 
+@lru_cache(maxsize=None)
 def load_level_tree(path: Path) -> LevelUpTree:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    """
+    Parse a tree file once per path; repeated loads return the same tree.
+    Trees are treated as read-only (apply_node_to_agent only mutates agents).
+    """
+    raw = load_json_path(path)
     nodes: Dict[str, LevelUpNode] = {}
 
     for node_data in raw.get("nodes", []):
@@ -97,56 +194,60 @@ def _get_agent_unlocked_nodes(agent: Dict[str, Any]) -> List[str]:
     return nodes
 
 
-def node_is_eligible(agent: Dict[str, Any], node: LevelUpNode) -> bool:
+def node_is_eligible(
+    agent: Dict[str, Any],
+    node: LevelUpNode,
+    unlocked: Optional[AbstractSet[str]] = None,
+    agent_flags: Optional[AbstractSet[str]] = None,
+) -> bool:
     """
     Check whether this agent can take this node right now.
+
+    `unlocked` and `agent_flags` (completed quest flags) may be passed in
+    when checking many nodes for the same agent so those sets are built
+    once per pass, not per node.
     """
-    unlocked = set(_get_agent_unlocked_nodes(agent))
+    if unlocked is None:
+        unlocked = set(_get_agent_unlocked_nodes(agent))
     if node.id in unlocked:
         return False
 
-    requires = node.requires or {}
-
     # Level gate
     lvl = _get_agent_level(agent)
-    min_level = int(requires.get("min_level", 1))
-    max_level = int(requires.get("max_level", 999))
-    if lvl < min_level or lvl > max_level:
+    if lvl < node._min_level or lvl > node._max_level:
         return False
 
     # Alignment band gate
-    band = requires.get("alignment_band")
-    if band:
+    req_lc = node._req_lc
+    req_ge = node._req_ge
+    if req_lc is not None or req_ge is not None:
         align = _get_agent_alignment(agent)
         a_lc = align.get("law_chaos")
         a_ge = align.get("good_evil")
 
-        req_lc = band.get("law_chaos", "ANY")
-        req_ge = band.get("good_evil", "ANY")
-
-        if req_lc != "ANY" and a_lc is not None and a_lc != req_lc:
+        if req_lc is not None and a_lc is not None and a_lc != req_lc:
             return False
-        if req_ge != "ANY" and a_ge is not None and a_ge != req_ge:
+        if req_ge is not None and a_ge is not None and a_ge != req_ge:
             return False
 
     # Favor gate
-    favor_req: Dict[str, float] = requires.get("favor", {})
-    if favor_req:
+    if node._favor_req:
         favors = _get_agent_favor(agent)
-        for god, threshold in favor_req.items():
-            if float(favors.get(god, 0.0)) < float(threshold):
+        for god, threshold in node._favor_req:
+            if float(favors.get(god, 0.0)) < threshold:
                 return False
 
     # Quest flags gate
-    quest_flags = set(requires.get("quest_flags", []))
+    quest_flags = node._quest_flags
     if quest_flags:
-        agent_flags = set(agent.get("quests_completed", []))
-        if not quest_flags.issubset(agent_flags):
+        if agent_flags is None:
+            agent_flags = set(agent.get("quests_completed", []))
+        if not quest_flags <= agent_flags:
             return False
 
     # Node prerequisites
-    prereq = set(requires.get("nodes", []))
-    if prereq and not prereq.issubset(unlocked):
+    prereq = node._prereq_nodes
+    if prereq and not prereq <= unlocked:
         return False
 
     return True
@@ -156,60 +257,115 @@ def eligible_nodes_for_agent(agent: Dict[str, Any], tree: LevelUpTree) -> List[L
     """
     All nodes this agent could legally take right now.
     """
-    return [n for n in tree.nodes.values() if node_is_eligible(agent, n)]
+    unlocked = set(_get_agent_unlocked_nodes(agent))
+    agent_flags = set(agent.get("quests_completed", []))
+    return [
+        n for n in tree.nodes.values() if node_is_eligible(agent, n, unlocked, agent_flags)
+    ]
+
+
+# (id(tree), agent key) -> (tree, eligible node ids). The tree is kept in the
+# value so a recycled id() can never alias a different tree.
+_ELIGIBLE_MEMO: Dict[Tuple[Any, ...], Tuple[LevelUpTree, Tuple[str, ...]]] = {}
+_ELIGIBLE_MEMO_MAX = 1024
+
+
+def _eligibility_key(agent: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Everything node_is_eligible reads from the agent, as a hashable tuple."""
+    align = _get_agent_alignment(agent)
+    return (
+        _get_agent_level(agent),
+        frozenset(_get_agent_unlocked_nodes(agent)),
+        frozenset(agent.get("quests_completed", [])),
+        align.get("law_chaos"),
+        align.get("good_evil"),
+        frozenset((str(k), float(v)) for k, v in _get_agent_favor(agent).items()),
+    )
+
+
+def eligible_nodes_memo(agent: Dict[str, Any], tree: LevelUpTree) -> List[LevelUpNode]:
+    """
+    Memoized eligible_nodes_for_agent for repeated queries on unchanged agent
+    state (UI previews, lookahead over simulated futures).
+    """
+    key = (id(tree),) + _eligibility_key(agent)
+    hit = _ELIGIBLE_MEMO.get(key)
+    if hit is not None and hit[0] is tree:
+        return [tree.nodes[nid] for nid in hit[1]]
+
+    nodes = eligible_nodes_for_agent(agent, tree)
+    if len(_ELIGIBLE_MEMO) >= _ELIGIBLE_MEMO_MAX:
+        _ELIGIBLE_MEMO.clear()
+    _ELIGIBLE_MEMO[key] = (tree, tuple(n.id for n in nodes))
+    return nodes
 
 
 def _clamp01(x: float) -> float:
-    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+    return min(1.0, max(0.0, x))
 
 
 def apply_node_to_agent(agent: Dict[str, Any], node: LevelUpNode) -> None:
     """
     Mutates agent in-place, applying node.effects and registering unlock.
     """
-    unlocks = _get_agent_unlocked_nodes(agent)
-    if node.id not in unlocks:
-        unlocks.append(node.id)
+    apply_nodes_to_agent(agent, [node])
+
 
-    effects = node.effects or {}
+def apply_nodes_to_agent(agent: Dict[str, Any], nodes: List[LevelUpNode]) -> None:
+    """
+    Apply several nodes in one go (e.g. leveling simulations).
 
-    # Fate effects
+    Fate and favor deltas from all nodes are summed first and each field is
+    clamped once at the end, so an intermediate overshoot (e.g. grace +0.3
+    then -0.3 from 0.9) is not lost to clamping as it would be when applying
+    the nodes one by one. For a single node both are identical.
+    """
+    unlocks = _get_agent_unlocked_nodes(agent)
     fate = agent.setdefault("fate", {})
-    if "fate.grace_delta" in effects:
-        fate["grace"] = _clamp01(float(fate.get("grace", 0.5)) + float(effects["fate.grace_delta"]))
-    if "fate.bounce_back_delta" in effects:
-        fate["bounce_back"] = _clamp01(
-            float(fate.get("bounce_back", 0.5)) + float(effects["fate.bounce_back_delta"])
-        )
-    if "fate.mental_strain_delta" in effects:
-        fate["mental_strain"] = _clamp01(
-            float(fate.get("mental_strain", 0.1)) + float(effects["fate.mental_strain_delta"])
-        )
-    if "fate.weird_mode_bias" in effects:
+    favor = agent.setdefault("favor", {})
+
+    fate_deltas: Dict[str, Tuple[float, float]] = {}
+    weird_bias = 0.0
+    has_weird_bias = False
+    favor_deltas: Dict[str, float] = {}
+
+    for node in nodes:
+        if node.id not in unlocks:
+            unlocks.append(node.id)
+
+        # Fate effects
+        for field_name, default, delta in node._fate_deltas:
+            _, total = fate_deltas.get(field_name, (default, 0.0))
+            fate_deltas[field_name] = (default, total + delta)
+        if node._weird_bias is not None:
+            weird_bias += node._weird_bias
+            has_weird_bias = True
+
+        # Favor effects
+        for god_name, delta in node._favor_deltas:
+            favor_deltas[god_name] = favor_deltas.get(god_name, 0.0) + delta
+
+        # Traits / tags
+        if node._traits_add is not None:
+            tags = agent.setdefault("tags", [])
+            for tag in node._traits_add:
+                if tag not in tags:
+                    tags.append(tag)
+
+        # Class level nudges
+        class_levels = agent.setdefault("class_levels", {})
+        for class_name, delta in node._class_deltas:
+            class_levels[class_name] = int(class_levels.get(class_name, 0)) + delta
+
+    # Clamp each touched field once
+    for field_name, (default, delta) in fate_deltas.items():
+        fate[field_name] = _clamp01(float(fate.get(field_name, default)) + delta)
+    if has_weird_bias:
         # store as a soft bias used by your fate engine
-        fate["weird_bias"] = float(fate.get("weird_bias", 0.0)) + float(effects["fate.weird_mode_bias"])
+        fate["weird_bias"] = float(fate.get("weird_bias", 0.0)) + weird_bias
 
-    # Favor effects: keys like "favor.Titania_delta": 0.1
-    favor = agent.setdefault("favor", {})
-    for key, val in effects.items():
-        if key.startswith("favor.") and key.endswith("_delta"):
-            god_name = key[len("favor.") : -len("_delta")]
-            favor[god_name] = _clamp01(float(favor.get(god_name, 0.0)) + float(val))
-
-    # Traits / tags
-    if "traits.add" in effects:
-        add_tags = effects["traits.add"] or []
-        tags = agent.setdefault("tags", [])
-        for tag in add_tags:
-            if tag not in tags:
-                tags.append(tag)
-
-    # Class level nudges: "class_levels.paladin_delta": 1
-    class_levels = agent.setdefault("class_levels", {})
-    for key, val in effects.items():
-        if key.startswith("class_levels.") and key.endswith("_delta"):
-            class_name = key[len("class_levels.") : -len("_delta")]
-            class_levels[class_name] = int(class_levels.get(class_name, 0)) + int(val)
+    for god_name, delta in favor_deltas.items():
+        favor[god_name] = _clamp01(float(favor.get(god_name, 0.0)) + delta)
 
 
 def apply_levelup_node(world_state: Dict[str, Any], agent_name: str, node: LevelUpNode) -> Dict[str, Any]:
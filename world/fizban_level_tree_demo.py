@@ -16,6 +16,7 @@ from __future__ import annotations
 from pathlib import Path
 import json
 
+from fizban_agent_config import load_agent_dict_from_v2
 from fizban_gods import compute_favor_for_world
 from fizban_level_tree import (
     load_level_tree,
@@ -24,35 +25,6 @@ from fizban_level_tree import (
 )
 
 
-def _load_agent_from_v2(path: Path) -> dict:
-    data = json.loads(path.read_text(encoding="utf-8"))
-    name = data.get("name", path.stem)
-    alignment = data.get("alignment", {})
-    cls = data.get("class", {})
-    tags = data.get("tags", [])
-    fate_baseline = data.get(
-        "fate_baseline",
-        {"grace": 0.5, "bounce_back": 0.5, "mental_strain": 0.1, "weird_mode": False},
-    )
-    level = cls.get("level", data.get("level", 1))
-
-    return {
-        "name": name,
-        "alignment": alignment,
-        "class": cls,
-        "tags": tags,
-        "fate": {
-            "grace": float(fate_baseline.get("grace", 0.5)),
-            "bounce_back": float(fate_baseline.get("bounce_back", 0.5)),
-            "mental_strain": float(fate_baseline.get("mental_strain", 0.1)),
-            "weird_mode": bool(fate_baseline.get("weird_mode", False)),
-        },
-        "favor": {},
-        "unlocks": {"level_nodes": []},
-        "level": int(level),
-    }
-
-
 def main() -> int:
     base_dir = Path(__file__).resolve().parent
     examples_dir = base_dir / "examples"
@@ -61,8 +33,8 @@ def main() -> int:
     paladin_path = examples_dir / "agent_paladin_v2.json"
     puck_path = examples_dir / "agent_puck_v2.json"
 
-    paladin = _load_agent_from_v2(paladin_path)
-    puck = _load_agent_from_v2(puck_path)
+    paladin = load_agent_dict_from_v2(paladin_path)
+    puck = load_agent_dict_from_v2(puck_path)
 
     world = {"agents": {"Paladin": paladin, "Puck": puck}}
 
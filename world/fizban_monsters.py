@@ -12,12 +12,16 @@ an XP budget and a concrete monster group.
 
 from __future__ import annotations
 
-import json
 import math
 import random
-from dataclasses import dataclass, asdict
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
+
+from fizban_json import load_json_path, print_json
 
 
 ROOT = Path(__file__).resolve().parent
@@ -25,7 +29,7 @@ BESTIARY_PATH = ROOT / "monsters" / "core_bestary.json"
 DIFFICULTY_PROFILE_PATH = ROOT / "difficulty_profile.json"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MonsterArchetype:
   id: str
   name: str
@@ -54,7 +58,7 @@ class MonsterArchetype:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class EncounterMonster:
   archetype_id: str
   name: str
@@ -77,16 +81,113 @@ class EncounterSeed:
   notes: List[str]
 
 
+@lru_cache(maxsize=None)
 def load_bestiary(path: Path = BESTIARY_PATH) -> Dict[str, MonsterArchetype]:
-  data = json.loads(path.read_text())
+  """
+  Parse the bestiary once per path; later calls reuse the same dict.
+  Callers must treat the result as read-only.
+  """
+  data = load_json_path(path)
   result: Dict[str, MonsterArchetype] = {}
   for mid, mdata in data.items():
     result[mid] = MonsterArchetype.from_dict(mdata)
   return result
 
 
+@dataclass(slots=True)
+class RegionColumns:
+  """
+  Column layout (struct-of-arrays) of one region's monsters, sorted by CR.
+  `order` is each monster's position in the bestiary, so candidate lists
+  can come back in bestiary order, as the plain scan returned them.
+  """
+  crs: List[float] = field(default_factory=list)
+  order: List[int] = field(default_factory=list)
+  ids: List[str] = field(default_factory=list)
+  monsters: List[MonsterArchetype] = field(default_factory=list)
+
+
+@dataclass
+class BestiaryIndex:
+  """
+  Lookup tables built once per bestiary:
+   - by_region: region tag -> RegionColumns sorted by cr
+   - by_tag:    monster tag -> set of monster ids
+  """
+  by_region: Dict[str, RegionColumns] = field(default_factory=dict)
+  by_tag: Dict[str, Set[str]] = field(default_factory=dict)
+
+
+def build_bestiary_index(bestiary: Dict[str, MonsterArchetype]) -> BestiaryIndex:
+  index = BestiaryIndex()
+  rows: Dict[str, List[Tuple[float, int, MonsterArchetype]]] = {}
+  for pos, m in enumerate(bestiary.values()):
+    for region in m.region_tags:
+      rows.setdefault(region, []).append((m.cr, pos, m))
+    for tag in m.tags:
+      index.by_tag.setdefault(tag, set()).add(m.id)
+  for region, entries in rows.items():
+    entries.sort(key=lambda e: (e[0], e[1]))
+    index.by_region[region] = RegionColumns(
+      crs=[e[0] for e in entries],
+      order=[e[1] for e in entries],
+      ids=[e[2].id for e in entries],
+      monsters=[e[2] for e in entries],
+    )
+  return index
+
+
+@lru_cache(maxsize=None)
+def load_bestiary_index(path: Path = BESTIARY_PATH) -> BestiaryIndex:
+  return build_bestiary_index(load_bestiary(path))
+
+
+@lru_cache(maxsize=None)
 def load_difficulty_profile(path: Path = DIFFICULTY_PROFILE_PATH) -> Dict[str, Any]:
-  return json.loads(path.read_text())
+  """Cached like load_bestiary; treat the returned profile as read-only."""
+  return load_json_path(path)
+
+
+# Rough number of monster groups that fill an encounter's XP window
+_EST_PICKS_PER_ENCOUNTER = 2
+
+# Group-size range per role; roles not listed (incl. elite) come alone
+_ROLE_COUNT_RANGE: Dict[str, Tuple[int, int]] = {
+  "minion": (2, 5),
+  "standard": (1, 3),
+  "skirmisher": (1, 3),
+  "controller": (1, 3),
+}
+
+# Midpoint of each role's count range
+_ROLE_EXPECTED_COUNT: Dict[str, float] = {
+  role: (lo + hi) / 2.0 for role, (lo, hi) in _ROLE_COUNT_RANGE.items()
+}
+
+# How often each role is drawn when filling an encounter
+_ROLE_PICK_WEIGHT: Dict[str, float] = {
+  "minion": 0.3,
+  "standard": 0.5,
+  "elite": 0.1,
+  "skirmisher": 0.05,
+  "controller": 0.05,
+}
+_ROLE_PICK_WEIGHT_DEFAULT = 0.05
+
+
+def _weighted_pick(cum_weights: List[float], rng: random.Random) -> int:
+  """Index drawn from a cumulative weight table (same scheme as random.choices)."""
+  return bisect_right(cum_weights, rng.random() * cum_weights[-1], 0, len(cum_weights) - 1)
+
+
+# Baseline: easy ~25*lvl, medium ~50*lvl, hard ~75*lvl, deadly ~100*lvl
+_XP_PER_LEVEL_BY_DIFFICULTY: Dict[str, int] = {
+  "easy": 25,
+  "medium": 50,
+  "hard": 75,
+  "deadly": 100,
+}
+_XP_PER_LEVEL_DEFAULT = 50  # default medium-ish
 
 
 def _xp_threshold_per_level(level: int, difficulty: str) -> int:
@@ -94,21 +195,12 @@ def _xp_threshold_per_level(level: int, difficulty: str) -> int:
   Rough XP thresholds per character per difficulty, inspired by 5e values
   but simplified and fuzzed for our purposes.
   """
-  # Baseline: easy ~25*lvl, medium ~50*lvl, hard ~75*lvl, deadly ~100*lvl
-  base = level * 25
-  if difficulty == "easy":
-    return base
-  if difficulty == "medium":
-    return base * 2
-  if difficulty == "hard":
-    return base * 3
-  if difficulty == "deadly":
-    return base * 4
-  return base * 2  # default medium-ish
+  return level * _XP_PER_LEVEL_BY_DIFFICULTY.get(difficulty, _XP_PER_LEVEL_DEFAULT)
 
 
 def _target_xp_budget(party_levels: List[int], difficulty: str, world_scalar: float) -> int:
-  per_char = sum(_xp_threshold_per_level(lv, difficulty) for lv in party_levels)
+  # Thresholds are linear in level, so one table lookup covers the whole party.
+  per_char = sum(party_levels) * _XP_PER_LEVEL_BY_DIFFICULTY.get(difficulty, _XP_PER_LEVEL_DEFAULT)
   return int(per_char * world_scalar)
 
 
@@ -118,8 +210,13 @@ def _candidate_monsters_for_region(
   desired_cr_min: float,
   desired_cr_max: float,
   required_tags: Optional[List[str]] = None,
+  index: Optional[BestiaryIndex] = None,
 ) -> List[MonsterArchetype]:
   required_tags = required_tags or []
+  if index is not None:
+    return _candidate_monsters_from_index(
+      index, region_id, desired_cr_min, desired_cr_max, required_tags
+    )
   out: List[MonsterArchetype] = []
   for m in bestiary.values():
     if region_id not in m.region_tags:
@@ -132,6 +229,29 @@ def _candidate_monsters_for_region(
   return out
 
 
+def _candidate_monsters_from_index(
+  index: BestiaryIndex,
+  region_id: str,
+  desired_cr_min: float,
+  desired_cr_max: float,
+  required_tags: List[str],
+) -> List[MonsterArchetype]:
+  """Same result as the linear scan, via bisect on the region's CR column."""
+  cols = index.by_region.get(region_id)
+  if cols is None:
+    return []
+  crs = cols.crs
+  picks = range(bisect_left(crs, desired_cr_min), bisect_right(crs, desired_cr_max))
+  if required_tags:
+    allowed: Set[str] = set()
+    for t in required_tags:
+      allowed |= index.by_tag.get(t, set())
+    ids = cols.ids
+    picks = [i for i in picks if ids[i] in allowed]
+  monsters = cols.monsters
+  return [monsters[i] for i in sorted(picks, key=cols.order.__getitem__)]
+
+
 def _cr_band_for_region(
   profile: Dict[str, Any],
   region_id: str,
@@ -154,6 +274,15 @@ def _cr_band_for_region(
   return max(0.125, base_cr - cr_var), max(0.25, base_cr + cr_var)
 
 
+@lru_cache(maxsize=512)
+def _default_profile_cr_band(region_id: str, avg_party_level: float) -> Tuple[float, float]:
+  """
+  _cr_band_for_region against the (cached) default difficulty profile.
+  Encounters for the same region and party level share one computation.
+  """
+  return _cr_band_for_region(load_difficulty_profile(), region_id, avg_party_level)
+
+
 def build_encounter(
   party: List[Dict[str, Any]],
   region_id: str,
@@ -179,7 +308,7 @@ def build_encounter(
   world_scalar = float(global_profile.get("world_difficulty_scalar", 1.0))
 
   xp_target = _target_xp_budget(party_levels, difficulty, world_scalar)
-  cr_min, cr_max = _cr_band_for_region(profile, region_id, avg_lvl)
+  cr_min, cr_max = _default_profile_cr_band(region_id, avg_lvl)
 
   candidates = _candidate_monsters_for_region(
     bestiary,
@@ -187,6 +316,7 @@ def build_encounter(
     desired_cr_min=cr_min,
     desired_cr_max=cr_max,
     required_tags=required_tags,
+    index=load_bestiary_index(),
   )
   if not candidates:
     # last-resort fallback: any monster in bestiary
@@ -196,27 +326,40 @@ def build_encounter(
   xp_accum = 0
   notes: List[str] = []
 
-  # Bias: at most 1 elite per encounter by default
-  elites_used = 0
+  # Candidates are grouped by role. Each attempt draws a role first, then a
+  # monster within that role from a cumulative table favoring monsters whose
+  # expected group XP is close to one pick's share of the budget. Elites
+  # leave the role table once the cap is hit rather than being drawn and
+  # skipped.
+  per_pick_target = xp_target / _EST_PICKS_PER_ENCOUNTER
+  by_role: Dict[str, Tuple[List[MonsterArchetype], List[float]]] = {}
+  for m in candidates:
+    fit = 1.0 / (1.0 + abs(m.base_xp * _ROLE_EXPECTED_COUNT.get(m.role, 1.0) - per_pick_target))
+    members, cum = by_role.setdefault(m.role, ([], []))
+    members.append(m)
+    cum.append((cum[-1] if cum else 0.0) + fit)
+
+  roles = list(by_role)
+  role_cum = list(accumulate(_ROLE_PICK_WEIGHT.get(r, _ROLE_PICK_WEIGHT_DEFAULT) for r in roles))
 
   # Greedy fill: add monsters until we hit ~70–110% of target
   attempts = 0
-  while xp_accum < xp_target * 0.7 and attempts < 50:
+  while xp_accum < xp_target * 0.7 and attempts < 50 and roles:
     attempts += 1
-    m = rng.choice(candidates)
+
+    role = roles[_weighted_pick(role_cum, rng)]
+    members, cum = by_role[role]
+    m = members[_weighted_pick(cum, rng)]
 
     # Role-based count suggestion
-    if m.role == "minion":
-      count = rng.randint(2, 5)
-    elif m.role in ("standard", "skirmisher", "controller"):
-      count = rng.randint(1, 3)
-    elif m.role == "elite":
-      if elites_used >= 1:
-        continue
-      count = 1
-      elites_used += 1
-    else:
-      count = 1
+    count_range = _ROLE_COUNT_RANGE.get(role)
+    count = rng.randint(*count_range) if count_range else 1
+    if role == "elite":
+      # Bias: at most 1 elite per encounter by default
+      roles.remove("elite")
+      role_cum = list(
+        accumulate(_ROLE_PICK_WEIGHT.get(r, _ROLE_PICK_WEIGHT_DEFAULT) for r in roles)
+      )
 
     xp_add = m.base_xp * count
     if xp_accum + xp_add > xp_target * 1.1 and monsters_out:
@@ -230,7 +373,7 @@ def build_encounter(
         count=count,
         cr=m.cr,
         role=m.role,
-        tags=m.tags,
+        tags=list(m.tags),
         xp_each=m.base_xp,
         xp_total=m.base_xp * count,
       )
@@ -247,7 +390,7 @@ def build_encounter(
         count=1,
         cr=m.cr,
         role=m.role,
-        tags=m.tags,
+        tags=list(m.tags),
         xp_each=m.base_xp,
         xp_total=m.base_xp,
       )
@@ -295,5 +438,5 @@ if __name__ == "__main__":
     region_id="STARTING_FOREST",
     difficulty="medium",
   )
-  print(json.dumps(encounter_to_dict(enc), indent=2))
+  print_json(encounter_to_dict(enc))
 
@@ -8,8 +8,7 @@ and difficulties, using difficulty_profile.json.
 
 from __future__ import annotations
 
-import json
-
+from fizban_json import print_json
 from fizban_monsters import build_encounter, encounter_to_dict
 
 
@@ -40,7 +39,7 @@ def main() -> None:
     "forest_hard": encounter_to_dict(enc_forest_hard),
     "border_medium": encounter_to_dict(enc_border_medium),
   }
-  print(json.dumps(out, indent=2))
+  print_json(out)
 
 
 if __name__ == "__main__":
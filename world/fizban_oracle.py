@@ -12,61 +12,82 @@ and produces a set of oracle cards a DM or UI can show.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+import heapq
+import re
+from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Set
 
-from fizban_world_state import build_world_state
-from fizban_world_enrich import enrich_world
-from fizban_god_reactions import compute_god_reactions
 
-
-@dataclass
+@dataclass(slots=True)
 class OracleCard:
     patron: str
     headline: str
     lines: List[str]
     omen_tags: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe dict; same shape as dataclasses.asdict without the deepcopy."""
+        return {
+            "patron": self.patron,
+            "headline": self.headline,
+            "lines": list(self.lines),
+            "omen_tags": list(self.omen_tags),
+        }
+
+
+_OMEN_KEYWORDS = (
+    "forest",
+    "trade",
+    "love",
+    "lovers",
+    "betray",
+    "betrayal",
+    "bloodline",
+    "angel",
+    "demon",
+    "weird",
+    "dream",
+    "curse",
+    "war",
+    "peace",
+    "oath",
+    "trickster",
+)
+
+# One left-to-right scan for every keyword: the lookahead reports a hit at each
+# position (longest keyword first), and each hit expands to every keyword it
+# contains, so "lovers" still tags "love" exactly as separate substring checks did.
+_OMEN_RE = re.compile(
+    "(?=(%s))" % "|".join(map(re.escape, sorted(_OMEN_KEYWORDS, key=len, reverse=True)))
+)
+_OMEN_IMPLIED = {
+    key: frozenset(k for k in _OMEN_KEYWORDS if k in key) for key in _OMEN_KEYWORDS
+}
+
 
 def _make_omen_tags(headline: str, lines: List[str]) -> List[str]:
     """
     Very simple tag extractor from the reaction text.
     This is where we can later get fancy (LLM / pattern tables / DM overrides).
     """
-    blob = (headline + " " + " ".join(lines)).lower()
-    tags: List[str] = []
-
-    keywords = [
-        "forest",
-        "trade",
-        "love",
-        "lovers",
-        "betray",
-        "betrayal",
-        "bloodline",
-        "angel",
-        "demon",
-        "weird",
-        "dream",
-        "curse",
-        "war",
-        "peace",
-        "oath",
-        "trickster",
-    ]
-
-    for key in keywords:
-        if key in blob:
-            tags.append(key)
-
-    # Deduplicate while preserving order
-    seen = set()
-    result: List[str] = []
-    for t in tags:
-        if t not in seen:
-            seen.add(t)
-            result.append(t)
-    return result
+    blob = " ".join((headline, *lines)).lower()
+
+    hits: Set[str] = set()
+    for key in set(_OMEN_RE.findall(blob)):
+        hits |= _OMEN_IMPLIED[key]
+
+    # Keyword order, one entry per keyword
+    return [key for key in _OMEN_KEYWORDS if key in hits]
+
+
+_by_patron = attrgetter("patron")
+
+
+def _focus_score(card: OracleCard, focus: str) -> int:
+    """How often the focus agent is mentioned in a card's lines."""
+    return sum(line.count(focus) for line in card.lines)
 
 
 def build_oracle_spread(
@@ -81,6 +102,14 @@ def build_oracle_spread(
     - world_enriched: output from enrich_world(...)
     - focus_agent: if set, we prioritize cards whose text mentions this agent
     """
+    if max_cards <= 0:
+        # Nothing to show: skip the reactions import and computation entirely
+        return []
+
+    # Sibling modules are imported on first use so that importing this module
+    # for OracleCard / tag helpers does not pull in the whole world pipeline.
+    from fizban_god_reactions import compute_god_reactions
+
     # fizban_god_reactions expects a full world (enriched, including favor/traits)
     reactions = compute_god_reactions(world_enriched)
 
@@ -102,18 +131,10 @@ def build_oracle_spread(
     # If we have a focus agent (e.g. "Paladin" or player's name),
     # prioritize patrons whose lines talk about that agent.
     if focus_agent:
-        focus = focus_agent
+        return heapq.nlargest(max_cards, cards, key=partial(_focus_score, focus=focus_agent))
 
-        def score(card: OracleCard) -> int:
-            txt = " ".join(card.lines)
-            return txt.count(focus)
-
-        cards.sort(key=score, reverse=True)
-    else:
-        # Stable sort by patron name for deterministic ordering
-        cards.sort(key=lambda c: c.patron)
-
-    return cards[:max_cards]
+    # Stable order by patron name for deterministic ordering
+    return heapq.nsmallest(max_cards, cards, key=_by_patron)
 
 
 def build_default_oracle_payload(
@@ -128,6 +149,9 @@ def build_default_oracle_payload(
       - computes oracle spread
     Returns a JSON-safe dict.
     """
+    from fizban_world_state import build_world_state
+    from fizban_world_enrich import enrich_world
+
     world = build_world_state()
     world_enriched = enrich_world(world)
 
@@ -139,16 +163,14 @@ def build_default_oracle_payload(
 
     return {
         "world_final": world_enriched["world_final"],
-        "oracle_spread": [asdict(card) for card in spread],
+        "oracle_spread": [card.to_dict() for card in spread],
     }
 
 
 if __name__ == "__main__":
     # CLI entry: print just the oracle_spread as pretty JSON
-    import json
-    import sys
+    from fizban_json import print_json
 
     payload = build_default_oracle_payload()
-    json.dump(payload["oracle_spread"], sys.stdout, indent=2)
-    print()
+    print_json(payload["oracle_spread"])
 
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 
-import json
-import sys
-
+from fizban_json import print_json
 from fizban_oracle import build_default_oracle_payload
 
 
@@ -13,8 +11,7 @@ def main() -> None:
     )
 
     # For now just print the spread; caller can pipe to jq or UI.
-    json.dump(payload["oracle_spread"], sys.stdout, indent=2)
-    print()
+    print_json(payload["oracle_spread"])
 
 
 if __name__ == "__main__":
@@ -14,9 +14,10 @@ from __future__ import annotations
 
 from pathlib import Path
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
 
-from fizban_level_menu import _load_agent_from_v2
+from fizban_json import print_json
+from fizban_agent_config import load_agent_dict_from_v2
 from fizban_gods import compute_favor_for_agent
 
 
@@ -27,17 +28,15 @@ def _load_paladin_tree(base_dir: Path) -> Dict[str, Any]:
 
 
 def _is_node_eligible(
-    agent: Dict[str, Any],
+    level: int,
     favor: Dict[str, float],
-    unlocked_nodes: List[str],
+    unlocked_set: Set[str],
     node: Dict[str, Any],
 ) -> bool:
     requires = node.get("requires", {})
 
-    # Level gate
-    min_level = int(requires.get("min_level", 0))
-    level = int(agent.get("class", {}).get("level", 0))
-    if level < min_level:
+    # Level gate (agent level is read once by the caller)
+    if level < int(requires.get("min_level", 0)):
         return False
 
     # Favor gates
@@ -47,12 +46,9 @@ def _is_node_eligible(
             return False
 
     # Prereq nodes (by node_id)
-    prereq_nodes = requires.get("prereq_nodes", [])
-    if prereq_nodes:
-        unlocked_set = set(unlocked_nodes)
-        for nid in prereq_nodes:
-            if nid not in unlocked_set:
-                return False
+    for nid in requires.get("prereq_nodes", []):
+        if nid not in unlocked_set:
+            return False
 
     # Alignment hint is *advisory*; we don't enforce it here
     return True
@@ -63,7 +59,7 @@ def _demo() -> int:
     examples_dir = base_dir / "examples"
 
     paladin_path = examples_dir / "agent_paladin_v2.json"
-    paladin = _load_agent_from_v2(paladin_path)
+    paladin = load_agent_dict_from_v2(paladin_path)
 
     tree = _load_paladin_tree(base_dir)
     favor = compute_favor_for_agent(paladin)
@@ -72,9 +68,12 @@ def _demo() -> int:
         paladin.get("unlocks", {}).get("level_nodes", []) or []
     )
 
+    level = int(paladin.get("class", {}).get("level", 0))
+    unlocked_set = set(unlocked_nodes)
+
     eligible_nodes: List[Dict[str, Any]] = []
     for node in tree.get("nodes", []):
-        if _is_node_eligible(paladin, favor, unlocked_nodes, node):
+        if _is_node_eligible(level, favor, unlocked_set, node):
             eligible_nodes.append(
                 {
                     "tree_id": tree.get("tree_id"),
@@ -94,7 +93,7 @@ def _demo() -> int:
         "eligible_nodes": eligible_nodes,
     }
 
-    print(json.dumps(out, indent=2))
+    print_json(out)
     return 0
 
 
@@ -41,7 +41,6 @@ Outputs:
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Dict, List, Tuple, Any
 
 
@@ -51,27 +50,18 @@ def _apply_favor_delta(
     scale: float = 1.0,
 ) -> Dict[str, float]:
     """Apply a scaled favor delta, clamped to [0, 1]."""
-    new_favor = dict(favor)
-    for patron, dv in delta.items():
-        v = new_favor.get(patron, 0.0)
-        v += dv * scale
-        if v < 0.0:
-            v = 0.0
-        if v > 1.0:
-            v = 1.0
-        new_favor[patron] = v
+    get = favor.get
+    new_favor = favor.copy()
+    new_favor.update(
+        {p: min(1.0, max(0.0, get(p, 0.0) + dv * scale)) for p, dv in delta.items()}
+    )
     return new_favor
 
 
 def _merge_unique(base: List[str], extra: List[str]) -> List[str]:
     """Append entries from extra that are not yet in base."""
     s = set(base)
-    out = list(base)
-    for x in extra:
-        if x not in s:
-            out.append(x)
-            s.add(x)
-    return out
+    return base + [x for x in dict.fromkeys(extra) if x not in s]
 
 
 def _maybe_generate_betrayal_curse(
@@ -108,6 +98,72 @@ def _maybe_generate_betrayal_curse(
     }
 
 
+def _favor_change(before: Dict[str, float], after: Dict[str, float]) -> Dict[str, float]:
+    """Record what actually changed, relative to the original favor."""
+    changed: Dict[str, float] = {}
+    for k, v_after in after.items():
+        d = v_after - before.get(k, 0.0)
+        if abs(d) > 1e-9:
+            changed[k] = d
+    return changed
+
+
+def _apply_reward(agent: Dict[str, Any], quest: Dict[str, Any], scale: float) -> Dict[str, float]:
+    """Scaled favor delta + all granted traits/abilities."""
+    reward = quest.get("reward", {})
+    favor = agent["favor"]
+    new_favor = _apply_favor_delta(favor, reward.get("favor_delta", {}) or {}, scale=scale)
+    agent["favor"] = new_favor
+    agent["traits"] = _merge_unique(agent["traits"], reward.get("grant_traits", []) or [])
+    agent["abilities"] = _merge_unique(agent["abilities"], reward.get("grant_abilities", []) or [])
+    return _favor_change(favor, new_favor)
+
+
+def _apply_success(agent: Dict[str, Any], quest: Dict[str, Any]) -> Dict[str, float]:
+    # Full favor delta + all traits/abilities.
+    applied_favor_delta = _apply_reward(agent, quest, 1.0)
+
+    # Maybe add betrayal curse if this quest pits patrons against each other
+    curse = _maybe_generate_betrayal_curse(
+        agent_name=agent.get("name", "Unknown"),
+        quest=quest,
+        reward_favor_delta=quest.get("reward", {}).get("favor_delta", {}) or {},
+    )
+    if curse is not None:
+        agent["curses"].append(curse)
+    return applied_favor_delta
+
+
+def _apply_partial(agent: Dict[str, Any], quest: Dict[str, Any]) -> Dict[str, float]:
+    # Half favor, full traits/abilities, no betrayal curse.
+    return _apply_reward(agent, quest, 0.5)
+
+
+def _apply_failure(agent: Dict[str, Any], quest: Dict[str, Any]) -> Dict[str, float]:
+    # Patron is disappointed: small negative favor from patron only.
+    # Also add a 'quest_failed_*' trait as a scar/hook.
+    applied_favor_delta: Dict[str, float] = {}
+    patron = quest.get("patron")
+    if patron:
+        favor = agent["favor"]
+        new_favor = _apply_favor_delta(favor, {patron: -0.1}, scale=1.0)
+        applied_favor_delta = _favor_change(favor, new_favor)
+        agent["favor"] = new_favor
+
+    fail_trait = f"quest_failed_{quest.get('id', 'unknown').lower()}"
+    agent["traits"] = _merge_unique(agent["traits"], [fail_trait])
+    return applied_favor_delta
+
+
+# result -> handler that updates the agent copy in place and returns the
+# applied favor delta
+_APPLY_BY_RESULT = {
+    "success": _apply_success,
+    "partial": _apply_partial,
+    "failure": _apply_failure,
+}
+
+
 def apply_quest_outcome(
     agent_state: Dict[str, Any],
     quest: Dict[str, Any],
@@ -120,79 +176,34 @@ def apply_quest_outcome(
       - "success": full rewards + possible betrayal curse
       - "partial": half favor, full traits/abilities, no betrayal curse
       - "failure": small negative favor from the patron, and a 'quest_failed_*' trait
-    """
-    if result not in {"success", "partial", "failure"}:
-        raise ValueError(f"Invalid result: {result}")
 
-    agent = deepcopy(agent_state)
+    agent_state is never mutated. The returned agent gets new favor / traits /
+    abilities / curses containers, but other nested values (and the individual
+    curse dicts) are shared with agent_state, so copy them before mutating.
+    """
+    try:
+        apply_result = _APPLY_BY_RESULT[result]
+    except KeyError:
+        raise ValueError(f"Invalid result: {result}") from None
+
+    # Shallow copy with fresh favor/traits/abilities/curses containers;
+    # everything else is shared with agent_state.
+    agent = dict(agent_state)
     name = agent.get("name", "Unknown")
-    favor = dict(agent.get("favor", {}))
-    traits = list(agent.get("traits", []))
-    abilities = list(agent.get("abilities", []))
-    curses = list(agent.get("curses", []))
+    agent["favor"] = dict(agent.get("favor", {}))
+    agent["traits"] = list(agent.get("traits", []))
+    agent["abilities"] = list(agent.get("abilities", []))
+    agent["curses"] = list(agent.get("curses", []))
 
-    patron = quest.get("patron")
-    reward = quest.get("reward", {})
-    favor_delta = reward.get("favor_delta", {}) or {}
-    grant_traits = reward.get("grant_traits", []) or []
-    grant_abilities = reward.get("grant_abilities", []) or []
-
-    applied_favor_delta: Dict[str, float] = {}
+    applied_favor_delta = apply_result(agent, quest)
+    traits = agent["traits"]
+    abilities = agent["abilities"]
+    curses = agent["curses"]
 
-    if result == "success":
-        # Full favor delta + all traits/abilities.
-        new_favor = _apply_favor_delta(favor, favor_delta, scale=1.0)
-        # Record what actually changed, relative to original favor
-        for k, v_after in new_favor.items():
-            v_before = favor.get(k, 0.0)
-            if abs(v_after - v_before) > 1e-9:
-                applied_favor_delta[k] = v_after - v_before
-        favor = new_favor
-
-        traits = _merge_unique(traits, grant_traits)
-        abilities = _merge_unique(abilities, grant_abilities)
-
-        # Maybe add betrayal curse if this quest pits patrons against each other
-        curse = _maybe_generate_betrayal_curse(
-            agent_name=name,
-            quest=quest,
-            reward_favor_delta=favor_delta,
-        )
-        if curse is not None:
-            curses.append(curse)
-
-    elif result == "partial":
-        # Half favor, full traits/abilities, no betrayal curse.
-        new_favor = _apply_favor_delta(favor, favor_delta, scale=0.5)
-        for k, v_after in new_favor.items():
-            v_before = favor.get(k, 0.0)
-            if abs(v_after - v_before) > 1e-9:
-                applied_favor_delta[k] = v_after - v_before
-        favor = new_favor
-
-        traits = _merge_unique(traits, grant_traits)
-        abilities = _merge_unique(abilities, grant_abilities)
-
-    else:  # "failure"
-        # Patron is disappointed: small negative favor from patron only.
-        # Also add a 'quest_failed_*' trait as a scar/hook.
-        penalty = -0.1
-        if patron:
-            new_favor = _apply_favor_delta(favor, {patron: penalty}, scale=1.0)
-            v_before = favor.get(patron, 0.0)
-            v_after = new_favor.get(patron, 0.0)
-            if abs(v_after - v_before) > 1e-9:
-                applied_favor_delta[patron] = v_after - v_before
-            favor = new_favor
-
-        fail_trait = f"quest_failed_{quest.get('id', 'unknown').lower()}"
-        traits = _merge_unique(traits, [fail_trait])
-
-    # Write back updated fields
-    agent["favor"] = favor
-    agent["traits"] = traits
-    agent["abilities"] = abilities
-    agent["curses"] = curses
+    orig_traits = set(agent_state.get("traits", []))
+    orig_abilities = set(agent_state.get("abilities", []))
+    # Existing curse dicts are carried over by identity (see above)
+    orig_curse_ids = {id(c) for c in agent_state.get("curses", [])}
 
     outcome_summary = {
         "agent": name,
@@ -200,9 +211,9 @@ def apply_quest_outcome(
         "quest_title": quest.get("title"),
         "result": result,
         "applied_favor_delta": applied_favor_delta,
-        "gained_traits": [t for t in traits if t not in agent_state.get("traits", [])],
-        "gained_abilities": [a for a in abilities if a not in agent_state.get("abilities", [])],
-        "new_curses": [c for c in curses if c not in agent_state.get("curses", [])],
+        "gained_traits": [t for t in traits if t not in orig_traits],
+        "gained_abilities": [a for a in abilities if a not in orig_abilities],
+        "new_curses": [c for c in curses if id(c) not in orig_curse_ids],
     }
     return agent, outcome_summary
 
@@ -3,7 +3,7 @@
 fizban_quest_outcome_demo.py - Show how quest outcomes modify agents.
 
 This uses:
-- fizban_quests.generate_quests_for_agent
+- fizban_quests.generate_quest_offer_dicts
 - fizban_quest_outcome.apply_quest_outcome
 
 and prints before/after snapshots + summaries.
@@ -11,9 +11,8 @@ and prints before/after snapshots + summaries.
 
 from __future__ import annotations
 
-import json
-
-from fizban_quests import generate_quests_for_agent
+from fizban_json import print_json
+from fizban_quests import generate_quest_offer_dicts
 from fizban_quest_outcome import apply_quest_outcome
 
 
@@ -80,22 +79,18 @@ def pick_quest(offers, quest_id_prefix: str | None = None):
 def main():
     paladin, puck = build_demo_agents()
 
-    paladin_offers = [
-        q.__dict__ for q in generate_quests_for_agent(
-            agent_name=paladin["name"],
-            level=paladin["level"],
-            traits=paladin["traits"],
-            favor=paladin["favor"],
-        )
-    ]
-    puck_offers = [
-        q.__dict__ for q in generate_quests_for_agent(
-            agent_name=puck["name"],
-            level=puck["level"],
-            traits=puck["traits"],
-            favor=puck["favor"],
-        )
-    ]
+    paladin_offers = generate_quest_offer_dicts(
+        agent_name=paladin["name"],
+        level=paladin["level"],
+        traits=paladin["traits"],
+        favor=paladin["favor"],
+    )
+    puck_offers = generate_quest_offer_dicts(
+        agent_name=puck["name"],
+        level=puck["level"],
+        traits=puck["traits"],
+        favor=puck["favor"],
+    )
 
     # 1) Paladin: King border quest (success)
     king_quest = pick_quest(paladin_offers, quest_id_prefix="Q_KING_DEFEND_BORDER")
@@ -140,7 +135,7 @@ def main():
             "puck_offers_ids": [q["id"] for q in puck_offers],
         },
     }
-    print(json.dumps(out, indent=2))
+    print_json(out)
 
 
 if __name__ == "__main__":
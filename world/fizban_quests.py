@@ -18,19 +18,53 @@ Each quest offer includes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Any
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Tuple
 
 
 # ----- Data structures ------------------------------------------------------
 
 
+_DANGER_WEIGHT: Dict[str, float] = {"low": 0.0, "medium": 0.5, "high": 1.0}
+
+# Bit per trait named in any quest requirement, assigned as templates load.
+# Traits no template asks about have no bit and never matter.
+_TRAIT_BITS: Dict[str, int] = {}
+
+
+def _requirement_mask(traits: Tuple[str, ...] | None) -> int:
+    mask = 0
+    for t in traits or ():
+        mask |= _TRAIT_BITS.setdefault(t, 1 << len(_TRAIT_BITS))
+    return mask
+
+
+def _agent_trait_mask(traits: List[str]) -> int:
+    mask = 0
+    for t in traits:
+        mask |= _TRAIT_BITS.get(t, 0)
+    return mask
+
+
 @dataclass
 class QuestRequirements:
     min_level: int = 1
     min_favor: float = 0.0  # for the patron making the offer
-    required_traits_any: List[str] | None = None
-    required_traits_all: List[str] | None = None
+    required_traits_any: Tuple[str, ...] | None = None
+    required_traits_all: Tuple[str, ...] | None = None
+
+    def __post_init__(self) -> None:
+        # Stored as tuples: immutable, shared safely by every offer, and they
+        # serialize exactly like the lists they are declared with.
+        if self.required_traits_any is not None:
+            self.required_traits_any = tuple(self.required_traits_any)
+        if self.required_traits_all is not None:
+            self.required_traits_all = tuple(self.required_traits_all)
+        # Trait gates as bitmasks. Plain attributes rather than fields, so
+        # they stay out of the requirements dict shown on offers.
+        self._any_mask = _requirement_mask(self.required_traits_any)
+        self._all_mask = _requirement_mask(self.required_traits_all)
 
 
 @dataclass
@@ -42,6 +76,25 @@ class QuestReward:
     notes: str
 
 
+def _requirements_to_dict(req: QuestRequirements) -> Dict[str, Any]:
+    # Same shape as asdict(); the trait tuples are immutable and shared as-is
+    return {
+        "min_level": req.min_level,
+        "min_favor": req.min_favor,
+        "required_traits_any": req.required_traits_any,
+        "required_traits_all": req.required_traits_all,
+    }
+
+
+def _reward_to_dict(reward: QuestReward) -> Dict[str, Any]:
+    return {
+        "favor_delta": dict(reward.favor_delta),
+        "grant_traits": list(reward.grant_traits),
+        "grant_abilities": list(reward.grant_abilities),
+        "notes": reward.notes,
+    }
+
+
 @dataclass
 class QuestTemplate:
     id: str
@@ -54,6 +107,18 @@ class QuestTemplate:
     requirements: QuestRequirements
     reward: QuestReward
 
+    # Offer-shaped dicts, materialized once per template and shared (not
+    # copied) by every offer built from it
+    _reward_dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    _requirements_dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    # Danger's share of the offer importance score
+    _danger_bonus: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._reward_dict = _reward_to_dict(self.reward)
+        self._requirements_dict = _requirements_to_dict(self.requirements)
+        self._danger_bonus = _DANGER_WEIGHT.get(self.danger, 0.0) * 0.1
+
 
 @dataclass
 class QuestOffer:
@@ -65,6 +130,7 @@ class QuestOffer:
     danger: str
     tags: List[str]
     summary: str
+    # Shared by every offer made from the same template: treat as read-only.
     reward: Dict[str, Any]
     requirements: Dict[str, Any]
 
@@ -263,12 +329,41 @@ def _build_quest_templates() -> List[QuestTemplate]:
 QUEST_TEMPLATES: List[QuestTemplate] = _build_quest_templates()
 
 
+def _index_templates_by_patron(
+    templates: List[QuestTemplate],
+) -> Dict[str, List[Tuple[int, QuestTemplate]]]:
+    """
+    Group templates by patron, keeping each one's position in the library.
+    Each group is ordered by min_level so a level cutoff is a bisect.
+    """
+    by_patron: Dict[str, List[Tuple[int, QuestTemplate]]] = {}
+    for pos, tmpl in enumerate(templates):
+        by_patron.setdefault(tmpl.patron, []).append((pos, tmpl))
+    for group in by_patron.values():
+        group.sort(key=lambda entry: entry[1].requirements.min_level)
+    return by_patron
+
+
+_TEMPLATES_BY_PATRON = _index_templates_by_patron(QUEST_TEMPLATES)
+
+# Lowest min_favor among a patron's templates: below it, none can be offered.
+_MIN_FAVOR_BY_PATRON: Dict[str, float] = {
+    patron: min(tmpl.requirements.min_favor for _, tmpl in group)
+    for patron, group in _TEMPLATES_BY_PATRON.items()
+}
+
+_MIN_LEVELS_BY_PATRON: Dict[str, List[int]] = {
+    patron: [tmpl.requirements.min_level for _, tmpl in group]
+    for patron, group in _TEMPLATES_BY_PATRON.items()
+}
+
+
 # ----- Core engine: filtering & generation ----------------------------------
 
 
 def _agent_meets_requirements(
     level: int,
-    traits: List[str],
+    traits_mask: int,
     patron_favor: float,
     req: QuestRequirements,
 ) -> bool:
@@ -277,19 +372,43 @@ def _agent_meets_requirements(
     if patron_favor < req.min_favor:
         return False
 
-    traits_set = set(traits)
-
-    if req.required_traits_any:
-        if not traits_set.intersection(req.required_traits_any):
-            return False
+    # traits_mask comes from _agent_trait_mask; an empty requirement is mask 0
+    if req._any_mask and not (traits_mask & req._any_mask):
+        return False
 
-    if req.required_traits_all:
-        if not set(req.required_traits_all).issubset(traits_set):
-            return False
+    if (traits_mask & req._all_mask) != req._all_mask:
+        return False
 
     return True
 
 
+def _offered_templates(
+    level: int,
+    traits: List[str],
+    favor: Dict[str, float],
+) -> List[QuestTemplate]:
+    """Templates the agent qualifies for, most important first."""
+    traits_mask = _agent_trait_mask(traits)
+
+    # (-importance, library position, template): importance is higher favor
+    # with that patron, then danger
+    scored: List[Tuple[float, int, QuestTemplate]] = []
+    for patron, group in _TEMPLATES_BY_PATRON.items():
+        patron_favor = favor.get(patron, 0.0)
+        if patron_favor < _MIN_FAVOR_BY_PATRON[patron]:
+            continue
+        cutoff = bisect_right(_MIN_LEVELS_BY_PATRON[patron], level)
+        for pos, tmpl in group[:cutoff]:
+            if _agent_meets_requirements(level, traits_mask, patron_favor, tmpl.requirements):
+                score = patron_favor + tmpl._danger_bonus
+                scored.append((-score, pos, tmpl))
+
+    # Most important first; positions are unique, so equal scores keep the
+    # order of QUEST_TEMPLATES and templates are never compared.
+    scored.sort()
+    return [tmpl for _, _, tmpl in scored]
+
+
 def generate_quests_for_agent(
     *,
     agent_name: str,
@@ -311,16 +430,8 @@ def generate_quests_for_agent(
     favor: Dict[str, float]
         Map patron -> favor score (0.0 to 1.0 recommended).
     """
-    offers: List[QuestOffer] = []
-
-    for tmpl in QUEST_TEMPLATES:
-        patron = tmpl.patron
-        patron_favor = favor.get(patron, 0.0)
-
-        if not _agent_meets_requirements(level, traits, patron_favor, tmpl.requirements):
-            continue
-
-        offer = QuestOffer(
+    return [
+        QuestOffer(
             id=tmpl.id,
             title=tmpl.title,
             patron=tmpl.patron,
@@ -329,20 +440,40 @@ def generate_quests_for_agent(
             danger=tmpl.danger,
             tags=list(tmpl.tags),
             summary=tmpl.summary,
-            reward=asdict(tmpl.reward),
-            requirements=asdict(tmpl.requirements),
+            reward=tmpl._reward_dict,
+            requirements=tmpl._requirements_dict,
         )
-        offers.append(offer)
+        for tmpl in _offered_templates(level, traits, favor)
+    ]
 
-    # Sort by "importance": higher favor with that patron, then danger
-    danger_weight = {"low": 0.0, "medium": 0.5, "high": 1.0}
 
-    def _score(o: QuestOffer) -> float:
-        fav = favor.get(o.patron, 0.0)
-        return fav * 1.0 + danger_weight.get(o.danger, 0.0) * 0.1
-
-    offers.sort(key=_score, reverse=True)
-    return offers
+def generate_quest_offer_dicts(
+    *,
+    agent_name: str,
+    level: int,
+    traits: List[str],
+    favor: Dict[str, float],
+) -> List[Dict[str, Any]]:
+    """
+    Same offers as generate_quests_for_agent, as plain dicts in the QuestOffer
+    shape (what fizban_quest_outcome and the demos consume), without building
+    QuestOffer objects first.
+    """
+    return [
+        {
+            "id": tmpl.id,
+            "title": tmpl.title,
+            "patron": tmpl.patron,
+            "target_patron": tmpl.target_patron,
+            "agent": agent_name,
+            "danger": tmpl.danger,
+            "tags": list(tmpl.tags),
+            "summary": tmpl.summary,
+            "reward": tmpl._reward_dict,
+            "requirements": tmpl._requirements_dict,
+        }
+        for tmpl in _offered_templates(level, traits, favor)
+    ]
 
 
 __all__ = [
@@ -352,5 +483,6 @@ __all__ = [
     "QuestOffer",
     "QUEST_TEMPLATES",
     "generate_quests_for_agent",
+    "generate_quest_offer_dicts",
 ]
 
@@ -12,9 +12,8 @@ Later, you can swap in real world state:
 
 from __future__ import annotations
 
-import json
-
-from fizban_quests import generate_quests_for_agent
+from fizban_json import print_json
+from fizban_quests import generate_quest_offer_dicts
 
 
 def build_demo_agents():
@@ -64,14 +63,14 @@ def build_demo_agents():
 def main():
     paladin, puck = build_demo_agents()
 
-    paladin_offers = generate_quests_for_agent(
+    paladin_offers = generate_quest_offer_dicts(
         agent_name=paladin["name"],
         level=paladin["level"],
         traits=paladin["traits"],
         favor=paladin["favor"],
     )
 
-    puck_offers = generate_quests_for_agent(
+    puck_offers = generate_quest_offer_dicts(
         agent_name=puck["name"],
         level=puck["level"],
         traits=puck["traits"],
@@ -79,10 +78,10 @@ def main():
     )
 
     out = {
-        "paladin_offers": [q.__dict__ for q in paladin_offers],
-        "puck_offers": [q.__dict__ for q in puck_offers],
+        "paladin_offers": paladin_offers,
+        "puck_offers": puck_offers,
     }
-    print(json.dumps(out, indent=2))
+    print_json(out)
 
 
 if __name__ == "__main__":
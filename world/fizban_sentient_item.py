@@ -10,8 +10,8 @@ Sentient items that:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -29,6 +29,17 @@ class SentientVoice:
     alignment_label: str
     alignment_coords: Tuple[float, float]  # (-1..1, -1..1)
 
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "tone_tags": list(self.tone_tags),
+            "desires": list(self.desires),
+            "fears": list(self.fears),
+            "alignment_label": self.alignment_label,
+            "alignment_coords": self.alignment_coords,
+        }
+
 
 @dataclass
 class SentientItem:
@@ -51,7 +62,23 @@ class SentientItem:
     fate_modifiers: Dict[str, float]  # grace_delta, strain_delta, weird_bias etc
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Same shape as dataclasses.asdict, but only the containers are copied
+        return {
+            "id": self.id,
+            "name": self.name,
+            "rank": self.rank,
+            "bound_to": self.bound_to,
+            "origin_bloodline": self.origin_bloodline,
+            "alignment_label": self.alignment_label,
+            "alignment_coords": self.alignment_coords,
+            "voices": [v.to_dict() for v in self.voices],
+            "personality_tags": list(self.personality_tags),
+            "bond_depth": self.bond_depth,
+            "awaken_triggers": dict(self.awaken_triggers),
+            "base_abilities": list(self.base_abilities),
+            "tier_abilities": {k: list(v) for k, v in self.tier_abilities.items()},
+            "fate_modifiers": dict(self.fate_modifiers),
+        }
 
 
 def make_forest_ancestor_heirloom() -> SentientItem:
@@ -151,13 +178,13 @@ def tick_item_bond(item: SentientItem, agent_name: str, events: Dict) -> Sentien
 
     bond = max(0.0, min(1.0, bond))
 
-    return SentientItem(
-        **{
-            **asdict(item),
-            "bound_to": agent_name,
-            "bond_depth": bond,
-        }
-    )
+    # Shallow replace: voices stay SentientVoice objects and the nested
+    # lists/dicts are shared with the input item.
+    return replace(item, bound_to=agent_name, bond_depth=bond)
+
+
+# (bond_depth, agent_level) needed for each ability tier
+_TIER_THRESHOLDS: Tuple[Tuple[float, int], ...] = ((0.33, 5), (0.66, 10), (0.9, 15))
 
 
 def granted_abilities_for_item(item: SentientItem, agent_level: int) -> List[str]:
@@ -165,25 +192,45 @@ def granted_abilities_for_item(item: SentientItem, agent_level: int) -> List[str
     Compute which abilities the item is currently willing to grant.
     Very rough rule-of-thumb: each 0.33 bond_depth and +5 levels unlocks a tier.
     """
+    depth = item.bond_depth
+    tiers_unlocked = sum(
+        1 for min_depth, min_level in _TIER_THRESHOLDS
+        if depth >= min_depth and agent_level >= min_level
+    )
     abilities: List[str] = list(item.base_abilities)
+    tier_abilities = item.tier_abilities
+    for tier in ("tier1", "tier2", "tier3")[:tiers_unlocked]:
+        abilities.extend(tier_abilities.get(tier, []))
+    return sorted(set(abilities))
 
-    depth = item.bond_depth
-    tiers_unlocked = 0
-    if depth >= 0.33 and agent_level >= 5:
-        tiers_unlocked += 1
-    if depth >= 0.66 and agent_level >= 10:
-        tiers_unlocked += 1
-    if depth >= 0.9 and agent_level >= 15:
-        tiers_unlocked += 1
-
-    if tiers_unlocked >= 1:
-        abilities.extend(item.tier_abilities.get("tier1", []))
-    if tiers_unlocked >= 2:
-        abilities.extend(item.tier_abilities.get("tier2", []))
-    if tiers_unlocked >= 3:
-        abilities.extend(item.tier_abilities.get("tier3", []))
 
-    return sorted(set(abilities))
+def apply_items_to_fate(
+    items: Iterable[SentientItem],
+    fate: Dict[str, float],
+) -> Dict[str, float]:
+    """
+    Apply several items' fate modifiers in one pass; same result as calling
+    apply_item_to_fate for each item in turn.
+    """
+    out = dict(fate)
+    grace = out.get("grace", 0.5)
+    strain = out.get("mental_strain", 0.1)
+    weird_touched = False
+    weird = out.get("weird_mode", False)
+    for item in items:
+        mods = item.fate_modifiers
+        grace += mods.get("grace_delta", 0.0)
+        strain += mods.get("strain_delta", 0.0)
+        weird_bias = mods.get("weird_bias", 0.0)
+        if weird_bias > 0:
+            weird_touched = True
+            weird = bool(weird or weird_bias > 0.05)
+
+    out["grace"] = grace
+    out["mental_strain"] = strain
+    if weird_touched:
+        out["weird_mode"] = weird
+    return out
 
 
 def apply_item_to_fate(
@@ -194,21 +241,12 @@ def apply_item_to_fate(
     Apply the item's fate modifiers to a simple fate dict:
       { "grace": float, "bounce_back": float, "mental_strain": float, "weird_mode": bool }
     """
-    out = dict(fate)
-    out["grace"] = out.get("grace", 0.5) + item.fate_modifiers.get("grace_delta", 0.0)
-    out["mental_strain"] = out.get("mental_strain", 0.1) + item.fate_modifiers.get(
-        "strain_delta", 0.0
-    )
-
-    weird_bias = item.fate_modifiers.get("weird_bias", 0.0)
-    if weird_bias > 0:
-        out["weird_mode"] = bool(out.get("weird_mode", False) or weird_bias > 0.05)
-    return out
+    return apply_items_to_fate((item,), fate)
 
 
 if __name__ == "__main__":
     # Tiny smoke
-    import json
+    from fizban_json import print_json
 
     item = make_forest_ancestor_heirloom()
     item = tick_item_bond(
@@ -217,14 +255,11 @@ if __name__ == "__main__":
         events={"quest_completed": 2, "trauma": 1, "betrayed_item_values": False},
     )
     fate = {"grace": 0.6, "bounce_back": 0.5, "mental_strain": 0.2, "weird_mode": False}
-    print(
-        json.dumps(
-            {
-                "item": item.to_dict(),
-                "abilities": granted_abilities_for_item(item, agent_level=8),
-                "fate_after": apply_item_to_fate(item, fate),
-            },
-            indent=2,
-        )
+    print_json(
+        {
+            "item": item.to_dict(),
+            "abilities": granted_abilities_for_item(item, agent_level=8),
+            "fate_after": apply_item_to_fate(item, fate),
+        }
     )
 
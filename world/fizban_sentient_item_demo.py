@@ -10,8 +10,7 @@ Show:
 
 from __future__ import annotations
 
-import json
-
+from fizban_json import print_json
 from fizban_sentient_item import (
     apply_item_to_fate,
     granted_abilities_for_item,
@@ -61,7 +60,7 @@ def main() -> None:
         "abilities_granted": abilities,
         "fate_after": fate_after,
     }
-    print(json.dumps(out, indent=2))
+    print_json(out)
 
 
 if __name__ == "__main__":
@@ -16,51 +16,74 @@ Usage:
 
 import argparse
 import json
+from itertools import chain
 from pathlib import Path
-from statistics import mean
+
+from fizban_json import loads_json
 
 
 def load_series(path: Path):
-    records = []
-    with path.open("r", encoding="utf-8") as f:
+    # One bulk read, then parse each non-blank line (orjson when available)
+    return [loads_json(line) for line in path.read_bytes().splitlines() if line.strip()]
+
+
+def iter_series(path: Path):
+    """Yield records one line at a time, so large series never sit in memory."""
+    with path.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            records.append(json.loads(line))
-    return records
+            if line.strip():
+                yield loads_json(line)
 
 
-def _safe_mean(values):
-    if not values:
-        return None
-    return mean(values)
+# (summary key, record key) for the per-round metrics we track
+_METRICS = (
+    ("trust_a", "trust_a_after"),
+    ("trust_b", "trust_b_after"),
+    ("emotion_valence_a", "emotion_a_valence"),
+    ("emotion_valence_b", "emotion_b_valence"),
+)
 
 
 def summarize_series(records):
-    if not records:
+    """
+    Summarize a series in a single pass. records can be any iterable,
+    e.g. load_series(path) or the streaming iter_series(path).
+    """
+    it = iter(records)
+    first = next(it, None)
+    if first is None:
         return {"error": "empty_series"}
 
     # Assume consistent schema
-    first = records[0]
-    last = records[-1]
-
     a_id = first.get("a_id", "A")
     b_id = first.get("b_id", "B")
 
-    rounds = len(records)
-
-    betrayals_a = sum(1 for r in records if r.get("betrayal_a"))
-    betrayals_b = sum(1 for r in records if r.get("betrayal_b"))
-    injected_betrayals_b = sum(
-        1 for r in records if r.get("betrayal_injected_b")
-    )
-
-    trust_a_vals = [r.get("trust_a_after", 0.0) for r in records]
-    trust_b_vals = [r.get("trust_b_after", 0.0) for r in records]
-
-    val_a_vals = [r.get("emotion_a_valence", 0.0) for r in records]
-    val_b_vals = [r.get("emotion_b_valence", 0.0) for r in records]
+    # Running [min, max, sum] per metric
+    stats = {}
+    for out_key, key in _METRICS:
+        v = first.get(key, 0.0)
+        stats[out_key] = [v, v, 0.0]
+
+    rounds = 0
+    betrayals_a = betrayals_b = injected_betrayals_b = 0
+    last = first
+    for r in chain((first,), it):
+        rounds += 1
+        last = r
+        if r.get("betrayal_a"):
+            betrayals_a += 1
+        if r.get("betrayal_b"):
+            betrayals_b += 1
+        if r.get("betrayal_injected_b"):
+            injected_betrayals_b += 1
+        for out_key, key in _METRICS:
+            v = r.get(key, 0.0)
+            st = stats[out_key]
+            if v < st[0]:
+                st[0] = v
+            if v > st[1]:
+                st[1] = v
+            st[2] += v
 
     summary = {
         "a_id": a_id,
@@ -71,35 +94,16 @@ def summarize_series(records):
             "b": betrayals_b,
             "b_injected_scripted": injected_betrayals_b,
         },
-        "trust_a": {
-            "start": trust_a_vals[0],
-            "end": trust_a_vals[-1],
-            "min": min(trust_a_vals),
-            "max": max(trust_a_vals),
-            "avg": _safe_mean(trust_a_vals),
-        },
-        "trust_b": {
-            "start": trust_b_vals[0],
-            "end": trust_b_vals[-1],
-            "min": min(trust_b_vals),
-            "max": max(trust_b_vals),
-            "avg": _safe_mean(trust_b_vals),
-        },
-        "emotion_valence_a": {
-            "start": val_a_vals[0],
-            "end": val_a_vals[-1],
-            "min": min(val_a_vals),
-            "max": max(val_a_vals),
-            "avg": _safe_mean(val_a_vals),
-        },
-        "emotion_valence_b": {
-            "start": val_b_vals[0],
-            "end": val_b_vals[-1],
-            "min": min(val_b_vals),
-            "max": max(val_b_vals),
-            "avg": _safe_mean(val_b_vals),
-        },
     }
+    for out_key, key in _METRICS:
+        lo, hi, total = stats[out_key]
+        summary[out_key] = {
+            "start": first.get(key, 0.0),
+            "end": last.get(key, 0.0),
+            "min": lo,
+            "max": hi,
+            "avg": total / rounds,
+        }
 
     return summary
 
@@ -118,8 +122,7 @@ def main() -> int:
         print(json.dumps({"error": f"no_such_file: {path}"}))
         return 1
 
-    records = load_series(path)
-    summary = summarize_series(records)
+    summary = summarize_series(iter_series(path))
     print(json.dumps(summary, ensure_ascii=False, indent=2))
     return 0
 
@@ -10,7 +10,7 @@ Session recap helper:
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Sequence, Tuple
 
 from fizban_god_reactions import compute_god_reactions
 
@@ -35,8 +35,9 @@ def _get_level(agent: Agent) -> int:
 
 
 def _get_favor(agent: Agent) -> Dict[str, float]:
-    raw = agent.get("favor") or {}
-    return {k: float(v) for k, v in raw.items()}
+    # enrich_world already stores favor values as floats; no per-recap copy.
+    # _scalar_changes still coerces, so raw (un-enriched) worlds work too.
+    return agent.get("favor") or {}
 
 
 def _get_bloodline_state(agent: Agent) -> Dict[str, Any]:
@@ -49,6 +50,57 @@ def _get_items_state(agent: Agent) -> Dict[str, Any]:
     return agent.get("sentient_items") or {}
 
 
+class AgentSnapshot(NamedTuple):
+    """The parts of an agent dict a recap diff reads, fetched once."""
+
+    level: int
+    fate: Dict[str, float]
+    favor: Dict[str, float]
+    bloodlines: Dict[str, Any]
+    sentient_items: Dict[str, Any]
+
+
+def _snapshot(agent: Agent) -> AgentSnapshot:
+    return AgentSnapshot(
+        level=_get_level(agent),
+        fate=_get_fate(agent),
+        favor=_get_favor(agent),
+        bloodlines=_get_bloodline_state(agent),
+        sentient_items=_get_items_state(agent),
+    )
+
+
+def _scalar_changes(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    threshold: float,
+) -> Dict[str, Dict[str, float]]:
+    """
+    {key: {before, after, delta}} for every key (sorted) whose value moved
+    by at least `threshold`; missing keys count as 0.0.
+    """
+    get_b = before.get
+    get_a = after.get
+    changes: Dict[str, Dict[str, float]] = {}
+    for key in sorted(before.keys() | after.keys()):
+        b = float(get_b(key, 0.0))
+        a = float(get_a(key, 0.0))
+        delta = a - b
+        if abs(delta) >= threshold:
+            changes[key] = {"before": b, "after": a, "delta": delta}
+    return changes
+
+
+def _tier_ids(bloodline: Dict[str, Any]) -> FrozenSet[str]:
+    return frozenset(t["id"] for t in bloodline.get("active_tiers") or [])
+
+
+def _bond(item_state: Dict[str, Any] | None) -> float:
+    if not item_state:
+        return 0.0
+    return float((item_state.get("item") or {}).get("bond_depth", 0.0))
+
+
 def _summarize_agent_diff(
     name: str,
     before: Agent | None,
@@ -73,50 +125,41 @@ def _summarize_agent_diff(
 
     diff["status"] = "present"
 
+    # Copy-on-write worlds share untouched agents; nothing can have changed.
+    if before is after:
+        return diff
+
+    snap_before = _snapshot(before)
+    snap_after = _snapshot(after)
+
     # Level
-    lvl_before = _get_level(before)
-    lvl_after = _get_level(after)
+    lvl_before = snap_before.level
+    lvl_after = snap_after.level
     lvl_delta = lvl_after - lvl_before
     if lvl_delta != 0:
         diff["level_change"] = {"before": lvl_before, "after": lvl_after, "delta": lvl_delta}
 
     # Fate
-    fate_before = _get_fate(before)
-    fate_after = _get_fate(after)
-    fate_changes: Dict[str, Dict[str, float]] = {}
-    for key in sorted(set(list(fate_before.keys()) + list(fate_after.keys()))):
-        b = float(fate_before.get(key, 0.0))
-        a = float(fate_after.get(key, 0.0))
-        if abs(a - b) >= 0.01:
-            fate_changes[key] = {"before": b, "after": a, "delta": a - b}
+    fate_changes = _scalar_changes(snap_before.fate, snap_after.fate, 0.01)
     if fate_changes:
         diff["fate_changes"] = fate_changes
 
     # Favor
-    fav_before = _get_favor(before)
-    fav_after = _get_favor(after)
-    favor_changes: Dict[str, Dict[str, float]] = {}
-    for patron in sorted(set(list(fav_before.keys()) + list(fav_after.keys()))):
-        b = float(fav_before.get(patron, 0.0))
-        a = float(fav_after.get(patron, 0.0))
-        delta = a - b
-        if abs(delta) >= favor_threshold:
-            favor_changes[patron] = {"before": b, "after": a, "delta": delta}
+    favor_changes = _scalar_changes(snap_before.favor, snap_after.favor, favor_threshold)
     if favor_changes:
         diff["favor_changes"] = favor_changes
 
     # Bloodlines: track new active tiers
-    bl_before = _get_bloodline_state(before)
-    bl_after = _get_bloodline_state(after)
+    bl_before = snap_before.bloodlines
+    bl_after = snap_after.bloodlines
     new_bloodline_tiers: List[Tuple[str, str]] = []
     if bl_after:
+        before_tier_sets = {
+            bl_key: _tier_ids(data) for bl_key, data in bl_before.items()
+        }
         for bl_key, data in bl_after.items():
-            after_tiers = {t["id"] for t in data.get("active_tiers") or []}
-            before_tiers = set()
-            if bl_key in bl_before:
-                before_tiers = {t["id"] for t in bl_before[bl_key].get("active_tiers") or []}
-            for tier_id in sorted(after_tiers - before_tiers):
-                new_bloodline_tiers.append((bl_key, tier_id))
+            new_tiers = _tier_ids(data) - before_tier_sets.get(bl_key, frozenset())
+            new_bloodline_tiers.extend((bl_key, tier_id) for tier_id in sorted(new_tiers))
     if new_bloodline_tiers:
         diff["bloodline_tiers_unlocked"] = [
             {"bloodline_id": bl_id, "tier_id": tier_id}
@@ -124,19 +167,13 @@ def _summarize_agent_diff(
         ]
 
     # Sentient items: new item bonds
-    items_before = _get_items_state(before)
-    items_after = _get_items_state(after)
-    new_items: List[str] = []
+    items_before = snap_before.sentient_items
+    items_after = snap_after.sentient_items
+    new_items = sorted(items_after.keys() - items_before.keys())
     bond_changes: Dict[str, Dict[str, float]] = {}
     for item_id, payload in items_after.items():
-        if item_id not in items_before:
-            new_items.append(item_id)
-        before_item = items_before.get(item_id)
-        after_item = payload
-        before_bond = 0.0
-        if before_item:
-            before_bond = float(before_item.get("item", {}).get("bond_depth", 0.0))
-        after_bond = float(after_item.get("item", {}).get("bond_depth", 0.0))
+        before_bond = _bond(items_before.get(item_id))
+        after_bond = _bond(payload)
         if abs(after_bond - before_bond) >= 0.05:
             bond_changes[item_id] = {
                 "before": before_bond,
@@ -156,45 +193,80 @@ def _headline_from_diffs(agent_diffs: Dict[str, Any]) -> List[str]:
     """
     Generate 2–5 compact recap lines.
     """
-    lines: List[str] = []
+    # One pass over the diffs; each category keeps its own list so the
+    # output stays grouped (level-ups, bloodlines, bonds, favor).
+    levels: List[str] = []
+    bloods: List[str] = []
+    bonds: List[str] = []
+    favors: List[str] = []
 
-    # Level-ups
     for name, diff in agent_diffs.items():
+        # Level-ups
         lvl = diff.get("level_change")
         if lvl and lvl["delta"] > 0:
-            lines.append(f"{name} advanced from level {lvl['before']} to {lvl['after']}.")
+            levels.append(f"{name} advanced from level {lvl['before']} to {lvl['after']}.")
 
-    # Bloodline unlocks
-    for name, diff in agent_diffs.items():
+        # Bloodline unlocks
         for bl in diff.get("bloodline_tiers_unlocked", []):
             bl_id = bl["bloodline_id"]
             tier_id = bl["tier_id"]
-            lines.append(f"{name}'s {bl_id} bloodline unlocked tier {tier_id}.")
+            bloods.append(f"{name}'s {bl_id} bloodline unlocked tier {tier_id}.")
 
-    # Sentient item bonds
-    for name, diff in agent_diffs.items():
+        # Sentient item bonds
         bond_changes = diff.get("sentient_bond_changes") or {}
         for item_id, bc in bond_changes.items():
             if bc["delta"] > 0:
-                lines.append(
+                bonds.append(
                     f"{name}'s bond with {item_id} deepened (bond {bc['before']:.2f} → {bc['after']:.2f})."
                 )
 
-    # Favor swings
-    for name, diff in agent_diffs.items():
+        # Favor swings
         fav_changes = diff.get("favor_changes") or {}
         for patron, fc in fav_changes.items():
             direction = "grew" if fc["delta"] > 0 else "fell"
-            lines.append(
+            favors.append(
                 f"{patron}'s favor for {name} {direction} (Δ {fc['delta']:+.2f})."
             )
 
+        # Once four level-ups are in, later agents can't change the first four
+        # lines; past five lines the rest is summarized anyway.
+        if len(levels) >= 4 and len(levels) + len(bloods) + len(bonds) + len(favors) > 5:
+            break
+
+    lines = levels + bloods + bonds + favors
+
     # Cap length a bit
     if len(lines) > 5:
         return lines[:4] + ["...and more subtle shifts the gods are still weighing."]
     return lines
 
 
+def _god_headlines(world: World, events: List[Dict[str, Any]]) -> Dict[str, str]:
+    god_reactions = compute_god_reactions(world, events=events)
+    return {
+        patron: data.get("headline", "")
+        for patron, data in god_reactions.items()
+    }
+
+
+def _agent_diffs(world_before: World, world_after: World) -> Dict[str, Any]:
+    before_agents = _agents(world_before)
+    after_agents = _agents(world_after)
+
+    agent_diffs: Dict[str, Any] = {}
+    if before_agents is after_agents:
+        # Same agent table on both sides: every agent is present and unchanged.
+        for name in sorted(after_agents):
+            if after_agents[name] is not None:
+                agent_diffs[name] = {"agent": name, "status": "present"}
+    else:
+        for name in sorted(before_agents.keys() | after_agents.keys()):
+            diff = _summarize_agent_diff(name, before_agents.get(name), after_agents.get(name))
+            if diff:
+                agent_diffs[name] = diff
+    return agent_diffs
+
+
 def compute_session_recap(
     world_before: World,
     world_after: World,
@@ -208,25 +280,11 @@ def compute_session_recap(
     """
     events = events or []
 
-    before_agents = _agents(world_before)
-    after_agents = _agents(world_after)
-
-    agent_diffs: Dict[str, Any] = {}
-    all_names = sorted(set(list(before_agents.keys()) + list(after_agents.keys())))
-
-    for name in all_names:
-        diff = _summarize_agent_diff(name, before_agents.get(name), after_agents.get(name))
-        if diff:
-            agent_diffs[name] = diff
-
+    agent_diffs = _agent_diffs(world_before, world_after)
     recap_lines = _headline_from_diffs(agent_diffs)
 
     # Optional: ask gods how they feel *after* the changes
-    god_reactions = compute_god_reactions(world_after, events=events)
-    god_headlines = {
-        patron: data.get("headline", "")
-        for patron, data in god_reactions.items()
-    }
+    god_headlines = _god_headlines(world_after, events)
 
     return {
         "events": events,
@@ -235,3 +293,36 @@ def compute_session_recap(
         "god_headlines_after": god_headlines,
     }
 
+
+
+def compute_session_recap_batch(
+    worlds_before: Sequence[World],
+    worlds_after: Sequence[World],
+    events: List[Dict[str, Any]] | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    compute_session_recap for each (before, after) pair, sharing `events`.
+
+    God headlines are computed once per distinct world_after object, so
+    comparing many snapshots against the same "after" world only asks the
+    gods once.
+    """
+    if len(worlds_before) != len(worlds_after):
+        raise ValueError("worlds_before and worlds_after must have the same length")
+
+    events = events or []
+    headlines_by_world: Dict[int, Dict[str, str]] = {}
+
+    recaps: List[Dict[str, Any]] = []
+    for world_before, world_after in zip(worlds_before, worlds_after):
+        agent_diffs = _agent_diffs(world_before, world_after)
+        god_headlines = headlines_by_world.get(id(world_after))
+        if god_headlines is None:
+            god_headlines = headlines_by_world[id(world_after)] = _god_headlines(world_after, events)
+        recaps.append({
+            "events": events,
+            "agent_diffs": agent_diffs,
+            "recap_lines": _headline_from_diffs(agent_diffs),
+            "god_headlines_after": dict(god_headlines),
+        })
+    return recaps
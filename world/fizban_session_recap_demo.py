@@ -10,18 +10,32 @@ fizban_session_recap_demo.py
 
 from __future__ import annotations
 
-import copy
-import json
 from typing import Any, Dict
 
 from fizban_world_enrich_demo import build_demo_world
 from fizban_world_enrich import enrich_world
+from fizban_json import print_json
 from fizban_session_recap import compute_session_recap
 
 
 World = Dict[str, Any]
 
 
+def _shallow_agent_copy(agents: Dict[str, Any], name: str) -> Dict[str, Any] | None:
+    """
+    Replace agents[name] with a copy whose fate/favor dicts are private,
+    so they can be mutated without touching the source world.
+    """
+    agent = agents.get(name)
+    if not agent:
+        return None
+    a = dict(agent)
+    a["fate"] = dict(a.get("fate") or {})
+    a["favor"] = dict(a.get("favor") or {})
+    agents[name] = a
+    return a
+
+
 def tweak_world_for_demo(world: World) -> World:
     """
     Simulate one session of progress.
@@ -30,12 +44,18 @@ def tweak_world_for_demo(world: World) -> World:
     - Paladin's fate grace bumps slightly.
     - Arianel's bond with Heartroot Diadem deepens.
     - Puck amuses Bottom a bit more, annoys Oberon a bit more.
-    """
-    w = copy.deepcopy(world)
-    agents = w.get("world_final", {}).get("agents", {})
 
-    pal = agents.get("Paladin")
-    puck = agents.get("Puck")
+    Only the containers on the mutation path are copied; everything else
+    is shared with the input world, which is left untouched.
+    """
+    w = {**world}
+    wf = {**(w.get("world_final") or {})}
+    agents = {**(wf.get("agents") or {})}
+    wf["agents"] = agents
+    w["world_final"] = wf
+
+    pal = _shallow_agent_copy(agents, "Paladin")
+    puck = _shallow_agent_copy(agents, "Puck")
     arianel = agents.get("Arianel")
 
     # Paladin: level up, small fate shift, favor changes
@@ -44,21 +64,22 @@ def tweak_world_for_demo(world: World) -> World:
         if isinstance(pal.get("level"), (int, float)):
             pal["level"] = int(pal["level"]) + 1
         elif "class" in pal and isinstance(pal["class"].get("level"), (int, float)):
+            pal["class"] = dict(pal["class"])
             pal["class"]["level"] = int(pal["class"]["level"]) + 1
 
         # Fate
-        fate = pal.setdefault("fate", {})
+        fate = pal["fate"]
         fate["grace"] = float(fate.get("grace", 0.6)) + 0.05
         fate["mental_strain"] = float(fate.get("mental_strain", 0.1)) + 0.01
 
         # Favor
-        favor = pal.setdefault("favor", {})
+        favor = pal["favor"]
         favor["King"] = float(favor.get("King", 0.4)) + 0.07
         favor["Titania"] = float(favor.get("Titania", 0.5)) + 0.05
 
     # Puck: grows in Bottom's favor, annoys Oberon
     if puck:
-        favor = puck.setdefault("favor", {})
+        favor = puck["favor"]
         favor["Bottom"] = float(favor.get("Bottom", 0.8)) + 0.05
         favor["Oberon"] = float(favor.get("Oberon", 0.45)) - 0.06
 
@@ -67,7 +88,10 @@ def tweak_world_for_demo(world: World) -> World:
         items = arianel.get("sentient_items") or {}
         diadem = items.get("ITEM_FOREST_ANCESTOR_HEIRLOOM")
         if diadem:
-            item_obj = diadem.get("item", {})
+            arianel = agents["Arianel"] = dict(arianel)
+            items = arianel["sentient_items"] = dict(items)
+            diadem = items["ITEM_FOREST_ANCESTOR_HEIRLOOM"] = dict(diadem)
+            item_obj = diadem["item"] = dict(diadem.get("item") or {})
             item_obj["bond_depth"] = float(item_obj.get("bond_depth", 0.11)) + 0.12
 
     return w
@@ -76,9 +100,9 @@ def tweak_world_for_demo(world: World) -> World:
 def main() -> None:
     base_world = build_demo_world()
 
-    # Enrich both worlds, then tweak "after"
+    # Enrich once, then tweak a copy-on-write "after" that shares the rest
     before_enriched: World = enrich_world(base_world)
-    after_enriched: World = tweak_world_for_demo(enrich_world(base_world))
+    after_enriched: World = tweak_world_for_demo(before_enriched)
 
     events = [
         {
@@ -102,8 +126,8 @@ def main() -> None:
 
     recap = compute_session_recap(before_enriched, after_enriched, events=events)
 
-    # Pretty print
-    print(json.dumps(recap, indent=2))
+    # Pretty print (orjson-backed when available)
+    print_json(recap)
 
 
 if __name__ == "__main__":
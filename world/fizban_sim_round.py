@@ -16,16 +16,33 @@ Prints a JSON summary of the round to stdout.
 import argparse
 import json
 import random
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from fizban_agent import AgentState
 
-from typing import Dict, Tuple, Optional
-
 # ----- Payoff & interest helpers -----
 
 
+# (action_a, action_b) -> (payoff_a, payoff_b)
+_PAYOFF_TABLE: Dict[Tuple[str, str], Tuple[float, float]] = {
+    ("C", "C"): (2.0, 2.0),
+    ("C", "D"): (-1.0, 3.0),
+    ("D", "C"): (3.0, -1.0),
+    ("D", "D"): (0.0, 0.0),
+}
+
+# Outcome for trust update, from the perspective of the first action:
+# +1 = I feel this was cooperative for me, -1 = betrayal, 0 = neutral
+_OUTCOME_TABLE: Dict[Tuple[str, str], float] = {
+    ("C", "C"): 1.0,
+    ("D", "D"): 0.0,
+    ("C", "D"): -1.0,
+    ("D", "C"): 1.0,
+}
+
+
 def payoff(a: str, b: str) -> Tuple[float, float]:
     """
     Prisoner's Dilemma style payoff:
@@ -34,13 +51,7 @@ def payoff(a: str, b: str) -> Tuple[float, float]:
       D,C -> (3, -1)
       D,D -> (0, 0)
     """
-    if a == "C" and b == "C":
-        return 2.0, 2.0
-    if a == "C" and b == "D":
-        return -1.0, 3.0
-    if a == "D" and b == "C":
-        return 3.0, -1.0
-    return 0.0, 0.0
+    return _PAYOFF_TABLE.get((a, b), (0.0, 0.0))
 
 
 def shared_interest_score(a: AgentState, b: AgentState) -> float:
@@ -48,55 +59,60 @@ def shared_interest_score(a: AgentState, b: AgentState) -> float:
     Very simple shared-interest measure: overlap of tags.
     Later we can fold in guilds, factions, quests, etc.
     """
-    set_a = set(a.tags)
-    set_b = set(b.tags)
+    set_a = a.tag_set
+    set_b = b.tag_set
     if not set_a or not set_b:
         return 0.0
+    if set_a is set_b:
+        return 1.0
     inter = len(set_a & set_b)
-    union = len(set_a | set_b)
-    if union == 0:
-        return 0.0
-    return inter / union
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, without building the union set
+    return inter / (len(set_a) + len(set_b) - inter)
 
 
 # ----- Strategy & bias helpers -----
 
 
-def base_action_from_strategy(agent: AgentState, other_id: str) -> str:
-    """
-    Baseline C/D decision from Ncase-style strategies.
-    For now, we ignore full history and only use trust level + a few rules of thumb.
-    """
-    strat = agent.trust_strategy
-
-    if strat == "cooperator":
-        return "C"
-    if strat == "cheater":
-        return "D"
+def _draw(r: Optional[float]) -> float:
+    return random.random() if r is None else r
 
-    t = agent.get_trust(other_id)
 
-    if strat == "copycat":
-        # First interaction: default to cooperation if no strong distrust
-        return "C" if t >= -0.2 else "D"
+# Ncase-style strategy -> (trust toward other, optional pre-drawn variate) -> C/D.
+# Unknown strategies fall back to cooperation.
+_STRATEGY_DISPATCH: Dict[str, Callable[[float, Optional[float]], str]] = {
+    "cooperator": lambda t, r: "C",
+    "cheater": lambda t, r: "D",
+    # First interaction: default to cooperation if no strong distrust
+    "copycat": lambda t, r: "C" if t >= -0.2 else "D",
+    # Slightly more forgiving copycat: default C unless very negative
+    "copykitten": lambda t, r: "C" if t > -0.4 else "D",
+    # If we dislike them at all, defect
+    "grudger": lambda t, r: "C" if t >= 0.0 else "D",
+    # Random with slight cooperation tilt
+    "simpleton": lambda t, r: "C" if _draw(r) < 0.6 else "D",
+    "random": lambda t, r: "C" if _draw(r) < 0.5 else "D",
+}
 
-    if strat == "copykitten":
-        # Slightly more forgiving copycat: default C unless very negative
-        return "C" if t > -0.4 else "D"
 
-    if strat == "grudger":
-        # If we dislike them at all, defect
-        return "C" if t >= 0.0 else "D"
+def _strategy_fallback(t: float, r: Optional[float]) -> str:
+    return "C"
 
-    if strat == "simpleton":
-        # Random with slight cooperation tilt
-        return "C" if random.random() < 0.6 else "D"
 
-    if strat == "random":
-        return "C" if random.random() < 0.5 else "D"
+def base_action_from_strategy(
+    agent: AgentState,
+    other_id: str,
+    r: Optional[float] = None,
+) -> str:
+    """
+    Baseline C/D decision from Ncase-style strategies.
+    For now, we ignore full history and only use trust level + a few rules of thumb.
 
-    # Fallback
-    return "C"
+    r:
+      - Optional pre-drawn uniform variate in [0, 1) for the random-ish
+        strategies; if None, random.random() is drawn here.
+    """
+    fn = _STRATEGY_DISPATCH.get(agent.trust_strategy, _strategy_fallback)
+    return fn(agent.get_trust(other_id), r)
 
 
 def align_bias(a: AgentState, b: AgentState, shared_interest: float) -> float:
@@ -160,12 +176,35 @@ def relationship_coop_bias(agent: AgentState, other_id: str) -> float:
     return bias
 
 
-def decide_action(agent: AgentState, other: AgentState, s_interest: float) -> str:
+def pair_coop_bias(agent: AgentState, other: AgentState, s_interest: float) -> float:
+    """
+    Alignment/interest bias plus relationship bias of `agent` toward `other`.
+
+    Neither term depends on trust, so a multi-round series can compute this
+    once per direction and hand it to run_round via `precomputed`.
+    """
+    return align_bias(agent, other, s_interest) + relationship_coop_bias(agent, other.id)
+
+
+def decide_action(
+    agent: AgentState,
+    other: AgentState,
+    s_interest: float,
+    extra_bias: Optional[float] = None,
+    r: Optional[float] = None,
+) -> str:
     """
     Combine trust strategy baseline + alignment + interests + relationship
     into a final C/D choice.
+
+    extra_bias:
+      - If given, used instead of recomputing align_bias + relationship_coop_bias
+        (see pair_coop_bias).
+
+    r:
+      - Optional pre-drawn variate forwarded to base_action_from_strategy.
     """
-    base = base_action_from_strategy(agent, other.id)
+    base = base_action_from_strategy(agent, other.id, r)
     t = agent.get_trust(other.id)
     # map trust [-1,1] -> [0,1]
     trust_p = 0.5 * (t + 1.0)
@@ -173,11 +212,14 @@ def decide_action(agent: AgentState, other: AgentState, s_interest: float) -> st
     # base cooperation probability from trust
     p_coop = trust_p
 
-    # add alignment/interest bias
-    p_coop += align_bias(agent, other, s_interest)
+    if extra_bias is not None:
+        p_coop += extra_bias
+    else:
+        # add alignment/interest bias
+        p_coop += align_bias(agent, other, s_interest)
 
-    # add relationship bias (ally/lover/rival)
-    p_coop += relationship_coop_bias(agent, other.id)
+        # add relationship bias (ally/lover/rival)
+        p_coop += relationship_coop_bias(agent, other.id)
 
     # clamp
     if p_coop < 0.0:
@@ -196,6 +238,61 @@ def decide_action(agent: AgentState, other: AgentState, s_interest: float) -> st
     return base
 
 
+# ----- Round summary -----
+
+
+@dataclass(slots=True)
+class RoundSummary:
+    """Per-round outcome; to_dict() gives the JSON shape used by the CLIs."""
+
+    a_id: str
+    b_id: str
+    action_a: str
+    action_b: str
+    payoff_a_raw: float
+    payoff_b_raw: float
+    payoff_a_emotion: float
+    payoff_b_emotion: float
+    betrayal_a: bool
+    betrayal_b: bool
+    shared_interest: float
+    trust_a_after: float
+    trust_b_after: float
+    emotion_a_valence: float
+    emotion_b_valence: float
+    strain_a: float
+    strain_b: float
+    cooldown_a: int
+    cooldown_b: int
+    weird_mode_a: bool
+    weird_mode_b: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "a_id": self.a_id,
+            "b_id": self.b_id,
+            "action_a": self.action_a,
+            "action_b": self.action_b,
+            "payoff_a_raw": self.payoff_a_raw,
+            "payoff_b_raw": self.payoff_b_raw,
+            "payoff_a_emotion": self.payoff_a_emotion,
+            "payoff_b_emotion": self.payoff_b_emotion,
+            "betrayal_a": self.betrayal_a,
+            "betrayal_b": self.betrayal_b,
+            "shared_interest": self.shared_interest,
+            "trust_a_after": self.trust_a_after,
+            "trust_b_after": self.trust_b_after,
+            "emotion_a_valence": self.emotion_a_valence,
+            "emotion_b_valence": self.emotion_b_valence,
+            "strain_a": self.strain_a,
+            "strain_b": self.strain_b,
+            "cooldown_a": self.cooldown_a,
+            "cooldown_b": self.cooldown_b,
+            "weird_mode_a": self.weird_mode_a,
+            "weird_mode_b": self.weird_mode_b,
+        }
+
+
 # ----- Core round function -----
 
 
@@ -204,29 +301,45 @@ def run_round(
     agent_b: AgentState,
     forced_action_a: Optional[str] = None,
     forced_action_b: Optional[str] = None,
-) -> Tuple[Dict, AgentState, AgentState]:
+    precomputed: Optional[Tuple[float, float, float]] = None,
+    random_a: Optional[float] = None,
+    random_b: Optional[float] = None,
+) -> Tuple[RoundSummary, AgentState, AgentState]:
     """
     Perform one interaction round and return:
-      (summary_dict, updated_agent_a, updated_agent_b)
+      (RoundSummary, updated_agent_a, updated_agent_b)
 
     forced_action_a / forced_action_b:
       - If "C" or "D", override the decision logic for that side.
       - If None, use normal strategy/relationship-based decision.
+
+    precomputed:
+      - Optional (shared_interest, bias_ab, bias_ba) from pair_coop_bias,
+        valid as long as neither agent's tags, alignment or relationship
+        toward the other has changed. Rounds never change those, so a
+        series can compute this once up front.
+
+    random_a / random_b:
+      - Optional pre-drawn variates for each side's random-ish strategies.
     """
-    s_interest = shared_interest_score(agent_a, agent_b)
+    if precomputed is not None:
+        s_interest, bias_ab, bias_ba = precomputed
+    else:
+        s_interest = shared_interest_score(agent_a, agent_b)
+        bias_ab = bias_ba = None
 
     # Decide actions (with optional override)
     if forced_action_a in ("C", "D"):
         action_a = forced_action_a
     else:
-        action_a = decide_action(agent_a, agent_b, s_interest)
+        action_a = decide_action(agent_a, agent_b, s_interest, bias_ab, random_a)
 
     if forced_action_b in ("C", "D"):
         action_b = forced_action_b
     else:
-        action_b = decide_action(agent_b, agent_a, s_interest)
+        action_b = decide_action(agent_b, agent_a, s_interest, bias_ba, random_b)
 
-    payoff_a_raw, payoff_b_raw = payoff(action_a, action_b)
+    payoff_a_raw, payoff_b_raw = _PAYOFF_TABLE[(action_a, action_b)]
 
     # Map raw payoff -> emotional payoff (just a simple scaling for now)
     payoff_a_emotion = 0.25 * payoff_a_raw
@@ -236,22 +349,9 @@ def run_round(
     betrayal_a = (action_a == "C" and action_b == "D")
     betrayal_b = (action_b == "C" and action_a == "D")
 
-
     # Outcome for trust update: from the perspective of each agent
-    # +1 = I feel this was cooperative for me, -1 = betrayal, 0 = neutral
-    def outcome_for(me_action: str, other_action: str) -> float:
-        if me_action == "C" and other_action == "C":
-            return 1.0
-        if me_action == "D" and other_action == "D":
-            return 0.0
-        if me_action == "C" and other_action == "D":
-            return -1.0
-        if me_action == "D" and other_action == "C":
-            return 1.0
-        return 0.0
-
-    outcome_a = outcome_for(action_a, action_b)
-    outcome_b = outcome_for(action_b, action_a)
+    outcome_a = _OUTCOME_TABLE[(action_a, action_b)]
+    outcome_b = _OUTCOME_TABLE[(action_b, action_a)]
 
     # Update trust
     agent_a.update_trust_after_interaction(agent_b.id, outcome_a)
@@ -274,29 +374,29 @@ def run_round(
         if agent_b.bounce_back.cooldown > 0:
             agent_b.bounce_back.cooldown -= 1
 
-    summary = {
-        "a_id": agent_a.id,
-        "b_id": agent_b.id,
-        "action_a": action_a,
-        "action_b": action_b,
-        "payoff_a_raw": payoff_a_raw,
-        "payoff_b_raw": payoff_b_raw,
-        "payoff_a_emotion": payoff_a_emotion,
-        "payoff_b_emotion": payoff_b_emotion,
-        "betrayal_a": betrayal_a,
-        "betrayal_b": betrayal_b,
-        "shared_interest": s_interest,
-        "trust_a_after": agent_a.get_trust(agent_b.id),
-        "trust_b_after": agent_b.get_trust(agent_a.id),
-        "emotion_a_valence": agent_a.emotion.valence,
-        "emotion_b_valence": agent_b.emotion.valence,
-        "strain_a": agent_a.emotion.strain,
-        "strain_b": agent_b.emotion.strain,
-        "cooldown_a": agent_a.bounce_back.cooldown,
-        "cooldown_b": agent_b.bounce_back.cooldown,
-        "weird_mode_a": agent_a.emotion.weird_mode,
-        "weird_mode_b": agent_b.emotion.weird_mode,
-    }
+    summary = RoundSummary(
+        a_id=agent_a.id,
+        b_id=agent_b.id,
+        action_a=action_a,
+        action_b=action_b,
+        payoff_a_raw=payoff_a_raw,
+        payoff_b_raw=payoff_b_raw,
+        payoff_a_emotion=payoff_a_emotion,
+        payoff_b_emotion=payoff_b_emotion,
+        betrayal_a=betrayal_a,
+        betrayal_b=betrayal_b,
+        shared_interest=s_interest,
+        trust_a_after=agent_a.get_trust(agent_b.id),
+        trust_b_after=agent_b.get_trust(agent_a.id),
+        emotion_a_valence=agent_a.emotion.valence,
+        emotion_b_valence=agent_b.emotion.valence,
+        strain_a=agent_a.emotion.strain,
+        strain_b=agent_b.emotion.strain,
+        cooldown_a=agent_a.bounce_back.cooldown,
+        cooldown_b=agent_b.bounce_back.cooldown,
+        weird_mode_a=agent_a.emotion.weird_mode,
+        weird_mode_b=agent_b.emotion.weird_mode,
+    )
 
     return summary, agent_a, agent_b
 
@@ -340,7 +440,7 @@ def main() -> int:
     summary, agent_a_next, agent_b_next = run_round(agent_a, agent_b)
 
     # Print summary to stdout
-    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    print(json.dumps(summary.to_dict(), ensure_ascii=False, indent=2))
 
     # Save updated agents if requested
     if args.out_a:
@@ -17,11 +17,12 @@ Usage:
 
 import argparse
 import json
+import random
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from fizban_agent import AgentState
-from fizban_sim_round import run_round
+from fizban_sim_round import pair_coop_bias, run_round, shared_interest_score
 
 
 def load_agent(path: Path) -> AgentState:
@@ -50,6 +51,12 @@ def main() -> int:
         default=None,
         help="If set, write per-round JSON lines to this file.",
     )
+    ap.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="If set, seed the per-round draws of random-ish strategies for a reproducible series.",
+    )
     ap.add_argument(
         "--out-a-final",
         type=str,
@@ -71,10 +78,30 @@ def main() -> int:
     agent_b = load_agent(path_b)
 
     series_fp = None
+    series_lines: List[str] = []
     if args.out_series:
         series_path = Path(args.out_series).expanduser().resolve()
         series_fp = series_path.open("w", encoding="utf-8")
 
+    # Tags, alignment and relationships are fixed for the whole series; only
+    # trust/emotion move between rounds, so the pair biases are computed once.
+    s_interest = shared_interest_score(agent_a, agent_b)
+    precomputed = (
+        s_interest,
+        pair_coop_bias(agent_a, agent_b, s_interest),
+        pair_coop_bias(agent_b, agent_a, s_interest),
+    )
+
+    # Seeded runs draw every round's variate per side up front; otherwise
+    # run_round falls back to the global random module.
+    draws_a: List[Optional[float]] = [None] * args.rounds
+    draws_b: List[Optional[float]] = [None] * args.rounds
+    if args.seed is not None:
+        draw_a = random.Random(args.seed).random
+        draw_b = random.Random(args.seed + 1).random
+        draws_a = [draw_a() for _ in range(args.rounds)]
+        draws_b = [draw_b() for _ in range(args.rounds)]
+
     for i in range(args.rounds):
         round_num = i + 1
 
@@ -88,20 +115,27 @@ def main() -> int:
             forced_b = "D"
             betrayal_injected = True
 
-        summary, agent_a, agent_b = run_round(
+        round_summary, agent_a, agent_b = run_round(
             agent_a,
             agent_b,
             forced_action_a=forced_a,
             forced_action_b=forced_b,
+            precomputed=precomputed,
+            random_a=draws_a[i],
+            random_b=draws_b[i],
         )
 
-        summary["round"] = round_num
-        summary["betrayal_injected_b"] = betrayal_injected
-
         if series_fp is not None:
-            series_fp.write(json.dumps(summary, ensure_ascii=False) + "\n")
+            summary = round_summary.to_dict()
+            summary["round"] = round_num
+            summary["betrayal_injected_b"] = betrayal_injected
+            series_lines.append(json.dumps(summary, ensure_ascii=False))
 
     if series_fp is not None:
+        # One write for the whole series instead of one per round.
+        if series_lines:
+            series_lines.append("")
+        series_fp.write("\n".join(series_lines))
         series_fp.close()
 
     # Save finals
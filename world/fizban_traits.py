@@ -16,146 +16,157 @@ These traits are then used by:
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Set
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Tuple
 
 from fizban_gods import compute_favor_for_agent
 
 
-def _class_traits(agent: Dict[str, Any]) -> Set[str]:
-    traits: Set[str] = set()
-    cls = (agent.get("class") or {}).get("dnd_class")
-
-    if not cls:
-        return traits
-
-    cls = str(cls).lower()
-
-    if cls == "paladin":
-        traits.add("class_paladin")
-        traits.add("divine_knight")
-    elif cls == "rogue":
-        traits.add("class_rogue")
-        traits.add("trickster_heart")
-    elif cls in ("cleric", "priest"):
-        traits.add("class_cleric")
-        traits.add("divine_channel")
-    elif cls in ("druid", "forest_druid"):
-        traits.add("class_druid")
-        traits.add("forest_bloodline")
-    elif cls in ("warlock", "sorcerer"):
-        traits.add("class_warlock")
-        traits.add("pact_bound")
-    elif cls in ("wizard", "mage"):
-        traits.add("class_wizard")
-        traits.add("arcane_mind")
-    elif cls in ("barbarian", "berserker"):
-        traits.add("class_barbarian")
-        traits.add("rage_bloodline")
-    elif cls in ("monk", "battle_monk"):
-        traits.add("class_monk")
-        traits.add("chi_disciple")
-    elif cls in ("bard",):
-        traits.add("class_bard")
-        traits.add("story_weaver")
-
-    return traits
-
-
-def _tree_traits(agent: Dict[str, Any]) -> Set[str]:
-    """
-    Map known level-tree node_ids to coarse-grained traits.
-    Keeps this human-readable and easy to extend.
-    """
-    traits: Set[str] = set()
-    unlocks = agent.get("unlocks") or {}
-    level_nodes: List[str] = unlocks.get("level_nodes") or []
-
-    node_set = set(level_nodes)
-
+_CLASS_PALADIN = frozenset({"class_paladin", "divine_knight"})
+_CLASS_ROGUE = frozenset({"class_rogue", "trickster_heart"})
+_CLASS_CLERIC = frozenset({"class_cleric", "divine_channel"})
+_CLASS_DRUID = frozenset({"class_druid", "forest_bloodline"})
+_CLASS_WARLOCK = frozenset({"class_warlock", "pact_bound"})
+_CLASS_WIZARD = frozenset({"class_wizard", "arcane_mind"})
+_CLASS_BARBARIAN = frozenset({"class_barbarian", "rage_bloodline"})
+_CLASS_MONK = frozenset({"class_monk", "chi_disciple"})
+_CLASS_BARD = frozenset({"class_bard", "story_weaver"})
+
+# Lower-cased dnd_class (including aliases) -> traits
+_CLASS_TRAITS: Dict[str, FrozenSet[str]] = {
+    "paladin": _CLASS_PALADIN,
+    "rogue": _CLASS_ROGUE,
+    "cleric": _CLASS_CLERIC,
+    "priest": _CLASS_CLERIC,
+    "druid": _CLASS_DRUID,
+    "forest_druid": _CLASS_DRUID,
+    "warlock": _CLASS_WARLOCK,
+    "sorcerer": _CLASS_WARLOCK,
+    "wizard": _CLASS_WIZARD,
+    "mage": _CLASS_WIZARD,
+    "barbarian": _CLASS_BARBARIAN,
+    "berserker": _CLASS_BARBARIAN,
+    "monk": _CLASS_MONK,
+    "battle_monk": _CLASS_MONK,
+    "bard": _CLASS_BARD,
+}
+
+# Level-tree node_id -> traits
+_NODE_TRAITS: Dict[str, FrozenSet[str]] = {
     # Titania core tree
-    if "TITANIA_GRACE_SPARK" in node_set:
-        traits.add("titania_sparked")
-        traits.add("forest_guardian")
-
-    if "TITANIA_WEIRD_BLOOM" in node_set:
-        traits.add("weird_walks_with_fey")
-
+    "TITANIA_GRACE_SPARK": frozenset({"titania_sparked", "forest_guardian"}),
+    "TITANIA_WEIRD_BLOOM": frozenset({"weird_walks_with_fey"}),
     # Paladin oath tree
-    if "PALADIN_OATH_INITIATE" in node_set:
-        traits.add("oathbound")
-        traits.add("vow_keeper")
-
-    if "PALADIN_OATH_FOREST_SENTINEL" in node_set:
-        traits.add("forest_sentinel")
-
+    "PALADIN_OATH_INITIATE": frozenset({"oathbound", "vow_keeper"}),
+    "PALADIN_OATH_FOREST_SENTINEL": frozenset({"forest_sentinel"}),
     # Oberon trade tree
-    if "OBERON_MERCHANT_MARK" in node_set:
-        traits.add("merchant_marked")
-        traits.add("trade_blessed")
-
+    "OBERON_MERCHANT_MARK": frozenset({"merchant_marked", "trade_blessed"}),
     # Bottom masquerade tree
-    if "BOTTOM_TRICKSTERS_MARK" in node_set:
-        traits.add("bottom_favored")
-        traits.add("mask_trickster")
-
+    "BOTTOM_TRICKSTERS_MARK": frozenset({"bottom_favored", "mask_trickster"}),
     # Lovers bond tree
-    if "LOVERS_FIRST_BOND" in node_set:
-        traits.add("lover_bonded")
-        traits.add("heart_marked")
-
-    return traits
-
-
-def _favor_traits(favor: Dict[str, float]) -> Set[str]:
-    traits: Set[str] = set()
-
-    t = float(favor.get("Titania", 0.0))
-    o = float(favor.get("Oberon", 0.0))
-    b = float(favor.get("Bottom", 0.0))
-    k = float(favor.get("King", 0.0))
-    q = float(favor.get("Queen", 0.0))
-    l = float(favor.get("Lovers", 0.0))
+    "LOVERS_FIRST_BOND": frozenset({"lover_bonded", "heart_marked"}),
+}
 
+# (patron, ((threshold, traits), ...)) -- bands are checked highest first and
+# only the first matching band applies.
+_FAVOR_BANDS: Tuple[Tuple[str, Tuple[Tuple[float, FrozenSet[str]], ...]], ...] = (
     # Titania: forest, weirdness, fate
-    if t >= 0.7:
-        traits.add("titania_chosen")
-    elif t >= 0.4:
-        traits.add("titania_favored")
-
+    ("Titania", (
+        (0.7, frozenset({"titania_chosen"})),
+        (0.4, frozenset({"titania_favored"})),
+    )),
     # Oberon: order, trade, contracts
-    if o >= 0.7:
-        traits.add("oberon_chosen")
-        traits.add("contracts_first")
-    elif o >= 0.4:
-        traits.add("oberon_favored")
-
+    ("Oberon", (
+        (0.7, frozenset({"oberon_chosen", "contracts_first"})),
+        (0.4, frozenset({"oberon_favored"})),
+    )),
     # Bottom: weird, chaos, theater
-    if b >= 0.7:
-        traits.add("bottom_chosen")
-        traits.add("embraces_chaos")
-    elif b >= 0.4:
-        traits.add("bottom_favored")
-
+    ("Bottom", (
+        (0.7, frozenset({"bottom_chosen", "embraces_chaos"})),
+        (0.4, frozenset({"bottom_favored"})),
+    )),
     # King: stable rule, no raw evil
-    if k >= 0.7:
-        traits.add("king_chosen")
-    elif k >= 0.4:
-        traits.add("king_favored")
-
+    ("King", (
+        (0.7, frozenset({"king_chosen"})),
+        (0.4, frozenset({"king_favored"})),
+    )),
     # Queen: weird research, spy network
-    if q >= 0.7:
-        traits.add("queen_chosen")
-        traits.add("spy_network_friend")
-    elif q >= 0.4:
-        traits.add("queen_favored")
-
+    ("Queen", (
+        (0.7, frozenset({"queen_chosen", "spy_network_friend"})),
+        (0.4, frozenset({"queen_favored"})),
+    )),
     # Lovers: romance, bonds, social risk
-    if l >= 0.7:
-        traits.add("lovers_chosen")
-    elif l >= 0.4:
-        traits.add("lovers_favored")
+    ("Lovers", (
+        (0.7, frozenset({"lovers_chosen"})),
+        (0.4, frozenset({"lovers_favored"})),
+    )),
+)
+
+
+def _class_key(agent: Dict[str, Any]) -> str:
+    cls = (agent.get("class") or {}).get("dnd_class")
+    return str(cls).lower() if cls else ""
+
 
-    return traits
+def _node_key(agent: Dict[str, Any]) -> FrozenSet[str]:
+    """Unlocked level-tree node_ids that map to traits (see _NODE_TRAITS)."""
+    unlocks = agent.get("unlocks") or {}
+    level_nodes: List[str] = unlocks.get("level_nodes") or []
+    return frozenset(n for n in level_nodes if n in _NODE_TRAITS)
+
+
+def _favor_key(favor: Dict[str, float]) -> Tuple[int, ...]:
+    """
+    Per patron in _FAVOR_BANDS, the index of the first band reached
+    (len(bands) if none). Agents with the same key get the same favor traits.
+    """
+    key: List[int] = []
+    for patron, bands in _FAVOR_BANDS:
+        value = float(favor.get(patron, 0.0))
+        idx = len(bands)
+        for i, (threshold, _) in enumerate(bands):
+            if value >= threshold:
+                idx = i
+                break
+        key.append(idx)
+    return tuple(key)
+
+
+class _DerivedTraits(NamedTuple):
+    # Each source pre-sorted, plus their union as a set and sorted.
+    class_traits: Tuple[str, ...]
+    tree_traits: Tuple[str, ...]
+    favor_traits: Tuple[str, ...]
+    union: FrozenSet[str]
+    union_sorted: Tuple[str, ...]
+
+
+@lru_cache(maxsize=4096)
+def _derived_traits(
+    class_key: str,
+    node_key: FrozenSet[str],
+    favor_key: Tuple[int, ...],
+) -> _DerivedTraits:
+    """
+    Class, tree and favor traits for one canonical agent shape.
+    Many NPCs share class, unlocks and favor bands, so this is cached, and
+    the sorting the public output needs is done here once per shape.
+    """
+    class_tr = _CLASS_TRAITS.get(class_key, frozenset())
+    tree_tr = frozenset().union(*(_NODE_TRAITS[n] for n in node_key))
+    favor_tr = frozenset().union(*(
+        bands[idx][1]
+        for (_, bands), idx in zip(_FAVOR_BANDS, favor_key)
+        if idx < len(bands)
+    ))
+    union = class_tr | favor_tr | tree_tr
+    return _DerivedTraits(
+        class_traits=tuple(sorted(class_tr)),
+        tree_traits=tuple(sorted(tree_tr)),
+        favor_traits=tuple(sorted(favor_tr)),
+        union=union,
+        union_sorted=tuple(sorted(union)),
+    )
 
 
 def derive_traits_for_agent(agent: Dict[str, Any]) -> Dict[str, Any]:
@@ -178,14 +189,16 @@ def derive_traits_for_agent(agent: Dict[str, Any]) -> Dict[str, Any]:
     }
     """
     base_tags = set(agent.get("tags") or [])
-    class_tr = _class_traits(agent)
 
     favor = compute_favor_for_agent(agent)
-    favor_tr = _favor_traits(favor)
 
-    tree_tr = _tree_traits(agent)
+    derived = _derived_traits(_class_key(agent), _node_key(agent), _favor_key(favor))
 
-    all_traits = base_tags | class_tr | favor_tr | tree_tr
+    # Only base tags vary per agent; everything else comes pre-sorted.
+    if base_tags:
+        all_traits = sorted(base_tags | derived.union)
+    else:
+        all_traits = list(derived.union_sorted)
 
     cls = (agent.get("class") or {}).get("dnd_class")
     lvl = (agent.get("class") or {}).get("level")
@@ -195,12 +208,12 @@ def derive_traits_for_agent(agent: Dict[str, Any]) -> Dict[str, Any]:
         "class": cls,
         "level": lvl,
         "favor": favor,
-        "traits": sorted(all_traits),
+        "traits": all_traits,
         "sources": {
             "base_tags": sorted(base_tags),
-            "class_traits": sorted(class_tr),
-            "tree_traits": sorted(tree_tr),
-            "favor_traits": sorted(favor_tr),
+            "class_traits": list(derived.class_traits),
+            "tree_traits": list(derived.tree_traits),
+            "favor_traits": list(derived.favor_traits),
         },
     }
 
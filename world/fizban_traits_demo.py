@@ -9,9 +9,9 @@ Preview trait derivation for Paladin + Puck.
 from __future__ import annotations
 
 from pathlib import Path
-import json
 
-from fizban_level_menu import _load_agent_from_v2
+from fizban_json import print_json
+from fizban_agent_config import load_agent_dict_from_v2
 from fizban_traits import derive_traits_for_agent
 
 
@@ -19,8 +19,8 @@ def _demo() -> int:
     base_dir = Path(__file__).resolve().parent
     examples = base_dir / "examples"
 
-    paladin = _load_agent_from_v2(examples / "agent_paladin_v2.json")
-    puck = _load_agent_from_v2(examples / "agent_puck_v2.json")
+    paladin = load_agent_dict_from_v2(examples / "agent_paladin_v2.json")
+    puck = load_agent_dict_from_v2(examples / "agent_puck_v2.json")
 
     paladin_traits = derive_traits_for_agent(paladin)
     puck_traits = derive_traits_for_agent(puck)
@@ -30,7 +30,7 @@ def _demo() -> int:
         "puck_traits": puck_traits,
     }
 
-    print(json.dumps(out, indent=2))
+    print_json(out)
     return 0
 
 
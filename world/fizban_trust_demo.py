@@ -15,11 +15,13 @@ Demo: Paladin vs Puck trust evolution.
 
 from __future__ import annotations
 
-import json
 from typing import List, Dict
 
 from fizban_alignment_math import alignment_to_axes
+from fizban_json import print_json
 from fizban_trust_math import (
+    MIRRORED_OUTCOME,
+    TrustHistory,
     TrustState,
     init_trust_state,
     update_trust_state,
@@ -59,20 +61,12 @@ def main() -> int:
     # For Puck's POV, the outcomes are mirrored:
     #   if Paladin's POV is "CD", then Puck's POV is "DC".
     rounds_paladin = ["CC", "CC", "CC", "CD", "CC"]
-    rounds_puck = []
-    for out in rounds_paladin:
-        if out == "CC":
-            rounds_puck.append("CC")
-        elif out == "CD":
-            rounds_puck.append("DC")
-        elif out == "DC":
-            rounds_puck.append("CD")
-        elif out == "DD":
-            rounds_puck.append("DD")
-
-    history: List[Dict[str, object]] = []
-
-    for i, (pal_out, puck_out) in enumerate(zip(rounds_paladin, rounds_puck), start=1):
+    rounds_puck = [MIRRORED_OUTCOME[out] for out in rounds_paladin]
+
+    pal_history = TrustHistory()
+    puck_history = TrustHistory()
+
+    for pal_out, puck_out in zip(rounds_paladin, rounds_puck):
         # Basic emotional tweaks per round (toy values)
         awe_boost_pal = 0.05 if pal_out == "CC" else 0.0
         awe_boost_puck = 0.05 if puck_out == "CC" else 0.02
@@ -96,21 +90,26 @@ def main() -> int:
             bounce=0.1,
         )
 
-        history.append(
-            {
-                "round": i,
-                "paladin_outcome": pal_out,
-                "puck_outcome": puck_out,
-                "paladin_trust": new_pal_trust.to_dict(),
-                "puck_trust": new_puck_trust.to_dict(),
-                "paladin_deltas": deltas_pal,
-                "puck_deltas": deltas_puck,
-            }
-        )
+        pal_history.append(new_pal_trust, deltas_pal)
+        puck_history.append(new_puck_trust, deltas_puck)
 
         paladin_trust = new_pal_trust
         puck_trust = new_puck_trust
 
+    # Rows are only materialized here, for the JSON dump.
+    history: List[Dict[str, object]] = [
+        {
+            "round": i + 1,
+            "paladin_outcome": pal_history.outcomes[i],
+            "puck_outcome": puck_history.outcomes[i],
+            "paladin_trust": pal_history.state_dict(i),
+            "puck_trust": puck_history.state_dict(i),
+            "paladin_deltas": pal_history.deltas_dict(i),
+            "puck_deltas": puck_history.deltas_dict(i),
+        }
+        for i in range(len(pal_history))
+    ]
+
     snapshot = {
         "paladin_alignment": paladin_alignment.__dict__,
         "puck_alignment": puck_alignment.__dict__,
@@ -118,7 +117,7 @@ def main() -> int:
     }
 
     print("=== Paladin vs Puck Trust Demo ===")
-    print(json.dumps(snapshot, indent=2))
+    print_json(snapshot)
     print("\nNote: You can save this JSON to world/examples/ and replay it later.\n")
     return 0
 
@@ -19,6 +19,9 @@ Trust + bounce-back math for Fizban.
     init_trust_state(my_alignment, other_alignment, *, base_gossip=0.0) -> TrustState
     update_trust_state(state, outcome, *, awe_boost=0.0, boredom_boost=0.0,
                        gossip_delta=0.0, bounce=0.1) -> (TrustState, deltas)
+    update_trust_states(states, outcomes, *, ...) -> [(TrustState, deltas), ...]
+    MIRRORED_OUTCOME[outcome] -> the same round from the other agent's POV
+    TrustHistory -> columnar per-round log of one agent's TrustState + deltas
 
 Where:
     outcome is from my point of view:
@@ -26,12 +29,15 @@ Where:
         "CD" = I cooperated, you defected (you betrayed me)
         "DC" = I defected, you cooperated (I exploited you)
         "DD" = both defected
+    (or the matching Outcome member, which skips string parsing)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, Tuple
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Sequence, Tuple
 
 from fizban_alignment_math import (
     alignment_compatibility,
@@ -40,7 +46,7 @@ from fizban_alignment_math import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TrustState:
     # Core weights
     affinity: float       # [-1, +1]
@@ -59,8 +65,107 @@ class TrustState:
     expected_strategy: str
 
     def to_dict(self) -> Dict[str, object]:
-        """Serialize to a dict suitable for JSON."""
-        return asdict(self)
+        """Serialize to a dict suitable for JSON (same shape as asdict)."""
+        return {
+            "affinity": self.affinity,
+            "gossip_bias": self.gossip_bias,
+            "awe": self.awe,
+            "boredom": self.boredom,
+            "last_outcome": self.last_outcome,
+            "betrayal_count": self.betrayal_count,
+            "cooperation_streak": self.cooperation_streak,
+            "expected_strategy": self.expected_strategy,
+        }
+
+
+# The same round seen from the other side: my "CD" is their "DC".
+MIRRORED_OUTCOME: Dict[str, str] = {
+    "CC": "CC",
+    "CD": "DC",
+    "DC": "CD",
+    "DD": "DD",
+}
+
+
+class Outcome(IntEnum):
+    """Round outcome from my POV; parsed once from the "CC"/"CD"/... strings."""
+
+    CC = 0
+    CD = 1
+    DC = 2
+    DD = 3
+
+
+# "CC" -> Outcome.CC, ... (member names are interned, so last_outcome
+# strings taken from .name compare on identity)
+_PARSE_OUTCOME: Dict[str, Outcome] = {o.name: o for o in Outcome}
+
+
+def _parse_outcome(outcome: str | Outcome) -> Outcome:
+    # Canonical "CC"/"CD"/... strings (the usual case: scripts, MIRRORED_OUTCOME)
+    # hit the table directly; only other spellings pay for .upper().
+    parsed = _PARSE_OUTCOME.get(outcome)
+    if parsed is not None:
+        return parsed
+    if isinstance(outcome, Outcome):
+        return outcome
+    key = outcome.upper()
+    try:
+        return _PARSE_OUTCOME[key]
+    except KeyError:
+        raise ValueError(f"Unknown outcome: {key!r}") from None
+
+
+_BASE_STEP = 0.15  # how much a single round can shift affinity
+
+# Indexed by Outcome: (delta_affinity, delta_betrayal, delta_coop_streak)
+_EFFECTS: Tuple[Tuple[float, float, float], ...] = (
+    # CC: trust reinforcement
+    (+_BASE_STEP, 0.0, +1.0),
+    # CD: they stabbed me in the back; drop affinity hard
+    (-2.0 * _BASE_STEP, +1.0, 0.0),
+    # DC: I exploited them; may slightly *lower* my affinity (guilt) or
+    # slightly raise (if I'm evil). For now, small negative.
+    (-0.05, 0.0, 0.0),
+    # DD: both defect; cynicism rises a bit, so small affinity drop, reset streak
+    (-0.1, 0.0, 0.0),
+)
+
+
+class _OutcomePlan(NamedTuple):
+    """Everything update_trust_state needs that depends only on the outcome."""
+
+    daff: float
+    dbetray: float
+    dcoop: float
+    mutual_coop: bool
+    deltas: Dict[str, float]  # template; copied before it is handed out
+
+
+def _make_plan(outcome: Outcome) -> _OutcomePlan:
+    daff, dbetray, dcoop = _EFFECTS[outcome]
+    # Map betrayal / coop to fate deltas (Titania's Grace) heuristically:
+    # - repeated betrayal increases mental strain, lowers grace
+    # - cooperation streak increases grace, reduces strain
+    delta_mental_strain = 0.1 * dbetray - 0.02 * dcoop
+    delta_grace = 0.05 * dcoop - 0.05 * dbetray
+    return _OutcomePlan(
+        daff,
+        dbetray,
+        dcoop,
+        outcome is Outcome.CC,
+        {
+            "delta_affinity": daff,
+            "delta_betrayal": dbetray,
+            "delta_coop_streak": dcoop,
+            "delta_grace": delta_grace,
+            "delta_mental_strain": delta_mental_strain,
+        },
+    )
+
+
+# Indexed by Outcome; specialized once at import.
+_PLANS: Tuple[_OutcomePlan, ...] = tuple(_make_plan(o) for o in Outcome)
 
 
 def clamp(v: float, lo: float, hi: float) -> float:
@@ -112,50 +217,63 @@ def init_trust_state(
     )
 
 
-def _outcome_effects(
-    state: TrustState,
-    outcome: str,
-) -> Tuple[float, float, float]:
+def _trust_step(
+    affinity: float,
+    gossip_bias: float,
+    awe: float,
+    boredom: float,
+    betrayal: float,
+    coop_streak: float,
+    daff: float,
+    dbetray: float,
+    dcoop: float,
+    mutual_coop: bool,
+    awe_boost: float,
+    boredom_boost: float,
+    gossip_delta: float,
+    bounce: float,
+) -> Tuple[float, float, float, float, float, float]:
     """
-    For a single round outcome, compute:
-        delta_affinity, delta_betrayal, delta_coop_streak
-
-    outcome is from *my* POV:
-        "CC" : mutual cooperation
-        "CD" : I cooperated, they defected  -> I feel betrayed
-        "DC" : I defected, they cooperated -> I feel a bit guilty (or emboldened)
-        "DD" : mutual defection
+    Scalar core of update_trust_state: plain floats in, plain floats out
+    (affinity, gossip_bias, awe, boredom, betrayal_count, cooperation_streak),
+    with no attribute access or allocation beyond the result tuple.
     """
-    outcome = outcome.upper()
-    if outcome not in ("CC", "CD", "DC", "DD"):
-        raise ValueError(f"Unknown outcome: {outcome!r}")
+    # Apply outcome effects
+    affinity += daff
+    betrayal += dbetray
+    if mutual_coop:
+        coop_streak += dcoop
+    else:
+        # any non-perfect round resets streak
+        coop_streak = 0.0
 
-    base_step = 0.15  # how much a single round can shift affinity
+    # Clamps below are clamp() written inline to skip a call per field.
 
-    if outcome == "CC":
-        # trust reinforcement
-        return (+base_step, 0.0, +1.0)
+    # Apply gossip
+    gossip = gossip_bias + gossip_delta
+    gossip = -1.0 if gossip < -1.0 else 1.0 if gossip > 1.0 else gossip
 
-    if outcome == "CD":
-        # They stabbed me in the back; drop affinity hard
-        return (-2.0 * base_step, +1.0, 0.0)
+    # Awe/Boredom short-term tweaks
+    awe += awe_boost
+    awe = 0.0 if awe < 0.0 else 1.0 if awe > 1.0 else awe
+    boredom += boredom_boost
+    boredom = 0.0 if boredom < 0.0 else 1.0 if boredom > 1.0 else boredom
 
-    if outcome == "DC":
-        # I exploited them; may slightly *lower* my affinity (guilt) or
-        # slightly raise (if I'm evil). For now, small negative.
-        return (-0.05, 0.0, 0.0)
+    # Bounce-back toward neutral (0 affinity) over time
+    # If bounce > 0, slowly move affinity toward 0 depending on boredom (more bored -> faster decay)
+    if bounce > 0.0:
+        decay_factor = bounce * (0.5 + 0.5 * boredom)  # boredom speeds up "meh"
+        affinity -= decay_factor * affinity
 
-    if outcome == "DD":
-        # both defect; cynicism rises a bit, so small affinity drop, reset streak
-        return (-0.1, 0.0, 0.0)
+    # Clamp affinity range
+    affinity = -1.0 if affinity < -1.0 else 1.0 if affinity > 1.0 else affinity
 
-    # unreachable
-    return (0.0, 0.0, 0.0)
+    return affinity, gossip, awe, boredom, betrayal, coop_streak
 
 
 def update_trust_state(
     state: TrustState,
-    outcome: str,
+    outcome: str | Outcome,
     *,
     awe_boost: float = 0.0,
     boredom_boost: float = 0.0,
@@ -165,7 +283,7 @@ def update_trust_state(
     """
     Update a TrustState in-place-ish (returns a new copy) given a round outcome.
 
-    - outcome: "CC","CD","DC","DD" from *my* point of view
+    - outcome: "CC","CD","DC","DD" (or an Outcome) from *my* point of view
     - awe_boost / boredom_boost:
         short-term emotional modifiers from the encounter (e.g. heroic act raises awe)
     - gossip_delta:
@@ -182,62 +300,149 @@ def update_trust_state(
             "delta_mental_strain": ...,
         }
     """
-    outcome = outcome.upper()
-    daff, dbetray, dcoop = _outcome_effects(state, outcome)
-
-    # Start from previous
-    affinity = state.affinity
-    betrayal = state.betrayal_count
-    coop_streak = state.cooperation_streak
-
-    # Apply outcome effects
-    affinity += daff
-    betrayal += dbetray
-    if outcome == "CC":
-        coop_streak += dcoop
-    else:
-        # any non-perfect round resets streak
-        coop_streak = 0.0
-
-    # Apply gossip
-    gossip = clamp(state.gossip_bias + gossip_delta, -1.0, 1.0)
-
-    # Awe/Boredom short-term tweaks
-    awe = clamp(state.awe + awe_boost, 0.0, 1.0)
-    boredom = clamp(state.boredom + boredom_boost, 0.0, 1.0)
-
-    # Bounce-back toward neutral (0 affinity) over time
-    # If bounce > 0, slowly move affinity toward 0 depending on boredom (more bored -> faster decay)
-    if bounce > 0.0:
-        decay_factor = bounce * (0.5 + 0.5 * boredom)  # boredom speeds up "meh"
-        affinity -= decay_factor * affinity
-
-    # Clamp affinity range
-    affinity = clamp(affinity, -1.0, 1.0)
-
-    # Map betrayal / coop to fate deltas (Titania's Grace) heuristically:
-    # - repeated betrayal increases mental strain, lowers grace
-    # - cooperation streak increases grace, reduces strain
-    delta_mental_strain = 0.1 * dbetray - 0.02 * dcoop
-    delta_grace = 0.05 * dcoop - 0.05 * dbetray
+    parsed = _parse_outcome(outcome)
+    plan = _PLANS[parsed]
+
+    affinity, gossip, awe, boredom, betrayal, coop_streak = _trust_step(
+        state.affinity,
+        state.gossip_bias,
+        state.awe,
+        state.boredom,
+        state.betrayal_count,
+        state.cooperation_streak,
+        plan.daff,
+        plan.dbetray,
+        plan.dcoop,
+        plan.mutual_coop,
+        awe_boost,
+        boredom_boost,
+        gossip_delta,
+        bounce,
+    )
 
     new_state = TrustState(
         affinity=affinity,
         gossip_bias=gossip,
         awe=awe,
         boredom=boredom,
-        last_outcome=outcome,
+        last_outcome=parsed.name,
         betrayal_count=betrayal,
         cooperation_streak=coop_streak,
         expected_strategy=state.expected_strategy,
     )
 
-    deltas = {
-        "delta_affinity": daff,
-        "delta_betrayal": dbetray,
-        "delta_coop_streak": dcoop,
-        "delta_grace": delta_grace,
-        "delta_mental_strain": delta_mental_strain,
-    }
-    return new_state, deltas
+    return new_state, dict(plan.deltas)
+
 
+def update_trust_states(
+    states: Sequence[TrustState],
+    outcomes: Sequence[str | Outcome],
+    *,
+    awe_boost: float = 0.0,
+    boredom_boost: float = 0.0,
+    gossip_delta: float = 0.0,
+    bounce: float = 0.1,
+) -> List[Tuple[TrustState, Dict[str, float]]]:
+    """
+    Advance many pair states by one tick, outcomes[i] applying to states[i].
+
+    Same math as update_trust_state with the modifiers shared by every pair;
+    outcomes are all validated before any state is touched.
+    """
+    if len(states) != len(outcomes):
+        raise ValueError("states and outcomes must have the same length")
+
+    normalized = [_parse_outcome(o) for o in outcomes]
+
+    return [
+        update_trust_state(
+            state,
+            outcome,
+            awe_boost=awe_boost,
+            boredom_boost=boredom_boost,
+            gossip_delta=gossip_delta,
+            bounce=bounce,
+        )
+        for state, outcome in zip(states, normalized)
+    ]
+
+
+# --- history ---------------------------------------------------------------
+
+# Float columns, in TrustState.to_dict / deltas key order.
+_STATE_FLOAT_FIELDS = (
+    "affinity",
+    "gossip_bias",
+    "awe",
+    "boredom",
+    "betrayal_count",
+    "cooperation_streak",
+)
+_DELTA_FIELDS = (
+    "delta_affinity",
+    "delta_betrayal",
+    "delta_coop_streak",
+    "delta_grace",
+    "delta_mental_strain",
+)
+
+
+class TrustHistory:
+    """
+    Columnar (struct-of-arrays) log of one agent's trust over many rounds.
+
+    Each float field is an array('d') column, so a long run costs a few
+    bytes per field per round instead of two dicts per round. Rows are
+    rebuilt on demand (state_dict / deltas_dict) in the same shape as
+    TrustState.to_dict() and update_trust_state's deltas.
+    """
+
+    __slots__ = ("outcomes", "strategies", "_state_cols", "_delta_cols")
+
+    def __init__(self) -> None:
+        self.outcomes: List[str] = []
+        self.strategies: List[str] = []
+        self._state_cols = {name: array("d") for name in _STATE_FLOAT_FIELDS}
+        self._delta_cols = {name: array("d") for name in _DELTA_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def append(self, state: TrustState, deltas: Dict[str, float]) -> None:
+        """Record the state and deltas returned by one update_trust_state call."""
+        self.outcomes.append(state.last_outcome)
+        self.strategies.append(state.expected_strategy)
+        for name, col in self._state_cols.items():
+            col.append(getattr(state, name))
+        for name, col in self._delta_cols.items():
+            col.append(deltas[name])
+
+    def state_dict(self, i: int) -> Dict[str, object]:
+        """Round i's TrustState, as TrustState.to_dict() would give it."""
+        cols = self._state_cols
+        return {
+            "affinity": cols["affinity"][i],
+            "gossip_bias": cols["gossip_bias"][i],
+            "awe": cols["awe"][i],
+            "boredom": cols["boredom"][i],
+            "last_outcome": self.outcomes[i],
+            "betrayal_count": cols["betrayal_count"][i],
+            "cooperation_streak": cols["cooperation_streak"][i],
+            "expected_strategy": self.strategies[i],
+        }
+
+    def deltas_dict(self, i: int) -> Dict[str, float]:
+        """Round i's deltas dict."""
+        return {name: col[i] for name, col in self._delta_cols.items()}
+
+    def columns(self) -> Dict[str, List[object]]:
+        """Whole history as JSON-ready columns (one list per field)."""
+        out: Dict[str, List[object]] = {
+            "last_outcome": list(self.outcomes),
+            "expected_strategy": list(self.strategies),
+        }
+        for name, col in self._state_cols.items():
+            out[name] = col.tolist()
+        for name, col in self._delta_cols.items():
+            out[name] = col.tolist()
+        return out
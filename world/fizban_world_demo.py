@@ -14,11 +14,11 @@ High-level demo:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import List
 
 from fizban_agent_config import load_agent_config
+from fizban_json import print_json
 from fizban_world_state import (
     init_world_from_configs,
     play_interaction,
@@ -43,7 +43,7 @@ def run_script(script: List[str]) -> dict:
 
     return {
         "world_final": world_to_dict(world),
-        "history": world.history,
+        "history": list(world.history),
         "destiny": destiny,
         "script": script,
     }
@@ -54,7 +54,7 @@ def main() -> None:
     script = ["CC", "CC", "CC", "CD", "CC"]
 
     result = run_script(script)
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print_json(result)
 
 
 if __name__ == "__main__":
@@ -8,13 +8,15 @@ Glue layer that:
 - attaches sentient items (e.g. forest heirloom) when appropriate
 - applies item fate modifiers
 
-Does NOT mutate other world modules; it just wraps and returns an enriched copy.
+Does NOT mutate other world modules or its inputs; it just wraps and returns an
+enriched copy. Copies are shallow: only containers that enrichment rewrites are
+new, everything else is shared with the input world, so copy before mutating
+nested data in either one (or pass isolated=True to enrich_world).
 """
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
 
 from fizban_bloodline import (
     evaluate_bloodline_progress,
@@ -22,6 +24,7 @@ from fizban_bloodline import (
     make_bloodline_demonic_infernal,
     make_bloodline_forest_heir_druidic,
 )
+from fizban_json import clone_json
 from fizban_sentient_item import (
     apply_item_to_fate,
     granted_abilities_for_item,
@@ -69,48 +72,66 @@ def _agent_level(agent: Agent) -> int:
 # --- bloodline inference --------------------------------------------------
 
 
-def infer_candidate_bloodlines(agent: Agent) -> Dict[str, Any]:
+# The bloodline definitions are static; build them once and share them.
+# evaluate_bloodline_progress only reads them.
+_ANGELIC = make_bloodline_angelic_scion()
+_INFERNAL = make_bloodline_demonic_infernal()
+_FOREST = make_bloodline_forest_heir_druidic()
+
+# Candidate rules: (id, bloodline, any-of tags, any-of dnd classes).
+# Each check is one C-level set test instead of a chain of `in` tests.
+_BLOODLINE_RULES = (
+    # Paladin / heroic -> angelic
+    ("angelic", _ANGELIC, frozenset({"class_paladin", "hero"}), frozenset({"paladin"})),
+    # Rogue / trickster / ambitious -> infernal
+    (
+        "infernal",
+        _INFERNAL,
+        frozenset({"class_rogue", "trickster", "ambitious"}),
+        frozenset({"rogue"}),
+    ),
+    # Forest child / druid -> forest heir
+    ("forest", _FOREST, frozenset({"forest_child"}), frozenset({"druid"})),
+)
+
+
+def infer_candidate_bloodlines(
+    agent: Agent,
+    tags: Optional[Set[str]] = None,
+) -> Dict[str, Any]:
     """
     Decide which bloodlines are worth checking for this agent, based on tags/class.
-    Returns a dict of id -> Bloodline instance.
+    Returns a dict of id -> Bloodline instance (shared module-level
+    definitions; treat them as read-only).
+
+    `tags` is the agent's tag set, if the caller already built it.
     """
-    tags = set(_ensure_list_tags(agent))
+    if tags is None:
+        tags = set(_ensure_list_tags(agent))
     dnd_class = (agent.get("class") or {}).get("dnd_class", "").lower()
 
     candidates = {}
-
-    # Paladin / heroic -> angelic
-    if "class_paladin" in tags or dnd_class == "paladin" or "hero" in tags:
-        candidates["angelic"] = make_bloodline_angelic_scion()
-
-    # Rogue / trickster / ambitious -> infernal
-    if (
-        "class_rogue" in tags
-        or dnd_class == "rogue"
-        or "trickster" in tags
-        or "ambitious" in tags
-    ):
-        candidates["infernal"] = make_bloodline_demonic_infernal()
-
-    # Forest child / druid -> forest heir
-    if "forest_child" in tags or dnd_class == "druid":
-        candidates["forest"] = make_bloodline_forest_heir_druidic()
+    for key, bloodline, trigger_tags, trigger_classes in _BLOODLINE_RULES:
+        if dnd_class in trigger_classes or not trigger_tags.isdisjoint(tags):
+            candidates[key] = bloodline
 
     return candidates
 
 
-def enrich_agent_bloodlines(agent: Agent) -> Agent:
+def enrich_agent_bloodlines(agent: Agent, tags: Optional[Set[str]] = None) -> Agent:
     """
     Attach bloodline progression info under agent["bloodlines"].
+    `tags` is the agent's tag set, if the caller already built it.
     """
-    agent = deepcopy(agent)
+    agent = dict(agent)
     level = _agent_level(agent)
     fate = agent.get("fate") or {}
     weird_level = _get_weird_level_from_fate(fate)
     favor = _agent_favor(agent)
-    tags = _ensure_list_tags(agent)
+    if tags is None:
+        tags = set(_ensure_list_tags(agent))
 
-    candidates = infer_candidate_bloodlines(agent)
+    candidates = infer_candidate_bloodlines(agent, tags)
     bloodlines_out: Dict[str, Any] = {}
 
     for key, bl in candidates.items():
@@ -134,12 +155,15 @@ def enrich_agent_bloodlines(agent: Agent) -> Agent:
 # --- sentient item attachment ---------------------------------------------
 
 
-def maybe_attach_forest_heirloom(agent: Agent) -> Agent:
+def maybe_attach_forest_heirloom(agent: Agent, tags: Optional[Set[str]] = None) -> Agent:
     """
     If the agent looks like a forest heir, attach Heartroot Diadem and apply effects.
+    `tags` is the agent's tag set, if the caller already built it; it is
+    not modified.
     """
-    agent = deepcopy(agent)
-    tags = set(_ensure_list_tags(agent))
+    agent = dict(agent)
+    if tags is None:
+        tags = set(_ensure_list_tags(agent))
     dnd_class = (agent.get("class") or {}).get("dnd_class", "").lower()
 
     # Heuristic: druid + forest_child or a forest bloodline => candidate
@@ -169,7 +193,7 @@ def maybe_attach_forest_heirloom(agent: Agent) -> Agent:
     abilities = granted_abilities_for_item(item, agent_level=level)
     fate_after = apply_item_to_fate(item, fate)
 
-    agent.setdefault("sentient_items", {})
+    agent["sentient_items"] = dict(agent.get("sentient_items") or {})
     agent["sentient_items"][item.id] = {
         "item": item.to_dict(),
         "abilities_granted": abilities,
@@ -177,8 +201,7 @@ def maybe_attach_forest_heirloom(agent: Agent) -> Agent:
     agent["fate"] = fate_after
 
     # Also tag the agent so other systems know they’re bound
-    tags.add("has_sentient_item")
-    agent["tags"] = sorted(tags)
+    agent["tags"] = sorted(tags | {"has_sentient_item"})
 
     return agent
 
@@ -191,28 +214,37 @@ def enrich_agent(agent: Agent) -> Agent:
     Pipeline for one agent:
       - bloodlines
       - sentient forest heirloom (if relevant)
+      - favor values normalized to float, so readers (e.g. session recap)
+        can use agent["favor"] as-is
     """
-    out = enrich_agent_bloodlines(agent)
-    out = maybe_attach_forest_heirloom(out)
+    # Bloodline enrichment doesn't touch tags, so one set serves both steps.
+    tags = set(_ensure_list_tags(agent))
+    out = enrich_agent_bloodlines(agent, tags)
+    out = maybe_attach_forest_heirloom(out, tags)
+    favor = out.get("favor")
+    if favor:
+        out["favor"] = {k: float(v) for k, v in favor.items()}
     return out
 
 
-def enrich_world(world: World) -> World:
+def enrich_world(
+    world: World,
+    isolated: bool = False,
+) -> World:
     """
     Given a world with:
       { "world_final": { "agents": { "Paladin": {..}, "Puck": {..} } } }
 
     return a new world with enriched agents.
+
+    With isolated=True the input is first cloned through a JSON round-trip,
+    so the result shares nothing with the caller's world.
     """
-    world = deepcopy(world)
-    wf = world.get("world_final") or {}
+    world = clone_json(world) if isolated else dict(world)
+    wf = dict(world.get("world_final") or {})
     agents = wf.get("agents") or {}
 
-    new_agents: Dict[str, Any] = {}
-    for name, agent in agents.items():
-        new_agents[name] = enrich_agent(agent)
-
-    wf["agents"] = new_agents
+    wf["agents"] = {name: enrich_agent(agent) for name, agent in agents.items()}
     world["world_final"] = wf
     return world
 
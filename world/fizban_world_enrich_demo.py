@@ -9,8 +9,7 @@ Demo: build a tiny Paladin + Puck world and enrich it with:
 
 from __future__ import annotations
 
-import json
-
+from fizban_json import print_json
 from fizban_world_enrich import enrich_world
 
 
@@ -141,7 +140,7 @@ def build_demo_world() -> dict:
 def main() -> None:
     base_world = build_demo_world()
     enriched = enrich_world(base_world)
-    print(json.dumps(enriched, indent=2))
+    print_json(enriched)
 
 
 if __name__ == "__main__":
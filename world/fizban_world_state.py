@@ -21,9 +21,11 @@ from __future__ import annotations
 import json
 import math
 import random
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, MutableSequence, Optional, Sequence, Set, TextIO, Tuple
 
 from fizban_agent_config import (
     AgentConfig,
@@ -31,6 +33,7 @@ from fizban_agent_config import (
     FateBaseline,
     load_agent_config,
 )
+from fizban_json import dumps_json
 
 
 # ---------------------------------------------------------------------------
@@ -75,7 +78,7 @@ def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, v))
 
 
-@dataclass
+@dataclass(slots=True)
 class TrustState:
     """Runtime trust state vs a specific other agent."""
 
@@ -87,8 +90,20 @@ class TrustState:
     cooperation_streak: float = 0.0
     last_outcome: Optional[str] = None  # "CC", "CD", "DC", "DD"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as asdict(self), without its reflection + deepcopy."""
+        return {
+            "affinity": self.affinity,
+            "gossip_bias": self.gossip_bias,
+            "awe": self.awe,
+            "boredom": self.boredom,
+            "betrayal_count": self.betrayal_count,
+            "cooperation_streak": self.cooperation_streak,
+            "last_outcome": self.last_outcome,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class FateState:
     """Runtime Titania's Grace state for a single agent."""
 
@@ -97,6 +112,15 @@ class FateState:
     mental_strain: float = 0.0
     weird_mode: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as asdict(self), without its reflection + deepcopy."""
+        return {
+            "grace": self.grace,
+            "bounce_back": self.bounce_back,
+            "mental_strain": self.mental_strain,
+            "weird_mode": self.weird_mode,
+        }
+
     @staticmethod
     def from_baseline(b: FateBaseline) -> "FateState":
         return FateState(
@@ -107,7 +131,7 @@ class FateState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentRuntime:
     """Everything we need at runtime for an agent inside the world."""
 
@@ -121,10 +145,46 @@ class AgentRuntime:
     boredom_level: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldState:
     agents: Dict[str, AgentRuntime]
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    # A list; play_interaction swaps it for a deque(maxlen=history_keep)
+    # when history_keep is set.
+    history: MutableSequence[Dict[str, Any]] = field(default_factory=list)
+    # (actor_a, actor_b) -> alignment_compatibility; alignments never change,
+    # so this is filled at init (and lazily for anything added later).
+    compat: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    # world_to_dict snapshot cache: serialized trust per (agent, target) and
+    # fate per agent, rebuilt only for what play_interaction marked dirty.
+    # Call clear_snapshot_cache() after mutating trust/fate any other way.
+    _trust_dicts: Dict[Tuple[str, str], Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _fate_dicts: Dict[str, Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _dirty: Set[Tuple[str, str]] = field(default_factory=set, init=False, repr=False)
+    # (actor_a, actor_b) -> "actor_a vs actor_b" for history entries
+    _pair_labels: Dict[Tuple[str, str], str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Optional streaming for long runs: every history entry is also written
+    # to history_sink as one NDJSON line, and only the most recent
+    # history_keep entries stay in `history` (None = keep everything).
+    history_sink: Optional[TextIO] = None
+    history_keep: Optional[int] = None
+    # Rounds played so far (history may be trimmed, so not len(history)).
+    rounds_played: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.rounds_played:
+            self.rounds_played = len(self.history)
+
+    def clear_snapshot_cache(self) -> None:
+        """Force the next world_to_dict to re-serialize every agent."""
+        self._trust_dicts.clear()
+        self._fate_dicts.clear()
+        self._dirty.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -132,130 +192,143 @@ class WorldState:
 # ---------------------------------------------------------------------------
 
 
-def _update_trust_for_outcome(
-    trust: TrustState,
-    outcome: str,
-    compat: float,
-) -> Dict[str, float]:
+class Outcome(IntEnum):
     """
-    Update trust state given an outcome code (CC, CD, DC, DD)
-    and alignment compatibility.
-
-    This is a simplified, local version of the logic that also appears
-    in fizban_trust_math.py, tuned for readability.
+    Interaction outcome code from one side's POV. The public API takes the
+    "CC"/"CD"/"DC"/"DD" strings; they are translated to this once per
+    interaction and the update helpers index their tables with it.
     """
-    delta_affinity = 0.0
-    delta_betrayal = 0.0
-    delta_coop_streak = 0.0
-
-    # baseline deltas
-    if outcome == "CC":
-        # mutual cooperation, more positive when alignments are compatible
-        delta_affinity = 0.15 * (0.5 + 0.5 * compat)
-        delta_coop_streak = 1.0
-        trust.awe = _clamp(trust.awe + 0.05)
-        trust.boredom = _clamp(trust.boredom - 0.02)
-    elif outcome == "DD":
-        # mutual defection, mistrust grows more with *low* compatibility
-        delta_affinity = -0.1 * (0.5 + 0.5 * (1.0 - compat))
-        delta_coop_streak = 0.0
-        trust.boredom = _clamp(trust.boredom + 0.04)
-        trust.awe = _clamp(trust.awe - 0.03)
-    elif outcome == "CD":
-        # I Cooperate, they Defect (from MY POV) -> I was betrayed
-        delta_affinity = -0.3
-        delta_betrayal = 1.0
-        delta_coop_streak = 0.0
-        trust.awe = _clamp(trust.awe - 0.05)
-        trust.boredom = _clamp(trust.boredom + 0.02)
-    elif outcome == "DC":
-        # I Defect, they Cooperate (from MY POV) -> I exploited them
-        delta_affinity = -0.05
-        delta_betrayal = 0.0
-        delta_coop_streak = 0.0
-        trust.awe = _clamp(trust.awe + 0.02)
-        trust.boredom = _clamp(trust.boredom + 0.01)
-    else:
-        raise ValueError(f"Unknown outcome code: {outcome}")
 
-    trust.affinity = _clamp(trust.affinity + delta_affinity, -1.0, 1.0)
-    trust.betrayal_count = max(0.0, trust.betrayal_count + delta_betrayal)
-    if delta_coop_streak > 0:
-        trust.cooperation_streak += delta_coop_streak
-    else:
-        trust.cooperation_streak = 0.0
-
-    trust.last_outcome = outcome
+    CC = 0
+    CD = 1
+    DC = 2
+    DD = 3
+
+
+_OUTCOME_BY_NAME: Dict[str, Outcome] = {o.name: o for o in Outcome}
+# Outcome -> its string code, for last_outcome and history entries
+_OUTCOME_NAMES: Tuple[str, ...] = tuple(o.name for o in Outcome)
+# Outcome -> the same round from the other side's POV
+_MIRROR_CODE: Tuple[Outcome, ...] = (Outcome.CC, Outcome.DC, Outcome.CD, Outcome.DD)
+
+
+# Per-outcome trust deltas (outcome from MY POV), indexed by Outcome:
+#   (delta_affinity, compat_mode, delta_betrayal, delta_coop_streak,
+#    delta_awe, delta_boredom)
+# compat_mode scales delta_affinity by (0.5 + 0.5 * x) with x = compat (+1),
+# x = 1 - compat (-1), or leaves it constant (0).
+_TRUST_DELTAS: Tuple[Tuple[float, int, float, float, float, float], ...] = (
+    # CC: mutual cooperation, more positive when alignments are compatible
+    (0.15, +1, 0.0, 1.0, +0.05, -0.02),
+    # CD: I Cooperate, they Defect (from MY POV) -> I was betrayed
+    (-0.3, 0, 1.0, 0.0, -0.05, +0.02),
+    # DC: I Defect, they Cooperate (from MY POV) -> I exploited them
+    (-0.05, 0, 0.0, 0.0, +0.02, +0.01),
+    # DD: mutual defection, mistrust grows more with *low* compatibility
+    (-0.1, -1, 0.0, 0.0, -0.03, +0.04),
+)
 
-    return {
-        "delta_affinity": delta_affinity,
-        "delta_betrayal": delta_betrayal,
-        "delta_coop_streak": delta_coop_streak,
-    }
+# Per-outcome fate deltas, indexed by Outcome:
+#   (delta_grace, grace_per_complacence, delta_strain, strain_per_betrayal,
+#    delta_bounce)
+_FATE_DELTAS: Tuple[Tuple[float, float, float, float, float], ...] = (
+    # CC
+    (0.05, 0.02, -0.02, 0.0, 0.01),
+    # CD: I was betrayed
+    (-0.05, 0.0, 0.1, 0.0, -0.02),
+    # DC: I betrayed them
+    (-0.02, 0.0, 0.03, 0.0, 0.0),
+    # DD
+    (-0.03, 0.0, 0.04, 0.02, -0.01),
+)
 
 
-def _update_fate_for_outcome(
-    fate: FateState,
+def _apply_outcome(
     trust: TrustState,
-    outcome: str,
-) -> Dict[str, float]:
-    """
-    Update Titania's Grace / weird-mode knobs based on outcome and current trust.
+    fate: FateState,
+    outcome: Outcome,
+    compat: float,
+) -> Tuple[Dict[str, float], Dict[str, float]]:
     """
-    delta_grace = 0.0
-    delta_strain = 0.0
-    delta_bounce = 0.0
+    Apply one outcome code (from this agent's POV) to its trust toward the
+    other agent and to its own fate, in one pass over local floats.
 
-    # Awe vs boredom act as a local "complacence slider" for how fate
-    # reacts to successes/failures.
-    complacence = trust.awe - trust.boredom  # -1..+1
-
-    if outcome == "CC":
-        delta_grace = 0.05 + 0.02 * complacence
-        delta_strain = -0.02
-        delta_bounce = 0.01
-    elif outcome == "DD":
-        delta_grace = -0.03
-        delta_strain = 0.04 + 0.02 * max(0.0, trust.betrayal_count)
-        delta_bounce = -0.01
-    elif outcome == "CD":
-        # I was betrayed
-        delta_grace = -0.05
-        delta_strain = 0.1
-        delta_bounce = -0.02
-    elif outcome == "DC":
-        # I betrayed them
-        delta_grace = -0.02
-        delta_strain = 0.03
-        delta_bounce = 0.0
+    Returns (trust_deltas, fate_deltas).
+
+    The trust side is a simplified, local version of the logic that also
+    appears in fizban_trust_math.py, tuned for readability. The fate side
+    (Titania's Grace / weird-mode knobs) reads the *updated* trust values,
+    as it did when the two were separate steps.
+    """
+    (
+        delta_affinity,
+        compat_mode,
+        delta_betrayal,
+        delta_coop_streak,
+        delta_awe,
+        delta_boredom,
+    ) = _TRUST_DELTAS[outcome]
+    grace0, grace_k, strain0, strain_k, delta_bounce = _FATE_DELTAS[outcome]
+
+    # --- trust ---
+    if compat_mode > 0:
+        delta_affinity *= 0.5 + 0.5 * compat
+    elif compat_mode < 0:
+        delta_affinity *= 0.5 + 0.5 * (1.0 - compat)
+
+    # Clamps are written inline here (hot path) rather than via _clamp().
+    awe = trust.awe + delta_awe
+    awe = 0.0 if awe < 0.0 else 1.0 if awe > 1.0 else awe
+    boredom = trust.boredom + delta_boredom
+    boredom = 0.0 if boredom < 0.0 else 1.0 if boredom > 1.0 else boredom
+    affinity = trust.affinity + delta_affinity
+    affinity = -1.0 if affinity < -1.0 else 1.0 if affinity > 1.0 else affinity
+    betrayal = max(0.0, trust.betrayal_count + delta_betrayal)
+
+    trust.awe = awe
+    trust.boredom = boredom
+    trust.affinity = affinity
+    trust.betrayal_count = betrayal
+    if delta_coop_streak > 0:
+        trust.cooperation_streak += delta_coop_streak
     else:
-        raise ValueError(f"Unknown outcome code: {outcome}")
+        trust.cooperation_streak = 0.0
+    trust.last_outcome = _OUTCOME_NAMES[outcome]
 
-    fate.grace = _clamp(fate.grace + delta_grace)
-    fate.mental_strain = _clamp(fate.mental_strain + delta_strain)
-    fate.bounce_back = _clamp(fate.bounce_back + delta_bounce)
+    # --- fate ---
+    # Awe vs boredom act as a local "complacence slider" for how fate
+    # reacts to successes/failures (only CC weighs it; DD weighs betrayals).
+    delta_grace = grace0
+    if grace_k:
+        complacence = awe - boredom  # -1..+1
+        delta_grace += grace_k * complacence
+    delta_strain = strain0
+    if strain_k:
+        delta_strain += strain_k * max(0.0, betrayal)
+
+    grace = fate.grace + delta_grace
+    fate.grace = 0.0 if grace < 0.0 else 1.0 if grace > 1.0 else grace
+    strain = fate.mental_strain + delta_strain
+    strain = 0.0 if strain < 0.0 else 1.0 if strain > 1.0 else strain
+    fate.mental_strain = strain
+    bounce = fate.bounce_back + delta_bounce
+    fate.bounce_back = 0.0 if bounce < 0.0 else 1.0 if bounce > 1.0 else bounce
 
     # Weird mode threshold: high sustained strain.
-    fate.weird_mode = fate.mental_strain > 0.7
+    fate.weird_mode = strain > 0.7
 
-    return {
-        "delta_grace": delta_grace,
-        "delta_mental_strain": delta_strain,
-        "delta_bounce_back": delta_bounce,
-    }
-
-
-def _mirror_outcome(outcome: str) -> str:
-    """
-    Given an outcome from A's perspective, return the code from B's perspective.
-    """
-    if outcome in ("CC", "DD"):
-        return outcome
-    if outcome == "CD":
-        return "DC"
-    if outcome == "DC":
-        return "CD"
-    raise ValueError(f"Unknown outcome code: {outcome}")
+    return (
+        {
+            "delta_affinity": delta_affinity,
+            "delta_betrayal": delta_betrayal,
+            "delta_coop_streak": delta_coop_streak,
+        },
+        {
+            "delta_grace": delta_grace,
+            "delta_mental_strain": delta_strain,
+            "delta_bounce_back": delta_bounce,
+        },
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -292,7 +365,17 @@ def init_world_from_configs(configs: List[AgentConfig]) -> WorldState:
             boredom_level=0.0,
         )
 
-    return WorldState(agents=agents)
+    # Compatibility is symmetric and fixed per pair: compute each once.
+    compat: Dict[Tuple[str, str], float] = {}
+    names = list(agents)
+    for i, name_a in enumerate(names):
+        aln_a = agents[name_a].config.alignment
+        for name_b in names[i:]:
+            c = alignment_compatibility(aln_a, agents[name_b].config.alignment)
+            compat[(name_a, name_b)] = c
+            compat[(name_b, name_a)] = c
+
+    return WorldState(agents=agents, compat=compat)
 
 
 def play_interaction(
@@ -310,32 +393,40 @@ def play_interaction(
       - "DC": a defects, b cooperates  (a exploits b)
       - "DD": both defect
     """
-    if outcome_pair not in ("CC", "CD", "DC", "DD"):
+    # Strings stop here; everything below works on Outcome codes.
+    oc_a = _OUTCOME_BY_NAME.get(outcome_pair)
+    if oc_a is None:
         raise ValueError(f"Invalid outcome_pair: {outcome_pair}")
+    oc_b = _MIRROR_CODE[oc_a]
 
     a = world.agents[actor_a]
     b = world.agents[actor_b]
 
-    # fetch or create trust states
-    trust_a = a.trust.get(actor_b) or TrustState()
-    trust_b = b.trust.get(actor_a) or TrustState()
-
-    a.trust[actor_b] = trust_a
-    b.trust[actor_a] = trust_b
-
-    compat = alignment_compatibility(a.config.alignment, b.config.alignment)
-
-    # outcome for each perspective
-    outcome_a = outcome_pair
-    outcome_b = _mirror_outcome(outcome_pair)
-
-    # update trust
-    deltas_a = _update_trust_for_outcome(trust_a, outcome_a, compat)
-    deltas_b = _update_trust_for_outcome(trust_b, outcome_b, compat)
-
-    # update fate
-    fate_deltas_a = _update_fate_for_outcome(a.fate, trust_a, outcome_a)
-    fate_deltas_b = _update_fate_for_outcome(b.fate, trust_b, outcome_b)
+    # fetch or create trust states (only a first meeting allocates / stores)
+    trust_a = a.trust.get(actor_b)
+    if trust_a is None:
+        trust_a = a.trust[actor_b] = TrustState()
+    trust_b = b.trust.get(actor_a)
+    if trust_b is None:
+        trust_b = b.trust[actor_a] = TrustState()
+    pair = (actor_a, actor_b)
+    world._dirty.add(pair)
+    world._dirty.add((actor_b, actor_a))
+
+    compat = world.compat.get(pair)
+    if compat is None:
+        compat = alignment_compatibility(a.config.alignment, b.config.alignment)
+        world.compat[pair] = compat
+        world.compat[(actor_b, actor_a)] = compat
+
+    # One shared "A vs B" label per ordered pair instead of one per round.
+    pair_label = world._pair_labels.get(pair)
+    if pair_label is None:
+        pair_label = world._pair_labels[pair] = f"{actor_a} vs {actor_b}"
+
+    # update trust + fate for each side
+    deltas_a, fate_deltas_a = _apply_outcome(trust_a, a.fate, oc_a, compat)
+    deltas_b, fate_deltas_b = _apply_outcome(trust_b, b.fate, oc_b, compat)
 
     # simple emotional snapshot
     a.awe_level = trust_a.awe
@@ -347,39 +438,77 @@ def play_interaction(
     a.current_emotion = "awe" if a.awe_level > 0.5 else "bored" if a.boredom_level > 0.5 else "calm"
     b.current_emotion = "awe" if b.awe_level > 0.5 else "bored" if b.boredom_level > 0.5 else "calm"
 
-    round_index = len(world.history) + 1
+    world.rounds_played += 1
+    round_index = world.rounds_played
     entry = {
         "round": round_index,
-        "pair": f"{actor_a} vs {actor_b}",
+        "pair": pair_label,
         "compatibility": compat,
         "outcome_pair": outcome_pair,
         "actor_a": {
             "name": actor_a,
-            "outcome": outcome_a,
-            "trust": asdict(trust_a),
-            "fate": asdict(a.fate),
+            "outcome": outcome_pair,
+            "trust": trust_a.to_dict(),
+            "fate": a.fate.to_dict(),
             "trust_deltas": deltas_a,
             "fate_deltas": fate_deltas_a,
         },
         "actor_b": {
             "name": actor_b,
-            "outcome": outcome_b,
-            "trust": asdict(trust_b),
-            "fate": asdict(b.fate),
+            "outcome": _OUTCOME_NAMES[oc_b],
+            "trust": trust_b.to_dict(),
+            "fate": b.fate.to_dict(),
             "trust_deltas": deltas_b,
             "fate_deltas": fate_deltas_b,
         },
     }
 
-    world.history.append(entry)
+    # With history_keep set, history is a bounded deque: the append evicts
+    # the oldest entry in O(1).
+    history = world.history
+    keep = world.history_keep
+    if keep is not None and getattr(history, "maxlen", None) != keep:
+        history = world.history = deque(history, maxlen=keep)
+    history.append(entry)
+    if world.history_sink is not None:
+        world.history_sink.write(dumps_json(entry) + "\n")
     return entry
 
 
+def play_interactions(
+    world: WorldState,
+    interactions: Sequence[Tuple[str, str, str]],
+) -> List[Dict[str, Any]]:
+    """
+    Apply a batch of (actor_a, actor_b, outcome_pair) interactions in order
+    and return their history entries.
+
+    Same rules as play_interaction, but every outcome code and agent name is
+    validated up front, so a bad item leaves the world untouched.
+    """
+    for actor_a, actor_b, outcome_pair in interactions:
+        if outcome_pair not in _OUTCOME_BY_NAME:
+            raise ValueError(f"Invalid outcome_pair: {outcome_pair}")
+        for name in (actor_a, actor_b):
+            if name not in world.agents:
+                raise KeyError(name)
+
+    return [
+        play_interaction(world, actor_a, actor_b, outcome_pair)
+        for actor_a, actor_b, outcome_pair in interactions
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Destiny rolls
 # ---------------------------------------------------------------------------
 
 
+# Bound once: the module-level random's randint, so random.seed() still
+# makes destiny rolls reproducible.
+_randint = random.randint
+
+
 def destiny_roll_for_agent(
     agent: AgentRuntime,
     dc: int = 12,
@@ -397,17 +526,14 @@ def destiny_roll_for_agent(
         advantage = False
         disadvantage = False
 
-    def roll_d20() -> int:
-        return random.randint(1, 20)
-
-    r1 = roll_d20()
+    r1 = _randint(1, 20)
     base_roll = r1
 
     if advantage:
-        r2 = roll_d20()
+        r2 = _randint(1, 20)
         base_roll = max(r1, r2)
     elif disadvantage:
-        r2 = roll_d20()
+        r2 = _randint(1, 20)
         base_roll = min(r1, r2)
 
     grace_mod = int(round((agent.fate.grace - 0.5) * 4.0))
@@ -426,7 +552,7 @@ def destiny_roll_for_agent(
         "dc": dc,
         "success": success,
         "roll_type": "advantage" if advantage else "disadvantage" if disadvantage else "normal",
-        "fate_snapshot": asdict(agent.fate),
+        "fate_snapshot": agent.fate.to_dict(),
     }
 
 
@@ -451,9 +577,32 @@ def destiny_roll_for_pair(
 
 
 def world_to_dict(world: WorldState) -> Dict[str, Any]:
-    """Snapshot all agents into a JSON-serializable dict."""
+    """
+    Snapshot all agents into a JSON-serializable dict.
+
+    Trust/fate sub-dicts are cached on the world between snapshots and only
+    re-serialized for pairs touched since the last call; callers get fresh
+    copies, so mutating the result never leaks into the cache.
+    """
+    trust_cache = world._trust_dicts
+    fate_cache = world._fate_dicts
+    dirty = world._dirty
+    dirty_agents = {name for name, _ in dirty}
+
     agents_out: Dict[str, Any] = {}
     for name, rt in world.agents.items():
+        fate_d = fate_cache.get(name)
+        if fate_d is None or name in dirty_agents:
+            fate_d = fate_cache[name] = rt.fate.to_dict()
+
+        trust_out: Dict[str, Any] = {}
+        for target, ts in rt.trust.items():
+            key = (name, target)
+            ts_d = trust_cache.get(key)
+            if ts_d is None or key in dirty:
+                ts_d = trust_cache[key] = ts.to_dict()
+            trust_out[target] = dict(ts_d)
+
         agents_out[name] = {
             "name": name,
             "alignment": {
@@ -469,12 +618,13 @@ def world_to_dict(world: WorldState) -> Dict[str, Any]:
                 "job_tags": rt.config.klass.job_tags,
             },
             "tags": rt.config.tags,
-            "fate": asdict(rt.fate),
-            "trust": {target: asdict(ts) for target, ts in rt.trust.items()},
+            "fate": dict(fate_d),
+            "trust": trust_out,
             "current_emotion": rt.current_emotion,
             "awe_level": rt.awe_level,
             "boredom_level": rt.boredom_level,
         }
+    dirty.clear()
     return {
         "agents": agents_out,
     }
@@ -525,7 +675,7 @@ def build_world_state() -> Dict[str, Any]:
 
     out = {
         "world_final": world_to_dict(world),
-        "history": world.history,
+        "history": list(world.history),
         "destiny": destiny,
     }
     return out
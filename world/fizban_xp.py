@@ -10,12 +10,15 @@ XP engine for Fizban-World:
 """
 
 from __future__ import annotations
+from bisect import bisect_right
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-import json
 import math
 from pathlib import Path
 
+from fizban_json import load_json_path
+
 BASE_DIR = Path(__file__).resolve().parent
 MONSTER_FILE = BASE_DIR / "monsters" / "core_bestary.json"
 
@@ -34,9 +37,13 @@ XP_BY_CR: Dict[float, int] = {
     # ... you can extend this up to CR 30 if desired
 }
 
+@lru_cache(maxsize=1)
 def load_monsters() -> Dict[str, dict]:
-    with MONSTER_FILE.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    Parse the bestiary once per process; later calls reuse the same dict.
+    Callers must treat the result as read-only.
+    """
+    return load_json_path(MONSTER_FILE)
 
 
 def base_xp_for_monster(mon: dict) -> int:
@@ -70,6 +77,10 @@ def multi_monster_modifier(n: int) -> float:
     return 2.0
 
 
+# level_gap_factor for whole-number gaps -4..+3 (index = gap + 4)
+_GAP_FACTORS: Tuple[float, ...] = (0.1, 0.25, 0.5, 0.75, 1.0, 1.0, 1.0, 1.25)
+
+
 def level_gap_factor(agent_level: int, challenge_level: float) -> float:
     """
     Diminishing (or increasing) returns based on how hard the content is
@@ -87,26 +98,23 @@ def level_gap_factor(agent_level: int, challenge_level: float) -> float:
     gap = challenge_level - agent_level
     if gap <= -4:
         return 0.1
-    if gap == -3:
-        return 0.25
-    if gap == -2:
-        return 0.5
-    if gap == -1:
-        return 0.75
-    if -0.999 <= gap <= 2:
-        return 1.0
-    if gap == 3:
-        return 1.25
+    if gap < 4:
+        whole = int(gap)
+        if whole == gap:
+            return _GAP_FACTORS[whole + 4]
+        # fractional gaps only get the flat band; everything else is 1.5x
+        if -0.999 <= gap <= 2:
+            return 1.0
     return 1.5
 
 
-@dataclass
+@dataclass(slots=True)
 class EncounterMonster:
     key: str
     quantity: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class EncounterContext:
     monsters: List[EncounterMonster]
     party_levels: Dict[str, int]  # agent_name -> level
@@ -114,7 +122,7 @@ class EncounterContext:
     region_level_hint: Optional[float] = None  # average CR / level for the area
 
 
-@dataclass
+@dataclass(slots=True)
 class XPResultPerAgent:
     agent: str
     level: int
@@ -123,15 +131,26 @@ class XPResultPerAgent:
     details: Dict[str, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class EncounterXPResult:
     total_base_xp: int
     total_effective_xp: int
     per_agent: List[XPResultPerAgent]
 
 
+# monster key -> (base XP, CR); filled from the bestiary the first time a key
+# shows up in an encounter, so repeat encounters skip the per-monster lookups.
+_XP_CR_BY_KEY: Dict[str, Tuple[int, float]] = {}
+
+
 def compute_encounter_xp(ctx: EncounterContext) -> EncounterXPResult:
-    monsters_data = load_monsters()
+    xp_cr = _XP_CR_BY_KEY
+    missing = [m.key for m in ctx.monsters if m.key not in xp_cr]
+    if missing:
+        monsters_data = load_monsters()
+        for key in missing:
+            mon = monsters_data[key]
+            xp_cr[key] = (base_xp_for_monster(mon), float(mon["cr"]))
 
     # 1) Raw XP + approximate "challenge level" for the encounter
     total_base_xp = 0
@@ -139,11 +158,11 @@ def compute_encounter_xp(ctx: EncounterContext) -> EncounterXPResult:
     total_count = 0
 
     for m in ctx.monsters:
-        mon = monsters_data[m.key]
-        mxp = base_xp_for_monster(mon)
-        total_base_xp += mxp * m.quantity
-        total_cr_weighted += float(mon["cr"]) * m.quantity
-        total_count += m.quantity
+        mxp, cr = xp_cr[m.key]
+        qty = m.quantity
+        total_base_xp += mxp * qty
+        total_cr_weighted += cr * qty
+        total_count += qty
 
     avg_cr = total_cr_weighted / max(total_count, 1)
     multi_mod = multi_monster_modifier(total_count)
@@ -183,6 +202,19 @@ def compute_encounter_xp(ctx: EncounterContext) -> EncounterXPResult:
 
 # --- Social / quest XP hooks -----------------------------------------------
 
+_SOCIAL_BASE_XP: Dict[str, int] = {
+    "good_deed": 15,
+    "evil_deed": 15,
+    "relationship_milestone": 50,
+    "betrayal": 40,
+    "forgiveness": 40,
+    "big_reveal": 75,
+}
+
+
+# Pure function of a handful of small discrete inputs; bulk XP awards hit
+# the same few combinations over and over.
+@lru_cache(maxsize=2048)
 def social_xp_for_event(
     level: int,
     kind: str,
@@ -196,21 +228,18 @@ def social_xp_for_event(
 
     intensity ~ 0.0-2.0 (rough scale).
     """
-    base_by_kind = {
-        "good_deed": 15,
-        "evil_deed": 15,
-        "relationship_milestone": 50,
-        "betrayal": 40,
-        "forgiveness": 40,
-        "big_reveal": 75,
-    }
-    base = base_by_kind.get(kind, 10)
+    base = _SOCIAL_BASE_XP.get(kind, 10)
     # mild level scaling: early levels feel bigger, later levels need more
     level_factor = 1.0 + 0.02 * max(level - 1, 0)
     xp = int(round(base * intensity * level_factor * world_scalar))
     return xp
 
 
+# |affinity delta| bands: < 0.05 -> 0 (ignored), < 0.2 -> 10, < 0.5 -> 25, else 50
+_REL_MAGNITUDE_EDGES: Tuple[float, ...] = (0.05, 0.2, 0.5)
+_REL_BASE_XP: Tuple[int, ...] = (0, 10, 25, 50)
+
+
 def relationship_xp_from_trust_delta(
     level: int,
     affinity_before: float,
@@ -224,19 +253,13 @@ def relationship_xp_from_trust_delta(
     - also reward meaningful *negative* shifts as story fuel
     """
     delta = affinity_after - affinity_before
-    magnitude = abs(delta)
-    base = 0
+    band = bisect_right(_REL_MAGNITUDE_EDGES, abs(delta))
 
-    if magnitude < 0.05:
+    if band == 0:
         return 0  # too small to care
 
     # big swings in either direction generate story XP
-    if magnitude < 0.2:
-        base = 10
-    elif magnitude < 0.5:
-        base = 25
-    else:
-        base = 50
+    base = _REL_BASE_XP[band]
 
     # betrayal bump if desired
     if betrayal_delta > 0:
@@ -8,6 +8,7 @@ Paladin (lvl 5) & Puck (lvl 4) vs 3 goblins + 1 wolf in a forest region.
 
 from __future__ import annotations
 import json
+from dataclasses import asdict
 
 from fizban_xp import (
     EncounterMonster,
@@ -55,7 +56,7 @@ def main() -> None:
         "encounter": {
             "total_base_xp": combat_result.total_base_xp,
             "total_effective_xp": combat_result.total_effective_xp,
-            "per_agent": [vars(p) for p in combat_result.per_agent],
+            "per_agent": [asdict(p) for p in combat_result.per_agent],
         },
         "paladin_social_xp_example": {
             "good_deed_xp": paladin_social_xp,